@@ -0,0 +1,144 @@
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from urllib.parse import urlencode, urlparse
+
+# Search words of the default mix (common, rare, inflected)
+WORDS = ["perendia", "zoti", "te", "dhe", "njeriu", "dashuri", "toka", "mbreti", "jezusi", "izraelit"]
+
+
+def request_paths(seed: int, count: int, search_share: float = 0.7):
+    # Same mix for every server: paged word searches and chapter reads
+    r = random.Random(seed)
+    for _ in range(count):
+        if r.random() < search_share:
+            qs = {"q": r.choice(WORDS), "page": r.randint(1, 5), "limit": 50}
+            yield "/search?" + urlencode(qs)
+        else:
+            yield "/chapter?" + urlencode({"book_id": r.randint(1, 66), "chap": 1})
+
+
+async def read_response(reader: asyncio.StreamReader) -> int:
+    # Read one HTTP/1.1 response (Content-Length or chunked); returns the status code
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split()[1])
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        while True:
+            size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+            await reader.readexactly(size + 2)
+            if size == 0:
+                break
+    elif status not in (204, 304):
+        await reader.readexactly(int(headers.get("content-length", "0")))
+    return status
+
+
+async def user(host: str, port: int, paths, pipeline: int, latencies, errors) -> None:
+    # One keep-alive connection; `pipeline` requests are written before their responses are read
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        paths = list(paths)
+        for i in range(0, len(paths), pipeline):
+            batch = paths[i:i + pipeline]
+            t = time.perf_counter()
+            writer.write(b"".join(f"GET {p} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode() for p in batch))
+            await writer.drain()
+            for _ in batch:
+                if await read_response(reader) != 200:
+                    errors.append(1)
+                latencies.append(time.perf_counter() - t)
+    except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+        errors.append(1)
+    finally:
+        writer.close()
+
+
+async def run_load(url: str, users: int, per_user: int, pipeline: int, idle: int, search_share: float = 0.7):
+    parsed = urlparse(url)
+    host, port = parsed.hostname or "127.0.0.1", parsed.port or 80
+    # Idle keep-alive connections that never send a request, like slow or parked browsers
+    parked = []
+    for _ in range(idle):
+        parked.append(await asyncio.open_connection(host, port))
+    latencies, errors = [], []
+    t0 = time.perf_counter()
+    await asyncio.gather(*(user(host, port, request_paths(i, per_user, search_share), pipeline, latencies, errors) for i in range(users)))
+    elapsed = time.perf_counter() - t0
+    for _, w in parked:
+        w.close()
+    return elapsed, sorted(latencies), len(errors)
+
+
+def report(label: str, elapsed: float, lat, errors: int) -> None:
+    def q(p):
+        return lat[min(len(lat) - 1, int(p * len(lat)))] * 1000 if lat else 0.0
+    print(f"{label}: {len(lat)} req in {elapsed:.2f}s = {len(lat) / elapsed:.0f} req/s; "
+          f"p50 {q(.5):.1f} ms p95 {q(.95):.1f} ms p99 {q(.99):.1f} ms; errors {errors}")
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(db: str, extra) -> tuple:
+    # Launch web_ui.py on a free port and wait until it accepts connections
+    port = free_port()
+    here = os.path.dirname(os.path.abspath(__file__))
+    cmd = [sys.executable, os.path.join(here, "web_ui.py"), "--db", db, "--port", str(port)] + list(extra)
+    proc = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return proc, f"http://127.0.0.1:{port}"
+        except OSError:
+            if proc.poll() is not None:
+                raise SystemExit(f"web_ui.py exited with {proc.returncode}: {' '.join(cmd)}")
+            time.sleep(0.1)
+    proc.kill()
+    raise SystemExit("web_ui.py did not start within 30s")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Load generator for the web UI (threaded vs --async)")
+    ap.add_argument("--url", help="Benchmark a running server instead of starting both modes")
+    ap.add_argument("--db", default="alb_concordance.sqlite", help="DB for the servers started by the benchmark")
+    ap.add_argument("--users", type=int, default=50, help="Concurrent keep-alive connections (default 50)")
+    ap.add_argument("--requests", type=int, default=40, help="Requests per connection (default 40)")
+    ap.add_argument("--pipeline", type=int, default=1, help="Requests written per round trip (default 1)")
+    ap.add_argument("--search-share", type=float, default=0.7, help="Fraction of requests that are searches; the rest read chapters (default 0.7)")
+    ap.add_argument("--idle", type=int, default=0, help="Extra connections held open without sending anything")
+    ap.add_argument("--server-args", default="--cache-entries 0", help="Extra web_ui.py flags for both modes (default disables the result cache)")
+    args = ap.parse_args()
+
+    load = dict(users=args.users, per_user=args.requests, pipeline=max(1, args.pipeline), idle=args.idle,
+                search_share=args.search_share)
+    if args.url:
+        report(args.url, *asyncio.run(run_load(args.url, **load)))
+        return
+    if not os.path.exists(args.db):
+        raise SystemExit(f"Database not found: {args.db}. Build it first with: python scripts/build_concordance.py build")
+    for label, mode in (("threaded", []), ("async", ["--async"])):
+        proc, url = start_server(args.db, args.server_args.split() + mode)
+        try:
+            asyncio.run(run_load(url, users=2, per_user=5, pipeline=1, idle=0))  # warm the page cache
+            report(label, *asyncio.run(run_load(url, **load)))
+        finally:
+            proc.terminate()
+            proc.wait()
+
+
+if __name__ == "__main__":
+    main()
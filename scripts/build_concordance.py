@@ -1,8 +1,19 @@
 import argparse
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+import hashlib
+import heapq
+from itertools import islice
 import os
 import re
 import sqlite3
-from typing import Dict, Iterable, List, Tuple
+import struct
+import sys
+import time
+import uuid
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 import unicodedata
 import csv
 import json
@@ -130,10 +141,12 @@ def tokenize(clean_text: str) -> List[str]:
     return re.findall(r"[A-Za-zËÇëç]+", clean_text)
 
 
-def parse_sql_dump(sql_path: str) -> Tuple[List[str], List[Tuple[int, int, int, str]]]:
-    books: List[str] = []
-    verses: List[Tuple[int, int, int, str]] = []  # (book_id, chapter, verse, text)
+def iter_sql_dump(sql_path: str) -> Iterator[Tuple[str, object]]:
+    """Stream the SQL dump line by line.
 
+    Yields ("book", albanian_name) and ("verse", (book_id, chapter, verse, text))
+    in file order, with verse text already unescaped and cleaned.
+    """
     with open(sql_path, "r", encoding="utf-8", errors="replace") as f:
         for raw_line in f:
             line = raw_line.strip()
@@ -143,7 +156,7 @@ def parse_sql_dump(sql_path: str) -> Tuple[List[str], List[Tuple[int, int, int,
             m_book = SQL_LINE_BOOK.match(line)
             if m_book:
                 en = m_book.group(1)
-                books.append(ENG_TO_ALB.get(en, en))
+                yield "book", ENG_TO_ALB.get(en, en)
                 continue
 
             m_verse = SQL_LINE_VERSE.match(line)
@@ -155,13 +168,96 @@ def parse_sql_dump(sql_path: str) -> Tuple[List[str], List[Tuple[int, int, int,
                 text = unescape_sql_string(text_sql)
                 text = fix_encoding_artifacts(text)
                 text = unicodedata.normalize("NFC", text)
-                verses.append((book_id, chapter, verse_no, text))
+                yield "verse", (book_id, chapter, verse_no, text)
                 continue
 
-    return books, verses
 
-
-def init_db(db_path: str) -> sqlite3.Connection:
+SCHEMA_TABLES = """
+CREATE TABLE books (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE verses (
+    id INTEGER PRIMARY KEY,
+    book_id INTEGER NOT NULL,
+    chapter INTEGER NOT NULL,
+    verse INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    FOREIGN KEY(book_id) REFERENCES books(id)
+);
+
+CREATE TABLE lexicon (
+    term_id INTEGER PRIMARY KEY,
+    normalized TEXT NOT NULL UNIQUE,
+    forms TEXT NOT NULL,  -- distinct surface forms, space-separated
+    freq INTEGER NOT NULL,
+    lemma_id INTEGER,  -- filled in by build_lemmas()
+    FOREIGN KEY(lemma_id) REFERENCES lemmas(lemma_id)
+);
+
+CREATE TABLE tokens (
+    id INTEGER PRIMARY KEY,
+    verse_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    term_id INTEGER NOT NULL,
+    FOREIGN KEY(verse_id) REFERENCES verses(id),
+    FOREIGN KEY(term_id) REFERENCES lexicon(term_id)
+);
+
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,  -- build_id, built_at
+    value TEXT NOT NULL
+);
+
+CREATE TABLE postings (
+    term_id INTEGER PRIMARY KEY,
+    df INTEGER NOT NULL,  -- number of distinct verses
+    verses BLOB NOT NULL,  -- sorted verse ids, delta + varint encoded
+    skips BLOB NOT NULL,  -- (byte offset, previous id) every POSTING_BLOCK entries, little-endian uint32 pairs
+    FOREIGN KEY(term_id) REFERENCES lexicon(term_id)
+);
+"""
+
+SCHEMA_LEMMAS = """
+CREATE TABLE IF NOT EXISTS lemmas (
+    lemma_id INTEGER PRIMARY KEY,
+    lemma TEXT NOT NULL UNIQUE,  -- stem key shared by the inflected forms
+    label TEXT NOT NULL,  -- most frequent form, for display
+    freq INTEGER NOT NULL  -- summed frequency of all forms
+);
+
+CREATE TABLE IF NOT EXISTS lemma_postings (
+    lemma_id INTEGER PRIMARY KEY,
+    df INTEGER NOT NULL,
+    verses BLOB NOT NULL,  -- same encoding as postings.verses
+    skips BLOB NOT NULL,
+    FOREIGN KEY(lemma_id) REFERENCES lemmas(lemma_id)
+);
+"""
+
+SCHEMA_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_verses_bcv ON verses(book_id, chapter, verse);
+CREATE INDEX IF NOT EXISTS idx_tokens_term ON tokens(term_id);
+CREATE INDEX IF NOT EXISTS idx_tokens_verse ON tokens(verse_id);
+CREATE INDEX IF NOT EXISTS idx_lexicon_lemma ON lexicon(lemma_id);
+"""
+
+
+@contextmanager
+def timed_phase(name: str):
+    # Print how long a build phase took
+    started = time.perf_counter()
+    yield
+    print(f"  [{name}] {time.perf_counter() - started:.2f}s")
+
+
+def init_db(db_path: str, defer_indexes: bool = False) -> sqlite3.Connection:
+    """Create a fresh database.
+
+    With `defer_indexes` the tables are created bare for bulk loading and the
+    caller is expected to run create_indexes() once the rows are in.
+    """
     if os.path.exists(db_path):
         os.remove(db_path)
     conn = sqlite3.connect(db_path)
@@ -177,39 +273,45 @@ def init_db(db_path: str) -> sqlite3.Connection:
         """
     )
     # Schema
-    conn.executescript(
-        """
-        CREATE TABLE books (
-            id INTEGER PRIMARY KEY,
-            name TEXT NOT NULL UNIQUE
-        );
+    conn.executescript(SCHEMA_TABLES)
+    conn.executescript(SCHEMA_LEMMAS)
+    if not defer_indexes:
+        create_indexes(conn)
+    # Re-enable FKs after schema creation
+    conn.execute("PRAGMA foreign_keys=ON;")
+    return conn
 
-        CREATE TABLE verses (
-            id INTEGER PRIMARY KEY,
-            book_id INTEGER NOT NULL,
-            chapter INTEGER NOT NULL,
-            verse INTEGER NOT NULL,
-            text TEXT NOT NULL,
-            FOREIGN KEY(book_id) REFERENCES books(id)
-        );
 
-        CREATE TABLE tokens (
-            id INTEGER PRIMARY KEY,
-            verse_id INTEGER NOT NULL,
-            position INTEGER NOT NULL,
-            token TEXT NOT NULL,
-            normalized TEXT NOT NULL,
-            FOREIGN KEY(verse_id) REFERENCES verses(id)
-        );
+def create_indexes(conn: sqlite3.Connection) -> None:
+    # Build all secondary indexes in one go (each index is sorted once instead of maintained per insert)
+    conn.executescript(SCHEMA_INDEXES)
 
-        CREATE INDEX idx_verses_bcv ON verses(book_id, chapter, verse);
-        CREATE INDEX idx_tokens_norm ON tokens(normalized);
-        CREATE INDEX idx_tokens_verse ON tokens(verse_id);
-        """
+
+def stamp_build(conn: sqlite3.Connection) -> str:
+    """Record a fresh build id and timestamp; call after anything that changes query results.
+
+    The web UI derives its ETags and Last-Modified headers from these.
+    """
+    conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+    build_id = uuid.uuid4().hex
+    conn.executemany(
+        "INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)",
+        [("build_id", build_id), ("built_at", str(int(time.time())))],
     )
-    # Re-enable FKs after schema creation
-    conn.execute("PRAGMA foreign_keys=ON;")
-    return conn
+    return build_id
+
+
+def finalize_db(conn: sqlite3.Connection, analyze: bool = False, optimize: bool = False, vacuum: bool = False) -> None:
+    # Optional post-load maintenance; must run outside a transaction
+    if analyze:
+        with timed_phase("analyze"):
+            conn.execute("ANALYZE")
+    if optimize:
+        with timed_phase("optimize"):
+            conn.execute("PRAGMA optimize")
+    if vacuum:
+        with timed_phase("vacuum"):
+            conn.execute("VACUUM")
 
 
 def ensure_strongs_schema(conn: sqlite3.Connection) -> None:
@@ -221,52 +323,779 @@ def ensure_strongs_schema(conn: sqlite3.Connection) -> None:
             code TEXT NOT NULL,  -- e.g., H07225, G3056
             FOREIGN KEY(verse_id) REFERENCES verses(id)
         );
-        CREATE INDEX IF NOT EXISTS idx_strongs_code ON strongs(code);
+        -- (code, verse_id) answers code lookups and keyset pages (verse_id > ?) from the index alone
+        DROP INDEX IF EXISTS idx_strongs_code;
+        CREATE INDEX IF NOT EXISTS idx_strongs_code_verse ON strongs(code, verse_id);
         CREATE INDEX IF NOT EXISTS idx_strongs_verse ON strongs(verse_id);
         CREATE UNIQUE INDEX IF NOT EXISTS uniq_strongs_verse_code ON strongs(verse_id, code);
+        CREATE TABLE IF NOT EXISTS strongs_files (
+            path TEXT PRIMARY KEY,  -- relative to the site dir, '/'-separated
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            sha1 TEXT NOT NULL,
+            book_id INTEGER,  -- chapter the file covers; NULL if it could not be mapped
+            chapter INTEGER
+        );
+        CREATE INDEX IF NOT EXISTS idx_strongs_files_chapter ON strongs_files(book_id, chapter);
         """
     )
 
 
-def insert_books(conn: sqlite3.Connection, books: List[str]) -> None:
-    conn.executemany("INSERT INTO books(id, name) VALUES (?, ?)", [(i + 1, name) for i, name in enumerate(books)])
+def ensure_lemma_schema(conn: sqlite3.Connection) -> None:
+    # Add the lemma tables (and lexicon.lemma_id) to a database built before they existed
+    cols = {r[1] for r in conn.execute("PRAGMA table_info(lexicon)")}
+    if "lemma_id" not in cols:
+        conn.execute("ALTER TABLE lexicon ADD COLUMN lemma_id INTEGER REFERENCES lemmas(lemma_id)")
+    conn.executescript(SCHEMA_LEMMAS)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_lexicon_lemma ON lexicon(lemma_id)")
 
 
-def insert_verses(conn: sqlite3.Connection, verses: List[Tuple[int, int, int, str]]) -> None:
-    conn.executemany(
-        "INSERT INTO verses(book_id, chapter, verse, text) VALUES (?, ?, ?, ?)",
-        [(b, c, v, t) for (b, c, v, t) in verses],
-    )
+def peak_rss_mb() -> Optional[float]:
+    # Peak resident set size of this process; None where `resource` is unavailable (Windows)
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def tokenize_shard(shard: List[Tuple[int, str]]) -> List[Tuple[int, int, str, str]]:
+    # Tokenize a run of (verse_id, text) into token rows; top-level so worker processes can pickle it
+    rows: List[Tuple[int, int, str, str]] = []  # (verse_id, position, token, normalized)
+    for verse_id, text in shard:
+        for pos, tok in enumerate(tokenize(text), start=1):
+            rows.append((verse_id, pos, tok, normalize_token(tok)))
+    return rows
 
 
-def build_tokens(conn: sqlite3.Connection) -> int:
-    cur = conn.execute("SELECT id, text FROM verses ORDER BY id")
-    to_insert: List[Tuple[int, int, str, str]] = []  # (verse_id, position, token, normalized)
-    for verse_id, vtext in cur.fetchall():
-        toks = tokenize(vtext)
-        for pos, tok in enumerate(toks, start=1):
-            to_insert.append((verse_id, pos, tok, normalize_token(tok)))
-    conn.executemany(
-        "INSERT INTO tokens(verse_id, position, token, normalized) VALUES (?, ?, ?, ?)",
-        to_insert,
+class LexiconBuilder:
+    """In-memory term dictionary filled while tokens stream in.
+
+    Assigns integer term ids in first-seen order and tracks each term's
+    frequency and distinct surface forms for the `lexicon` table.
+    """
+
+    def __init__(self) -> None:
+        self.ids: Dict[str, int] = {}
+        self.freq: List[int] = []
+        self.forms: List[set] = []
+        self.new_terms: List[Tuple[int, str]] = []
+
+    def add(self, normalized: str, surface: str) -> int:
+        term_id = self.ids.get(normalized)
+        if term_id is None:
+            term_id = len(self.freq) + 1
+            self.ids[normalized] = term_id
+            self.freq.append(0)
+            self.forms.append(set())
+            self.new_terms.append((term_id, normalized))
+        self.freq[term_id - 1] += 1
+        self.forms[term_id - 1].add(surface)
+        return term_id
+
+    def flush_new(self, conn: sqlite3.Connection) -> None:
+        # Insert terms first seen since the last flush so token rows can reference them
+        if self.new_terms:
+            conn.executemany("INSERT INTO lexicon(term_id, normalized, forms, freq) VALUES (?, ?, '', 0)", self.new_terms)
+            self.new_terms = []
+
+    def write_stats(self, conn: sqlite3.Connection) -> None:
+        conn.executemany(
+            "UPDATE lexicon SET forms = ?, freq = ? WHERE term_id = ?",
+            ((" ".join(sorted(forms)), freq, term_id) for term_id, (forms, freq) in enumerate(zip(self.forms, self.freq), start=1)),
+        )
+
+
+def ingest_dump(conn: sqlite3.Connection, sql_path: str, batch_size: int = 2000, workers: int = 0) -> Tuple[int, int, int]:
+    """Parse, clean, insert and tokenize the dump in a single streaming pass.
+
+    Verses are numbered in dump order and flushed every `batch_size` verses,
+    so memory stays bounded by the batch size. With `workers` > 1 each batch
+    is tokenized in a process pool; results are written back in submission
+    order, so token ids and positions match a serial build.
+    Returns (books, verses, tokens) counts.
+    """
+    book_count = verse_count = token_count = 0
+    lexicon = LexiconBuilder()
+    verse_batch: List[Tuple[int, int, int, int, str]] = []  # (id, book_id, chapter, verse, text)
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    pending: Deque[Future] = deque()
+
+    def write_tokens(rows: List[Tuple[int, int, str, str]]) -> None:
+        nonlocal token_count
+        # Term ids are assigned here, in verse order, so they do not depend on worker scheduling
+        add = lexicon.add
+        rows = [(vid, pos, add(norm, tok)) for (vid, pos, tok, norm) in rows]
+        lexicon.flush_new(conn)
+        conn.executemany("INSERT INTO tokens(verse_id, position, term_id) VALUES (?, ?, ?)", rows)
+        token_count += len(rows)
+
+    def flush() -> None:
+        nonlocal verse_batch
+        if not verse_batch:
+            return
+        conn.executemany("INSERT INTO verses(id, book_id, chapter, verse, text) VALUES (?, ?, ?, ?, ?)", verse_batch)
+        shard = [(vid, text) for (vid, _, _, _, text) in verse_batch]
+        verse_batch = []
+        if pool is None:
+            write_tokens(tokenize_shard(shard))
+            return
+        pending.append(pool.submit(tokenize_shard, shard))
+        # Bound the number of in-flight shards so memory stays flat
+        while len(pending) > workers * 2:
+            write_tokens(pending.popleft().result())
+
+    try:
+        for kind, item in iter_sql_dump(sql_path):
+            if kind == "book":
+                book_count += 1
+                conn.execute("INSERT INTO books(id, name) VALUES (?, ?)", (book_count, item))
+                continue
+            verse_count += 1
+            book_id, chapter, verse_no, text = item
+            verse_batch.append((verse_count, book_id, chapter, verse_no, text))
+            if len(verse_batch) >= batch_size:
+                flush()
+        flush()
+        while pending:
+            write_tokens(pending.popleft().result())
+        lexicon.write_stats(conn)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+    return book_count, verse_count, token_count
+
+
+# ---------- Posting lists (term -> sorted distinct verse ids) ----------
+
+POSTING_BLOCK = 128
+
+
+def encode_postings(ids: List[int]) -> Tuple[bytes, bytes]:
+    """Delta + varint encode sorted verse ids.
+
+    Returns (blob, skips) where skips records, for every POSTING_BLOCK-th
+    entry, the byte offset into blob and the id preceding it, so a page can
+    be decoded without walking the whole list.
+    """
+    out = bytearray()
+    skips: List[int] = []
+    prev = 0
+    for i, vid in enumerate(ids):
+        if i % POSTING_BLOCK == 0:
+            skips.extend((len(out), prev))
+        delta = vid - prev
+        prev = vid
+        while delta >= 0x80:
+            out.append((delta & 0x7F) | 0x80)
+            delta >>= 7
+        out.append(delta)
+    return bytes(out), struct.pack(f"<{len(skips)}I", *skips)
+
+
+def decode_postings(blob: bytes, skips: Optional[bytes] = None, start: int = 0, stop: Optional[int] = None) -> List[int]:
+    # Decode ids[start:stop]; with skips only the blocks covering the slice are read
+    pos = prev = index = 0
+    if skips and start >= POSTING_BLOCK:
+        block = min(start // POSTING_BLOCK, len(skips) // 8 - 1)
+        pos, prev = struct.unpack_from("<II", skips, block * 8)
+        index = block * POSTING_BLOCK
+    out: List[int] = []
+    n = len(blob)
+    while pos < n and (stop is None or index < stop):
+        delta = shift = 0
+        while True:
+            b = blob[pos]
+            pos += 1
+            delta |= (b & 0x7F) << shift
+            if b < 0x80:
+                break
+            shift += 7
+        prev += delta
+        if index >= start:
+            out.append(prev)
+        index += 1
+    return out
+
+
+def decode_postings_before(blob: bytes, skips: Optional[bytes], before: int, limit: int) -> List[int]:
+    # The last `limit` ids < before (ascending); skips let decoding start just ahead of them
+    pos = prev = 0
+    if skips:
+        # first block whose preceding id is >= before: it and everything after it is excluded
+        lo, hi = 0, len(skips) // 8
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if struct.unpack_from("<I", skips, mid * 8 + 4)[0] >= before:
+                hi = mid
+            else:
+                lo = mid + 1
+        block = max(0, lo - 1 - (limit + POSTING_BLOCK - 1) // POSTING_BLOCK)
+        pos, prev = struct.unpack_from("<II", skips, block * 8)
+    out: List[int] = []
+    n = len(blob)
+    while pos < n:
+        delta = shift = 0
+        while True:
+            b = blob[pos]
+            pos += 1
+            delta |= (b & 0x7F) << shift
+            if b < 0x80:
+                break
+            shift += 7
+        prev += delta
+        if prev >= before:
+            break
+        out.append(prev)
+    return out[-limit:] if limit > 0 else []
+
+
+def build_postings(conn: sqlite3.Connection) -> int:
+    """Materialize one posting list per term from the tokens table.
+
+    Tokens are stored in verse order, so walking idx_tokens_term in
+    (term_id, id) order yields each term's verse ids already sorted.
+    Returns the number of posting lists written.
+    """
+    conn.execute("DELETE FROM postings")
+    cur = conn.execute("SELECT term_id, verse_id FROM tokens ORDER BY term_id, id")
+    batch: List[Tuple[int, int, bytes, bytes]] = []
+    written = 0
+    last_term: Optional[int] = None
+    ids: List[int] = []
+
+    def emit() -> None:
+        if last_term is None:
+            return
+        blob, skips = encode_postings(ids)
+        batch.append((last_term, len(ids), blob, skips))
+
+    for term_id, vid in cur:
+        if term_id != last_term:
+            emit()
+            last_term, ids = term_id, []
+            if len(batch) >= 5000:
+                conn.executemany("INSERT INTO postings(term_id, df, verses, skips) VALUES (?, ?, ?, ?)", batch)
+                written += len(batch)
+                batch = []
+        if not ids or ids[-1] != vid:
+            ids.append(vid)
+    emit()
+    conn.executemany("INSERT INTO postings(term_id, df, verses, skips) VALUES (?, ?, ?, ?)", batch)
+    return written + len(batch)
+
+
+def load_postings(conn: sqlite3.Connection, term_id: int) -> Optional[Tuple[int, bytes, bytes]]:
+    # (df, blob, skips) for a term, or None if it has no posting list
+    row = conn.execute("SELECT df, verses, skips FROM postings WHERE term_id = ?", (term_id,)).fetchone()
+    return (int(row[0]), row[1], row[2]) if row else None
+
+
+def iter_verses_by_id(conn: sqlite3.Connection, ids: List[int], chunk: int = 500, with_id: bool = False) -> Iterator[tuple]:
+    # Yield (book, book_id, chapter, verse, text) for verse ids in the given order; with_id prepends the id
+    for i in range(0, len(ids), chunk):
+        part = ids[i:i + chunk]
+        marks = ",".join("?" * len(part))
+        rows = conn.execute(
+            f"""
+            SELECT v.id, b.name, v.book_id, v.chapter, v.verse, v.text
+            FROM verses v
+            JOIN books b ON b.id = v.book_id
+            WHERE v.id IN ({marks})
+            """,
+            part,
+        ).fetchall()
+        by_id = {r[0]: r if with_id else r[1:] for r in rows}
+        for vid in part:
+            if vid in by_id:
+                yield by_id[vid]
+
+
+# ---------- Term dictionary (prefix / suffix / wildcard expansion) ----------
+
+def is_wildcard_query(q: str) -> bool:
+    # A single word containing * or ? (e.g. perend*, *ise, per?ndi)
+    q = (q or "").strip()
+    return bool(q) and any(ch in q for ch in "*?") and not any(ch in q for ch in ' "()')
+
+
+class TermDictionary:
+    """Sorted term array over the lexicon, held in memory for wildcard lookups.
+
+    The lexicon's UNIQUE index on `normalized` is the persisted sorted
+    dictionary; load() reads it in order and also keeps a reversed-term
+    array so leading-wildcard patterns (*ise) are a range scan too.
+    """
+
+    def __init__(self, terms: List[Tuple[str, int]]) -> None:
+        self.terms = [t for t, _ in terms]
+        self.ids = [i for _, i in terms]
+        rev = sorted((t[::-1], i) for t, i in terms)
+        self.rterms = [t for t, _ in rev]
+        self.rids = [i for _, i in rev]
+
+    @classmethod
+    def load(cls, conn: sqlite3.Connection) -> "TermDictionary":
+        return cls(conn.execute("SELECT normalized, term_id FROM lexicon ORDER BY normalized").fetchall())
+
+    @staticmethod
+    def _range(keys: List[str], prefix: str) -> Tuple[int, int]:
+        lo = bisect_left(keys, prefix)
+        return lo, bisect_left(keys, prefix + "\uffff", lo)
+
+    def expand(self, pattern: str) -> List[Tuple[str, int]]:
+        """Return (term, term_id) pairs matching a * / ? pattern, in term order."""
+        pat = normalize_token(fix_encoding_artifacts(pattern))
+        cut = [i for i, ch in enumerate(pat) if ch in "*?"]
+        head = pat[:cut[0]] if cut else pat
+        tail = pat[cut[-1] + 1:] if cut else ""
+        if head or not tail:
+            lo, hi = self._range(self.terms, head)
+            cands = list(zip(self.terms[lo:hi], self.ids[lo:hi]))
+        else:
+            lo, hi = self._range(self.rterms, tail[::-1])
+            cands = sorted((t[::-1], i) for t, i in zip(self.rterms[lo:hi], self.rids[lo:hi]))
+        if pat == head + "*":
+            return cands
+        rx = re.compile("".join(".*" if ch == "*" else "." if ch == "?" else re.escape(ch) for ch in pat) + r"\Z")
+        return [(t, i) for t, i in cands if rx.match(t)]
+
+
+def union_postings(conn: sqlite3.Connection, term_ids: List[int]) -> List[int]:
+    # Sorted union of the posting lists of several terms
+    ids: set = set()
+    for i in range(0, len(term_ids), 500):
+        part = term_ids[i:i + 500]
+        marks = ",".join("?" * len(part))
+        for blob, skips in conn.execute(f"SELECT verses, skips FROM postings WHERE term_id IN ({marks})", part):
+            ids.update(decode_postings(blob, skips))
+    return sorted(ids)
+
+
+def wildcard_ids(conn: sqlite3.Connection, pattern: str, tdict: Optional[TermDictionary] = None
+                 ) -> Tuple[List[int], List[str]]:
+    """(sorted verse ids, matched terms) of a wildcard pattern.
+
+    The union of every expanded term's postings; it never holds more ids
+    than there are verses, so callers that page through it (the web UI)
+    keep the list and slice it instead of merging again per page.
+    """
+    matches = (tdict or TermDictionary.load(conn)).expand(pattern)
+    return union_postings(conn, [i for _, i in matches]), [t for t, _ in matches]
+
+
+def search_wildcard(conn: sqlite3.Connection, pattern: str, limit: int = 50, offset: int = 0,
+                    tdict: Optional[TermDictionary] = None) -> Tuple[int, List[Tuple[str, int, int, int, str]], List[str]]:
+    """Expand a wildcard pattern and return (total verses, page rows, matched terms)."""
+    ids, terms = wildcard_ids(conn, pattern, tdict)
+    return len(ids), list(iter_verses_by_id(conn, ids[offset:offset + limit])), terms
+
+
+# ---------- Lemmas (inflection-aware search) ----------
+
+# Noun and adjective endings of normalized (ë→e, ç→c) words, longest first
+LEMMA_SUFFIXES = tuple(sorted(
+    {
+        "iut", "iun", "ise", "ine", "ite", "ive", "eve", "ave", "ies",
+        "iu", "it", "in", "ut", "un", "et", "en", "es", "at", "te", "ne", "se", "ve", "ia", "ja", "ra",
+        "i", "u", "a", "e",
+    },
+    key=lambda s: (-len(s), s),
+))
+# Verb endings; only stripped when the remaining stem is an attested word
+LEMMA_VERB_SUFFIXES = ("onte", "ojne", "uar", "oni", "oje", "ua", "oi", "on")
+# Verb forms are grouped under stem + this citation ending (dashuron, dashuroi, dashuruar -> dashuroj),
+# not under the stem itself, which is often a noun or adjective of its own (zot / zotuar, dashur / dashuron)
+LEMMA_VERB_KEY = "oj"
+_LEMMA_ALL_SUFFIXES = tuple(sorted(LEMMA_SUFFIXES + LEMMA_VERB_SUFFIXES, key=lambda s: (-len(s), s)))
+LEMMA_MIN_STEM = 3
+
+# Irregular forms the suffix rules cannot reach: normalized form -> base word
+LEMMA_OVERRIDES: Dict[str, str] = {
+    # jam (to be)
+    "je": "jam", "eshte": "jam", "jemi": "jam", "jeni": "jam", "jane": "jam",
+    "isha": "jam", "ishe": "jam", "ishte": "jam", "ishim": "jam", "ishit": "jam", "ishin": "jam",
+    # kam (to have)
+    "ka": "kam", "kemi": "kam", "keni": "kam", "kane": "kam",
+    "kisha": "kam", "kishe": "kam", "kishte": "kam", "kishim": "kam", "kishit": "kam", "kishin": "kam",
+    # plurals with a changed stem
+    "bij": "bir", "bijt": "bir", "bijte": "bir", "bijve": "bir",
+    "qiej": "qiell", "qiejt": "qiell", "qiejte": "qiell", "qiejve": "qiell",
+    "njerez": "njeri", "njerezit": "njeri", "njerezve": "njeri",
+    "vellezer": "vella", "vellezerit": "vella", "vellezerve": "vella",
+    "gra": "grua", "grate": "grua", "grave": "grua",
+    "duar": "dore", "duart": "dore", "duarve": "dore",
+    "net": "nate", "netet": "nate", "neteve": "nate",
+    # nouns whose stem is another word's: dashuri (love) is not dashur (beloved)
+    "dashuri": "dashuri", "dashuria": "dashuri", "dashurine": "dashuri", "dashurise": "dashuri",
+    "dashurite": "dashuri", "dashurive": "dashuri",
+}
+
+
+def load_lemma_overrides(path: Optional[str]) -> Dict[str, str]:
+    # Built-in overrides, extended by an optional TSV of `form<TAB>base` lines (# starts a comment)
+    overrides = dict(LEMMA_OVERRIDES)
+    if not path:
+        return overrides
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            parts = line.split("\t")
+            if len(parts) != 2:
+                raise SystemExit(f"Bad override line in {path}: {line!r} (expected form<TAB>base)")
+            form, base = (normalize_token(fix_encoding_artifacts(x.strip())) for x in parts)
+            overrides[form] = base
+    return overrides
+
+
+def _lemma_stems(term: str, verbs: bool = True) -> Iterator[Tuple[str, str]]:
+    # Candidate (stem, lemma key) pairs of a term, longest suffix first; verb endings key on stem + LEMMA_VERB_KEY
+    for suffix in _LEMMA_ALL_SUFFIXES if verbs else LEMMA_SUFFIXES:
+        if term.endswith(suffix) and len(term) - len(suffix) >= LEMMA_MIN_STEM:
+            stem = term[:-len(suffix)]
+            yield stem, stem + LEMMA_VERB_KEY if suffix in LEMMA_VERB_SUFFIXES else stem
+
+
+def lemmatize_terms(terms: Iterable[str], overrides: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """Map each normalized term to a lemma key.
+
+    A suffix is only stripped when what remains is itself a word of the
+    vocabulary (zotit -> zot, perendise -> perendi), which keeps names like
+    Ruben intact; verb forms then group under the stem's -oj form, apart
+    from the noun (zotuar -> zotoj). Leftover terms that no other form
+    points at are stripped by their longest noun ending and join a base
+    sharing that stem (fjalet -> fjale). Overrides win over both; a form
+    overridden to itself becomes a lemma of its own.
+    """
+    vocab = set(terms)
+    keys = {t: next((k for s, k in _lemma_stems(t) if s in vocab), t) for t in vocab}
+    bases = sorted({key for t, key in keys.items() if key != t})
+    by_stem: Dict[str, str] = {}
+    for base in bases:
+        stem = next((s for s, _ in _lemma_stems(base, verbs=False)), None)
+        if stem is not None:
+            by_stem.setdefault(stem, base)
+    anchored = set(bases)
+    for t, key in keys.items():
+        if key == t and t not in anchored:
+            stem = next((s for s, _ in _lemma_stems(t, verbs=False)), None)
+            if stem is not None:
+                keys[t] = by_stem.get(stem, stem)
+    overrides = overrides if overrides is not None else LEMMA_OVERRIDES
+    for form, base in overrides.items():
+        if form == base and form in keys:
+            keys[form] = form
+    for form, base in overrides.items():
+        if form != base and form in keys:
+            keys[form] = keys.get(base, base)
+    return keys
+
+
+def build_lemmas(conn: sqlite3.Connection, overrides: Optional[Dict[str, str]] = None) -> int:
+    """Group lexicon terms into lemmas and write one posting list per lemma.
+
+    Sets lexicon.lemma_id, labels each lemma with its most frequent form and
+    unions the members' posting lists. Returns the number of lemmas.
+    """
+    terms = conn.execute("SELECT term_id, normalized, freq FROM lexicon").fetchall()
+    keys = lemmatize_terms((t for _, t, _ in terms), overrides)
+    groups: Dict[str, List[Tuple[int, str, int]]] = {}
+    for term_id, norm, freq in terms:
+        groups.setdefault(keys[norm], []).append((term_id, norm, freq))
+    postings = {r[0]: r[1:] for r in conn.execute("SELECT term_id, df, verses, skips FROM postings")}
+
+    conn.execute("UPDATE lexicon SET lemma_id = NULL")
+    conn.execute("DELETE FROM lemma_postings")
+    conn.execute("DELETE FROM lemmas")
+    lemma_rows, member_rows, posting_rows = [], [], []
+    for lemma_id, key in enumerate(sorted(groups), 1):
+        members = groups[key]
+        label = max(members, key=lambda m: (m[2], -len(m[1])))[1]
+        lemma_rows.append((lemma_id, key, label, sum(m[2] for m in members)))
+        member_rows.extend((lemma_id, m[0]) for m in members)
+        lists = [postings[m[0]] for m in members if m[0] in postings]
+        if len(lists) == 1:
+            posting_rows.append((lemma_id,) + tuple(lists[0]))
+        elif lists:
+            ids = sorted({vid for _, blob, skips in lists for vid in decode_postings(blob, skips)})
+            posting_rows.append((lemma_id, len(ids)) + encode_postings(ids))
+    conn.executemany("INSERT INTO lemmas(lemma_id, lemma, label, freq) VALUES (?, ?, ?, ?)", lemma_rows)
+    conn.executemany("UPDATE lexicon SET lemma_id = ? WHERE term_id = ?", member_rows)
+    conn.executemany("INSERT INTO lemma_postings(lemma_id, df, verses, skips) VALUES (?, ?, ?, ?)", posting_rows)
+    return len(lemma_rows)
+
+
+def has_lemmas(conn: sqlite3.Connection) -> bool:
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'lemma_postings'").fetchone() is not None
+
+
+def lookup_lemma(conn: sqlite3.Connection, word: str) -> Optional[Tuple[int, str]]:
+    """Resolve a word to (lemma_id, label).
+
+    Known words go through their lexicon entry; an unseen inflection is
+    matched by its candidate stems against the lexicon and lemma keys.
+    """
+    norm = normalize_token(fix_encoding_artifacts(word))
+    for cand in [norm] + [key for _, key in _lemma_stems(norm)]:
+        row = conn.execute(
+            """
+            SELECT m.lemma_id, m.label FROM lexicon l JOIN lemmas m ON m.lemma_id = l.lemma_id
+            WHERE l.normalized = ?
+            """,
+            (cand,),
+        ).fetchone() or conn.execute("SELECT lemma_id, label FROM lemmas WHERE lemma = ?", (cand,)).fetchone()
+        if row:
+            return int(row[0]), row[1]
+    return None
+
+
+def lemma_forms(conn: sqlite3.Connection, lemma_id: int) -> List[str]:
+    # Normalized forms grouped under a lemma, most frequent first
+    return [r[0] for r in conn.execute(
+        "SELECT normalized FROM lexicon WHERE lemma_id = ? ORDER BY freq DESC, normalized", (lemma_id,))]
+
+
+def search_by_lemma(conn: sqlite3.Connection, word: str, limit: int = 50, offset: int = 0
+                    ) -> Tuple[int, List[Tuple[str, int, int, int, str]], List[str]]:
+    """All verses containing any inflection of `word`: (total verses, page rows, forms)."""
+    found = lookup_lemma(conn, word)
+    if found is None:
+        return 0, [], []
+    lemma_id = found[0]
+    row = conn.execute("SELECT df, verses, skips FROM lemma_postings WHERE lemma_id = ?", (lemma_id,)).fetchone()
+    if not row:
+        return 0, [], []
+    ids = decode_postings(row[1], row[2], offset, offset + limit)
+    return int(row[0]), list(iter_verses_by_id(conn, ids)), lemma_forms(conn, lemma_id)
+
+
+# ---------- FTS5 full-text index (phrases, NEAR, prefix, boolean) ----------
+
+# unicode61 with remove_diacritics folds case and ë/ç like normalize_token; digits split tokens as in tokenize()
+FTS_TOKENIZER = "unicode61 remove_diacritics 2 separators '0123456789'"
+
+_RE_NEAR_SLASH = re.compile(r'("[^"]*"|[^\s"()]+)\s+NEAR/(\d+)\s+("[^"]*"|[^\s"()]+)')
+_RE_FTS_PART = re.compile(r'"[^"]*"\*?|NEAR\(|[()]|,\s*\d+\s*(?=\))|\b(?:AND|OR|NOT)\b|[^\s"(),]+')
+
+
+def build_fts(conn: sqlite3.Connection) -> None:
+    # External-content FTS5 index over verses.text (rowid = verse id)
+    conn.executescript(
+        f"""
+        DROP TABLE IF EXISTS verses_fts;
+        CREATE VIRTUAL TABLE verses_fts USING fts5(
+            text, content='verses', content_rowid='id',
+            tokenize="{FTS_TOKENIZER}", prefix='2 3'
+        );
+        INSERT INTO verses_fts(verses_fts) VALUES('rebuild');
+        """
     )
-    return len(to_insert)
+
+
+def has_fts(conn: sqlite3.Connection) -> bool:
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'verses_fts'").fetchone() is not None
+
+
+def has_strongs(conn: sqlite3.Connection) -> bool:
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'strongs'").fetchone() is not None
+
+
+def is_fts_query(q: str) -> bool:
+    # Anything beyond a single plain word (phrase, prefix, operators, several words) goes to FTS5
+    q = (q or "").strip()
+    if is_wildcard_query(q):
+        return False
+    return bool(q) and (len(tokenize(fix_encoding_artifacts(q))) > 1 or any(ch in q for ch in '"*()'))
+
+
+class FtsSyntaxError(sqlite3.OperationalError):
+    """A query to_fts_query() cannot turn into valid FTS5 syntax.
+
+    Subclasses the error SQLite raises for a malformed MATCH, so callers
+    that already handle that one report this too.
+    """
+
+
+_FTS_OPERATORS = ("AND", "OR", "NOT")
+
+
+def _fts_group(items: List[str]) -> str:
+    # One parenthesis level: drop operators missing an operand, keep the last of a run, AND adjacent operands
+    out: List[str] = []
+    for item in items:
+        if item in _FTS_OPERATORS:
+            if not out:
+                if item == "NOT":
+                    raise FtsSyntaxError("NOT needs a word before it, e.g. zoti NOT toka")
+                continue
+            if out[-1] in _FTS_OPERATORS:
+                out[-1] = item
+            else:
+                out.append(item)
+            continue
+        if out and out[-1] not in _FTS_OPERATORS:
+            out.append("AND")  # FTS5 has no implicit AND next to a (group)
+        out.append(item)
+    if out and out[-1] in _FTS_OPERATORS:
+        out.pop()
+    return " ".join(out)
+
+
+def to_fts_query(q: str) -> str:
+    """Translate a user query into FTS5 MATCH syntax.
+
+    Supports "quoted phrases", prefix* terms, AND/OR/NOT, (groups),
+    NEAR(a b, N) and the shorthand `a NEAR/N b`. Words are cleaned like the
+    importer does and re-quoted so punctuation can never break the FTS5
+    grammar. Loose input is repaired rather than rejected: an AND/OR/NOT
+    with nothing on one side is dropped, a run of operators keeps its last
+    one, groups get an explicit AND to their neighbours, and unbalanced
+    parentheses are closed or dropped. A query starting with NOT, or one
+    with no words left after the repair (`AND`, `()`), has no FTS5 form
+    and raises FtsSyntaxError.
+    """
+    q = _RE_NEAR_SLASH.sub(lambda m: f"NEAR({m.group(1)} {m.group(3)}, {m.group(2)})", q or "")
+    groups: List[List[str]] = [[]]
+    near: Optional[List[str]] = None  # phrases (and ",N") of an open NEAR( group
+
+    def close_near() -> None:
+        phrases = [p for p in near if not p.startswith(",")]
+        if phrases:
+            groups[-1].append("NEAR(" + " ".join(phrases) + "".join(p for p in near if p.startswith(",")) + ")")
+
+    for part in _RE_FTS_PART.findall(q):
+        if part.startswith(","):
+            if near is not None:
+                near.append(part.replace(" ", ""))
+            continue
+        if part == ")":
+            if near is not None:
+                close_near()
+                near = None
+            elif len(groups) > 1:
+                inner = _fts_group(groups.pop())
+                if inner:
+                    groups[-1].append(f"({inner})")
+            continue  # an unmatched ")" is dropped
+        if part == "(" or part == "NEAR(" or part in _FTS_OPERATORS:
+            if near is not None:
+                continue  # NEAR() takes phrases only
+            if part == "NEAR(":
+                near = []
+            elif part == "(":
+                groups.append([])
+            else:
+                groups[-1].append(part)
+            continue
+        prefix = part.endswith("*")
+        words = tokenize(fix_encoding_artifacts(part.strip('"*')))
+        if not words:
+            continue
+        phrase = '"' + " ".join(normalize_token(w) for w in words) + '"' + ("*" if prefix else "")
+        (near if near is not None else groups[-1]).append(phrase)
+    if near is not None:
+        close_near()
+    while len(groups) > 1:  # close what the user left open
+        inner = _fts_group(groups.pop())
+        if inner:
+            groups[-1].append(f"({inner})")
+    expr = _fts_group(groups[0])
+    if not expr:
+        raise FtsSyntaxError("query has no words")
+    return expr
+
+
+def fts_query_error(q: str) -> Optional[str]:
+    # Why `q` cannot run as a full-text query, or None
+    try:
+        to_fts_query(q)
+        return None
+    except FtsSyntaxError as e:
+        return str(e)
+
+
+def count_fts(conn: sqlite3.Connection, q: str) -> int:
+    return conn.execute("SELECT COUNT(*) FROM verses_fts WHERE verses_fts MATCH ?", (to_fts_query(q),)).fetchone()[0]
+
+
+def search_fts(conn: sqlite3.Connection, q: str, limit: int = 50, offset: int = 0, rank: bool = False,
+               highlight: bool = False, after: int = 0, before: int = 0) -> List[Tuple[str, int, int, int, str]]:
+    """Full-text search; rows are (book, book_id, chapter, verse, text).
+
+    Results are in canonical verse order unless `rank` asks for bm25
+    relevance. With `highlight` the text comes back with <mark> tags.
+    `after` / `before` (verse ids, canonical order only) select the page
+    following or preceding a keyset cursor instead of using `offset`.
+    """
+    text_col = "highlight(verses_fts, 0, '<mark>', '</mark>')" if highlight else "v.text"
+    order = "f.rank" if rank else "f.rowid DESC" if before else "f.rowid"
+    rows = conn.execute(
+        f"""
+        SELECT b.name, v.book_id, v.chapter, v.verse, {text_col}
+        FROM verses_fts f
+        JOIN verses v ON v.id = f.rowid
+        JOIN books b ON b.id = v.book_id
+        WHERE verses_fts MATCH ? AND f.rowid > ? AND f.rowid < ?
+        ORDER BY {order}
+        LIMIT ? OFFSET ?
+        """,
+        (to_fts_query(q), after, before or 1 << 62, limit, offset),
+    ).fetchall()
+    return rows[::-1] if before and not rank else rows
 
 
 def cmd_build(args: argparse.Namespace) -> None:
     sql_path = args.sql
     db_path = args.db
-    print(f"Parsing SQL from {sql_path} ...")
-    books, verses = parse_sql_dump(sql_path)
-    print(f"Found {len(books)} books and {len(verses)} verses.")
-
-    print(f"Initializing database at {db_path} ...")
-    conn = init_db(db_path)
-    with conn:
-        insert_books(conn, books)
-        insert_verses(conn, verses)
-        token_count = build_tokens(conn)
+    bulk = not args.no_bulk_load
+    started = time.perf_counter()
+    rss = peak_rss_mb()
+    if rss is not None:
+        print(f"Peak RSS before build: {rss:.1f} MB")
+
+    print(f"Initializing database at {db_path} ({'bulk-load, deferred indexes' if bulk else 'indexed inserts'}) ...")
+    with timed_phase("schema"):
+        conn = init_db(db_path, defer_indexes=bulk)
+    workers = args.workers or 0
+    mode = f"{workers} tokenizer processes" if workers > 1 else "serial tokenizer"
+    print(f"Streaming SQL from {sql_path} (batches of {args.batch_size} verses, {mode}) ...")
+    with timed_phase("load"):
+        with conn:
+            books, verses, token_count = ingest_dump(conn, sql_path, batch_size=args.batch_size, workers=workers)
+    print(f"Found {books} books and {verses} verses.")
     print(f"Inserted tokens: {token_count}")
+    if bulk:
+        with timed_phase("indexes"):
+            with conn:
+                create_indexes(conn)
+    with timed_phase("postings"):
+        with conn:
+            posting_count = build_postings(conn)
+    print(f"Posting lists: {posting_count}")
+    overrides = load_lemma_overrides(args.lemma_overrides)
+    with timed_phase("lemmas"):
+        with conn:
+            lemma_count = build_lemmas(conn, overrides)
+    print(f"Lemmas: {lemma_count}")
+    if not args.no_fts:
+        with timed_phase("fts"):
+            with conn:
+                build_fts(conn)
+    with conn:
+        stamp_build(conn)
+    finalize_db(conn, analyze=args.analyze, optimize=args.optimize, vacuum=args.vacuum)
+    conn.close()
+
+    elapsed = time.perf_counter() - started
+    rss = peak_rss_mb()
+    if rss is not None:
+        print(f"Build time: {elapsed:.2f}s, peak RSS: {rss:.1f} MB")
+    else:
+        print(f"Build time: {elapsed:.2f}s")
     print("Done.")
 
 
@@ -301,11 +1130,11 @@ def iter_chapter_json(site_dir: str):
     data_root = os.path.join(site_dir, 'data')
     if not os.path.isdir(data_root):
         return
-    for sub in os.listdir(data_root):
+    for sub in sorted(os.listdir(data_root)):
         subdir = os.path.join(data_root, sub)
         if not os.path.isdir(subdir):
             continue
-        for fname in os.listdir(subdir):
+        for fname in sorted(os.listdir(subdir)):
             if not fname.endswith('.json'):
                 continue
             path = os.path.join(subdir, fname)
@@ -316,58 +1145,143 @@ def iter_chapter_json(site_dir: str):
             yield path
 
 
-def build_strongs_index(conn: sqlite3.Connection, site_dir: str) -> int:
+def parse_chapter_json(data: bytes, book_name_to_id: Dict[str, int]) -> Optional[Tuple[int, int, List[Tuple[int, str]]]]:
+    # (book_id, chapter, [(verse, code)]) from one interlinear chapter file, or None if it cannot be mapped
+    try:
+        obj = json.loads(data)
+    except Exception:
+        return None
+    if not isinstance(obj, dict):
+        return None
+    ref = obj.get('ref') or {}
+    book_sq = (ref.get('book_sq') or '').strip()
+    chapter = int(ref.get('chapter') or 0)
+    if not book_sq or not chapter:
+        return None
+    bid = book_name_to_id.get(book_sq) or book_name_to_id.get(_norm_name(book_sq))
+    if not bid:
+        # fallback: try partials
+        bid = book_name_to_id.get(_norm_name(book_sq).split(' ')[0] or '')
+    if not bid:
+        return None
+    codes: List[Tuple[int, str]] = []
+    for v in obj.get('verses') or []:
+        vnum = int(v.get('v') or 0)
+        if not vnum:
+            continue
+        for tok in (v.get('src') or []):
+            code = (tok.get('s') or '').strip().upper()
+            if code and _RE_STRONGS.match(code):
+                codes.append((vnum, code))
+    return bid, chapter, codes
+
+
+def load_chapter_file(path: str, book_name_to_id: Dict[str, int]) -> Tuple[str, Optional[Tuple[int, int, List[Tuple[int, str]]]]]:
+    # Read, hash and parse one chapter file; top-level so worker processes can pickle it
+    with open(path, 'rb') as f:
+        data = f.read()
+    return hashlib.sha1(data).hexdigest(), parse_chapter_json(data, book_name_to_id)
+
+
+def build_strongs_index(conn: sqlite3.Connection, site_dir: str, full: bool = False, workers: int = 0) -> Tuple[int, int, int, int]:
+    """Index Strong's codes from the chapter JSON files, reprocessing only what changed.
+
+    strongs_files remembers each file's size, mtime, SHA-1 and the chapter it
+    covers. Files whose size and mtime match are skipped without being read;
+    a changed stat with the same hash only refreshes the manifest. Chapters
+    touched by a changed or removed file lose their rows and are re-indexed
+    from every file that covers them. `full` forgets the manifest first.
+
+    With `workers` > 1 files are read and parsed in a process pool while this
+    connection stays the only writer; verse ids come from one preloaded
+    (book, chapter, verse) map instead of a query per verse.
+    Returns (rows inserted, files indexed, files skipped, files removed).
+    """
     ensure_strongs_schema(conn)
+    if full:
+        conn.execute("DELETE FROM strongs")
+        conn.execute("DELETE FROM strongs_files")
     book_name_to_id = load_book_name_to_id(conn)
-    cur = conn.cursor()
-    inserted = 0
-    batch: List[Tuple[int, str]] = []
-
-    def flush():
-        nonlocal batch, inserted
-        if not batch:
+    manifest = {r[0]: r[1:] for r in conn.execute("SELECT path, size, mtime_ns, sha1, book_id, chapter FROM strongs_files")}
+    parsed: Dict[str, Optional[Tuple[int, int, List[Tuple[int, str]]]]] = {}
+    dirty = set()
+    seen = set()
+    skipped = 0
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    pending: Deque[Tuple[str, os.stat_result, Future]] = deque()
+
+    def settle(rel: str, st: os.stat_result, digest: str, chap: Optional[Tuple[int, int, List[Tuple[int, str]]]]) -> None:
+        nonlocal skipped
+        old = manifest.get(rel)
+        if old and old[2] == digest:
+            conn.execute("UPDATE strongs_files SET size = ?, mtime_ns = ? WHERE path = ?", (st.st_size, st.st_mtime_ns, rel))
+            skipped += 1
             return
-        cur.executemany("INSERT OR IGNORE INTO strongs(verse_id, code) VALUES (?, ?)", batch)
-        inserted += len(batch)
-        batch = []
+        if old and old[3]:
+            dirty.add((old[3], old[4]))
+        if chap:
+            dirty.add(chap[:2])
+        conn.execute(
+            "INSERT OR REPLACE INTO strongs_files(path, size, mtime_ns, sha1, book_id, chapter) VALUES (?, ?, ?, ?, ?, ?)",
+            (rel, st.st_size, st.st_mtime_ns, digest, chap[0] if chap else None, chap[1] if chap else None),
+        )
+        parsed[rel] = chap
 
-    for path in iter_chapter_json(site_dir):
-        try:
-            with open(path, 'r', encoding='utf-8') as f:
-                obj = json.load(f)
-        except Exception:
-            continue
-        ref = obj.get('ref') or {}
-        book_sq = (ref.get('book_sq') or '').strip()
-        chapter = int(ref.get('chapter') or 0)
-        if not book_sq or not chapter:
-            continue
-        bid = book_name_to_id.get(book_sq) or book_name_to_id.get(_norm_name(book_sq))
-        if not bid:
-            # fallback: try partials
-            bid = book_name_to_id.get(_norm_name(book_sq).split(' ')[0] or '')
-        if not bid:
-            continue
-        verses = obj.get('verses') or []
-        for v in verses:
-            vnum = int(v.get('v') or 0)
-            if not vnum:
+    try:
+        for path in iter_chapter_json(site_dir):
+            rel = os.path.relpath(path, site_dir).replace(os.sep, '/')
+            seen.add(rel)
+            st = os.stat(path)
+            old = manifest.get(rel)
+            if old and old[0] == st.st_size and old[1] == st.st_mtime_ns:
+                skipped += 1
                 continue
-            # lookup verse_id
-            row = cur.execute("SELECT id FROM verses WHERE book_id=? AND chapter=? AND verse=?", (bid, chapter, vnum)).fetchone()
-            if not row:
+            if pool is None:
+                settle(rel, st, *load_chapter_file(path, book_name_to_id))
                 continue
-            vid = int(row[0])
-            for tok in (v.get('src') or []):
-                code = (tok.get('s') or '').strip().upper()
-                if not code or not _RE_STRONGS.match(code):
-                    continue
-                batch.append((vid, code))
-            if len(batch) >= 5000:
-                flush()
-    flush()
+            pending.append((rel, st, pool.submit(load_chapter_file, path, book_name_to_id)))
+            # Bound the number of in-flight files so memory stays flat
+            while len(pending) > workers * 2:
+                rel, st, fut = pending.popleft()
+                settle(rel, st, *fut.result())
+        while pending:
+            rel, st, fut = pending.popleft()
+            settle(rel, st, *fut.result())
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    removed = [rel for rel in manifest if rel not in seen]
+    for rel in removed:
+        old = manifest[rel]
+        if old[3]:
+            dirty.add((old[3], old[4]))
+        conn.execute("DELETE FROM strongs_files WHERE path = ?", (rel,))
+
+    cur = conn.cursor()
+    for bid, chapter in sorted(dirty):
+        # Another, unchanged file may cover the same chapter; its rows go too, so re-read it
+        for (rel,) in conn.execute("SELECT path FROM strongs_files WHERE book_id = ? AND chapter = ?", (bid, chapter)).fetchall():
+            if rel not in parsed:
+                parsed[rel] = load_chapter_file(os.path.join(site_dir, rel), book_name_to_id)[1]
+        cur.execute("DELETE FROM strongs WHERE verse_id IN (SELECT id FROM verses WHERE book_id = ? AND chapter = ?)", (bid, chapter))
+
+    verse_ids: Dict[Tuple[int, int, int], int] = {}
+    if dirty:
+        verse_ids = {(b, c, v): vid for vid, b, c, v in conn.execute("SELECT id, book_id, chapter, verse FROM verses")}
+    rows = set()
+    for chap in parsed.values():
+        if not chap:
+            continue
+        bid, chapter, codes = chap
+        for vnum, code in codes:
+            vid = verse_ids.get((bid, chapter, vnum))
+            if vid is not None:
+                rows.add((vid, code))
+    # Deduplicated and in (verse_id, code) order, the inserts append to the indexes instead of seeking
+    cur.executemany("INSERT OR IGNORE INTO strongs(verse_id, code) VALUES (?, ?)", sorted(rows))
     conn.commit()
-    return inserted
+    return len(rows), sum(1 for chap in parsed.values() if chap), skipped, len(removed)
 
 
 def cmd_build_strongs(args: argparse.Namespace) -> None:
@@ -378,29 +1292,55 @@ def cmd_build_strongs(args: argparse.Namespace) -> None:
     if not os.path.isdir(site_dir):
         raise SystemExit(f"Site directory not found: {site_dir}")
     conn = sqlite3.connect(db_path)
+    started = time.perf_counter()
     with conn:
-        ensure_strongs_schema(conn)
-        # Use INSERT OR IGNORE semantics; table can be rebuilt by clearing it
-        created = build_strongs_index(conn, site_dir)
-    print(f"Indexed Strong's occurrences: ~{created} rows (duplicates ignored)")
+        created, indexed, skipped, removed = build_strongs_index(conn, site_dir, full=args.full, workers=args.workers or 0)
+        if indexed or removed:
+            stamp_build(conn)
+    elapsed = max(time.perf_counter() - started, 1e-6)
+    print(f"Indexed Strong's occurrences: {created} rows from {indexed} files")
+    print(f"Unchanged files skipped: {skipped}, removed files: {removed}")
+    print(f"{elapsed:.2f}s: {indexed / elapsed:.0f} files/s, {created / elapsed:.0f} rows/s")
 
 
-def search_lemma(conn: sqlite3.Connection, word: str, limit: int = 50) -> List[Tuple[str, int, int, int, str]]:
+def lookup_term_id(conn: sqlite3.Connection, word: str) -> Optional[int]:
+    # Resolve a search word to its lexicon term id (accent-insensitive)
     norm = normalize_token(fix_encoding_artifacts(word))
-    rows = conn.execute(
-        """
-        SELECT b.name, v.book_id, v.chapter, v.verse, v.text
-        FROM tokens t
-        JOIN verses v ON v.id = t.verse_id
-        JOIN books b ON b.id = v.book_id
-        WHERE t.normalized = ?
-        GROUP BY v.id
-        ORDER BY v.book_id, v.chapter, v.verse
-        LIMIT ?
-        """,
-        (norm, limit),
-    ).fetchall()
-    return rows
+    row = conn.execute("SELECT term_id FROM lexicon WHERE normalized = ?", (norm,)).fetchone()
+    return int(row[0]) if row else None
+
+
+def cmd_build_fts(args: argparse.Namespace) -> None:
+    if not os.path.exists(args.db):
+        raise SystemExit(f"Database not found: {args.db}. Build it first with: python scripts/build_concordance.py build")
+    conn = sqlite3.connect(args.db)
+    with timed_phase("fts"):
+        with conn:
+            build_fts(conn)
+            stamp_build(conn)
+    print("Full-text index ready (verses_fts).")
+
+
+def cmd_build_lemmas(args: argparse.Namespace) -> None:
+    if not os.path.exists(args.db):
+        raise SystemExit(f"Database not found: {args.db}. Build it first with: python scripts/build_concordance.py build")
+    overrides = load_lemma_overrides(args.lemma_overrides)
+    conn = sqlite3.connect(args.db)
+    with timed_phase("lemmas"):
+        with conn:
+            ensure_lemma_schema(conn)
+            lemma_count = build_lemmas(conn, overrides)
+            stamp_build(conn)
+    print(f"Lemmas: {lemma_count}")
+
+
+def search_lemma(conn: sqlite3.Connection, word: str, limit: int = 50) -> List[Tuple[str, int, int, int, str]]:
+    term_id = lookup_term_id(conn, word)
+    postings = load_postings(conn, term_id) if term_id is not None else None
+    if not postings:
+        return []
+    _, blob, skips = postings
+    return list(iter_verses_by_id(conn, decode_postings(blob, skips, 0, limit)))
 
 
 def search_strongs(conn: sqlite3.Connection, code: str, limit: int = 200) -> List[Tuple[str, int, int, int, str]]:
@@ -431,6 +1371,25 @@ def cmd_search(args: argparse.Namespace) -> None:
     # If query looks like a Strong's code (H####/G####), run Strong's search
     if _RE_STRONGS.match((word or '').strip().upper()):
         res = search_strongs(conn, word, limit=limit)
+    elif args.lemma:
+        if not has_lemmas(conn):
+            raise SystemExit("Lemma index missing. Create it with: python scripts/build_concordance.py build-lemmas")
+        total, res, forms = search_by_lemma(conn, word, limit=limit)
+        if forms:
+            shown = ", ".join(forms[:20]) + (" ..." if len(forms) > 20 else "")
+            print(f"'{word}' covers {len(forms)} forms in {total} verses: {shown}")
+    elif is_wildcard_query(word) and not args.fts:
+        total, res, terms = search_wildcard(conn, word, limit=limit)
+        if terms:
+            shown = ", ".join(terms[:20]) + (" ..." if len(terms) > 20 else "")
+            print(f"'{word}' matches {len(terms)} terms in {total} verses: {shown}")
+    elif args.fts or args.rank or is_fts_query(word):
+        if not has_fts(conn):
+            raise SystemExit("Full-text index missing. Create it with: python scripts/build_concordance.py build-fts")
+        try:
+            res = search_fts(conn, word, limit=limit, rank=args.rank)
+        except sqlite3.OperationalError as e:
+            raise SystemExit(f"Invalid search syntax: {e}")
     else:
         res = search_lemma(conn, word, limit=limit)
     if not res:
@@ -442,9 +1401,9 @@ def cmd_search(args: argparse.Namespace) -> None:
         print(f"- {book_name} {chap}:{verse_no} – {safe_text}")
 
 
-def highlight_text(text: str, query: str) -> str:
-    # Highlight tokens matching the normalized query using <mark>
-    norm_q = normalize_token(fix_encoding_artifacts(query))
+def highlight_text(text: str, query: str, terms: Optional[Iterable[str]] = None) -> str:
+    # Highlight tokens matching the normalized query (or any of `terms`) using <mark>
+    wanted = set(terms) if terms is not None else {normalize_token(fix_encoding_artifacts(query))}
     s = text
     out = []
     last = 0
@@ -453,7 +1412,7 @@ def highlight_text(text: str, query: str) -> str:
         tok = m.group(0)
         norm_tok = normalize_token(tok)
         out.append(s[last:start])
-        if norm_tok == norm_q:
+        if norm_tok in wanted:
             out.append(f"<mark>{tok}</mark>")
         else:
             out.append(tok)
@@ -472,15 +1431,184 @@ def sanitize_name(s: str) -> str:
     return re.sub(r"[^A-Za-z0-9_\-]+", "_", s).strip("._") or "export"
 
 
-def export_search(conn: sqlite3.Connection, word: str, fmt: str, out_path: str, limit: int = 1000) -> str:
+# ---------- Streaming search (exports) ----------
+
+def iter_postings(blob: bytes, skips: Optional[bytes] = None, after: int = 0) -> Iterator[int]:
+    """Lazily decode a delta + varint posting list, yielding only ids > `after`.
+
+    With skips the decoder starts at the last block whose preceding id is
+    <= `after` (every earlier id is too), so resuming deep in a long list
+    costs one block rather than the whole prefix.
+    """
+    pos = prev = 0
+    if skips and after:
+        lo, hi = 0, len(skips) // 8 - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if struct.unpack_from("<I", skips, mid * 8 + 4)[0] <= after:
+                lo = mid
+            else:
+                hi = mid - 1
+        pos, prev = struct.unpack_from("<II", skips, lo * 8)
+    n = len(blob)
+    while pos < n:
+        delta = shift = 0
+        while True:
+            b = blob[pos]
+            pos += 1
+            delta |= (b & 0x7F) << shift
+            if b < 0x80:
+                break
+            shift += 7
+        prev += delta
+        if prev > after:
+            yield prev
+
+
+def iter_union_postings(lists: List[Tuple[bytes, bytes]], after: int = 0) -> Iterator[int]:
+    # k-way merge of sorted (blob, skips) posting lists, duplicates dropped
+    if len(lists) == 1:
+        yield from iter_postings(lists[0][0], lists[0][1], after)
+        return
+    last = None
+    for vid in heapq.merge(*(iter_postings(blob, skips, after) for blob, skips in lists)):
+        if vid != last:
+            yield vid
+            last = vid
+
+
+def iter_rows_by_ids(conn: sqlite3.Connection, ids: Iterable[int], chunk: int = 500) -> Iterator[Tuple[str, int, int, int, str]]:
+    # iter_verses_by_id over an id stream, fetching `chunk` verses per query
+    batch: List[int] = []
+    for vid in ids:
+        batch.append(vid)
+        if len(batch) >= chunk:
+            yield from iter_verses_by_id(conn, batch, chunk)
+            batch = []
+    yield from iter_verses_by_id(conn, batch, chunk)
+
+
+def search_kind(conn: sqlite3.Connection, word: str, lemma: bool = False) -> str:
+    # Index that answers `word`, with cmd_search's precedence: strongs, lemma, wildcard, fts or word
     if _RE_STRONGS.match((word or '').strip().upper()):
-        rows = search_strongs(conn, word, limit=limit)
+        return "strongs"
+    if lemma and has_lemmas(conn):
+        return "lemma"
+    if is_wildcard_query(word):
+        return "wildcard"
+    if is_fts_query(word) and has_fts(conn):
+        return "fts"
+    return "word"
+
+
+def _search_postings(conn: sqlite3.Connection, word: str, kind: str, tdict: Optional[TermDictionary] = None
+                     ) -> Tuple[List[Tuple[int, bytes, bytes]], Optional[List[str]]]:
+    # (df, blob, skips) lists behind a word / lemma / wildcard query, and its highlight terms
+    if kind == "lemma":
+        found = lookup_lemma(conn, word)
+        row = conn.execute("SELECT df, verses, skips FROM lemma_postings WHERE lemma_id = ?", (found[0],)).fetchone() if found else None
+        return ([tuple(row)] if row else []), (lemma_forms(conn, found[0]) if row else None)
+    if kind == "wildcard":
+        matches = (tdict or TermDictionary.load(conn)).expand(word)
+        term_ids = [i for _, i in matches]
+        lists: List[Tuple[int, bytes, bytes]] = []
+        for i in range(0, len(term_ids), 500):
+            part = term_ids[i:i + 500]
+            lists.extend(conn.execute(f"SELECT df, verses, skips FROM postings WHERE term_id IN ({','.join('?' * len(part))})", part))
+        return lists, [t for t, _ in matches]
+    term_id = lookup_term_id(conn, word)
+    postings = load_postings(conn, term_id) if term_id is not None else None
+    return ([postings] if postings else []), None
+
+
+def search_total(conn: sqlite3.Connection, word: str, lemma: bool = False, tdict: Optional[TermDictionary] = None,
+                 kind: Optional[str] = None) -> Tuple[int, Optional[List[str]]]:
+    """(verses matching `word`, highlight terms or None), resolved like cmd_search unless `kind` is given."""
+    kind = kind or search_kind(conn, word, lemma)
+    if kind == "strongs":
+        return conn.execute("SELECT COUNT(DISTINCT verse_id) FROM strongs WHERE code = ?", (word.strip().upper(),)).fetchone()[0], None
+    if kind == "fts":
+        return count_fts(conn, word), None
+    lists, terms = _search_postings(conn, word, kind, tdict)
+    if len(lists) == 1:
+        return int(lists[0][0]), terms
+    return sum(1 for _ in iter_union_postings([(blob, skips) for _, blob, skips in lists])), terms
+
+
+def iter_search_ids(conn: sqlite3.Connection, word: str, lemma: bool = False, tdict: Optional[TermDictionary] = None,
+                    after: int = 0, kind: Optional[str] = None) -> Iterator[int]:
+    """Verse ids matching `word` that are greater than `after`, ascending.
+
+    Verse ids follow canonical (book, chapter, verse) order, so the last id
+    of a page is a keyset cursor for the next one: Strong's and FTS queries
+    seek with `> after` and posting lists jump to the right block.
+    """
+    kind = kind or search_kind(conn, word, lemma)
+    if kind == "strongs":
+        cur = conn.execute("SELECT DISTINCT verse_id FROM strongs WHERE code = ? AND verse_id > ? ORDER BY verse_id",
+                           (word.strip().upper(), after))
+        return (r[0] for r in cur)
+    if kind == "fts":
+        cur = conn.execute("SELECT rowid FROM verses_fts WHERE verses_fts MATCH ? AND rowid > ? ORDER BY rowid",
+                           (to_fts_query(word), after))
+        return (r[0] for r in cur)
+    lists, _ = _search_postings(conn, word, kind, tdict)
+    return iter_union_postings([(blob, skips) for _, blob, skips in lists], after)
+
+
+def search_ids_before(conn: sqlite3.Connection, word: str, before: int, limit: int, lemma: bool = False,
+                      tdict: Optional[TermDictionary] = None, kind: Optional[str] = None) -> List[int]:
+    # The last `limit` matching verse ids < before, ascending: the page preceding a keyset cursor
+    kind = kind or search_kind(conn, word, lemma)
+    if kind == "strongs":
+        cur = conn.execute("SELECT DISTINCT verse_id FROM strongs WHERE code = ? AND verse_id < ? ORDER BY verse_id DESC LIMIT ?",
+                           (word.strip().upper(), before, limit))
+        return [r[0] for r in cur][::-1]
+    if kind == "fts":
+        cur = conn.execute("SELECT rowid FROM verses_fts WHERE verses_fts MATCH ? AND rowid < ? ORDER BY rowid DESC LIMIT ?",
+                           (to_fts_query(word), before, limit))
+        return [r[0] for r in cur][::-1]
+    ids: set = set()
+    for _, blob, skips in _search_postings(conn, word, kind, tdict)[0]:
+        ids.update(decode_postings_before(blob, skips, before, limit))
+    return sorted(ids)[-limit:] if limit > 0 else []
+
+
+def stream_search(conn: sqlite3.Connection, word: str, limit: Optional[int] = None, lemma: bool = False,
+                  tdict: Optional[TermDictionary] = None
+                  ) -> Tuple[int, Optional[List[str]], Iterator[Tuple[str, int, int, int, str]]]:
+    """Resolve a query the way cmd_search does, for exports.
+
+    Returns (total verses, highlight terms or None, row iterator). Matching
+    ids come lazily from posting lists or a cursor and their verses are
+    fetched 500 at a time, so memory does not grow with the number of
+    results. A wildcard is the exception: its merged id list (at most one
+    int per verse) is built once and gives both the total and the ids. The
+    total is capped at `limit`. Asking for lemmas on a DB without them
+    exits like `search --lemma` does rather than falling back to words.
+    """
+    if lemma and not has_lemmas(conn):
+        raise SystemExit("Lemma index missing. Create it with: python scripts/build_concordance.py build-lemmas")
+    if search_kind(conn, word, lemma) == "wildcard":
+        matched, terms = wildcard_ids(conn, word, tdict)
+        total, ids = len(matched), iter(matched)
     else:
-        rows = search_lemma(conn, word, limit=limit)
+        total, terms = search_total(conn, word, lemma, tdict)
+        ids = iter_search_ids(conn, word, lemma, tdict)
+    if limit is not None and limit >= 0:
+        total = min(total, limit)
+        ids = islice(ids, limit)
+    return total, terms, iter_rows_by_ids(conn, ids)
+
+
+def export_search(conn: sqlite3.Connection, word: str, fmt: str, out_path: str, limit: int = 1000,
+                  lemma: bool = False) -> str:
+    # Rows are written as they stream out of SQLite; nothing is collected in memory
+    total, terms, rows = stream_search(conn, word, limit=limit, lemma=lemma)
     ensure_exports_dir(out_path)
     if fmt == "txt":
         with open(out_path, "w", encoding="utf-8") as f:
-            f.write(f"Results for '{word}' ({len(rows)} verses)\n")
+            f.write(f"Results for '{word}' ({total} verses)\n")
             for book, _, chap, ver, text in rows:
                 f.write(f"- {book} {chap}:{ver} - {text}\n")
     elif fmt == "csv":
@@ -504,13 +1632,12 @@ def export_search(conn: sqlite3.Connection, word: str, fmt: str, out_path: str,
         }
         </style>
         """
-        html = ["<!doctype html><meta charset='utf-8'>", style, f"<h1>Results for “{word}”</h1>"]
-        html.append(f"<div class='meta'>{len(rows)} verses</div>")
-        for book, _, chap, ver, text in rows:
-            h = highlight_text(unicodedata.normalize("NFC", text), word)
-            html.append(f"<div class='result'><strong>{book} {chap}:{ver}</strong> — {h}</div>")
         with open(out_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(html))
+            f.write("\n".join(["<!doctype html><meta charset='utf-8'>", style, f"<h1>Results for “{word}”</h1>"]))
+            f.write(f"\n<div class='meta'>{total} verses</div>")
+            for book, _, chap, ver, text in rows:
+                h = highlight_text(unicodedata.normalize("NFC", text), word, terms)
+                f.write(f"\n<div class='result'><strong>{book} {chap}:{ver}</strong> — {h}</div>")
     return out_path
 
 
@@ -525,7 +1652,7 @@ def cmd_export(args: argparse.Namespace) -> None:
         ext = fmt
         out = os.path.join("exports", f"search_{base}.{ext}")
     conn = sqlite3.connect(db_path)
-    path = export_search(conn, word, fmt, out, limit=limit)
+    path = export_search(conn, word, fmt, out, limit=limit, lemma=args.lemma)
     print(f"Exported {fmt} -> {path}")
 
 
@@ -533,24 +1660,20 @@ def cmd_top(args: argparse.Namespace) -> None:
     db_path = args.db
     limit = args.limit
     conn = sqlite3.connect(db_path)
-    rows = conn.execute(
-        """
-        SELECT normalized, COUNT(*) as cnt
-        FROM tokens
-        GROUP BY normalized
-        HAVING cnt > 1
-        ORDER BY cnt DESC, normalized ASC
-        LIMIT ?
-        """,
-        (limit,),
-    ).fetchall()
+    if args.by == "lemma":
+        if not has_lemmas(conn):
+            raise SystemExit("Lemma index missing. Create it with: python scripts/build_concordance.py build-lemmas")
+        sql = "SELECT label, freq FROM lemmas WHERE freq > 1 ORDER BY freq DESC, label ASC LIMIT ?"
+    else:
+        sql = "SELECT normalized, freq FROM lexicon WHERE freq > 1 ORDER BY freq DESC, normalized ASC LIMIT ?"
+    rows = conn.execute(sql, (limit,)).fetchall()
     for norm, cnt in rows:
         print(f"{norm}\t{cnt}")
 
 
 def build_arg_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(description="Build and query an Albanian Bible concordance (SQLite)")
-    p.add_argument("command", choices=["build", "build-strongs", "search", "top", "export"], help="Action to run")
+    p.add_argument("command", choices=["build", "build-strongs", "build-fts", "build-lemmas", "search", "top", "export"], help="Action to run")
     p.add_argument("word", nargs="?", help="Word to search (for 'search')")
     p.add_argument("--sql", default="Alb.sql.txt", help="Path to source SQL dump (default: Alb.sql.txt)")
     p.add_argument("--db", default="alb_concordance.sqlite", help="Output SQLite DB path (default: alb_concordance.sqlite)")
@@ -558,6 +1681,19 @@ def build_arg_parser() -> argparse.ArgumentParser:
     p.add_argument("--format", choices=["html", "txt", "csv"], default="html", help="Export format (for 'export')")
     p.add_argument("--out", help="Output file path (for 'export')")
     p.add_argument("--site", default="site", help="Path to static site root (for 'build-strongs')")
+    p.add_argument("--batch-size", type=int, default=2000, help="Verses per insert batch while streaming the dump (for 'build')")
+    p.add_argument("--workers", type=int, default=0, help="Tokenize / parse in N worker processes (for 'build' and 'build-strongs'; default: serial)")
+    p.add_argument("--no-bulk-load", action="store_true", help="Create indexes before loading rows instead of after (for 'build')")
+    p.add_argument("--analyze", action="store_true", help="Run ANALYZE after the build (for 'build')")
+    p.add_argument("--optimize", action="store_true", help="Run PRAGMA optimize after the build (for 'build')")
+    p.add_argument("--vacuum", action="store_true", help="VACUUM the database after the build (for 'build')")
+    p.add_argument("--no-fts", action="store_true", help="Skip the FTS5 phrase-search index (for 'build')")
+    p.add_argument("--fts", action="store_true", help="Force full-text (FTS5) search even for a single word (for 'search')")
+    p.add_argument("--rank", action="store_true", help="Sort full-text results by bm25 relevance (for 'search')")
+    p.add_argument("--full", action="store_true", help="Ignore the file manifest and re-index every chapter (for 'build-strongs')")
+    p.add_argument("--lemma", action="store_true", help="Match every inflected form of the word (for 'search'/'export')")
+    p.add_argument("--lemma-overrides", help="TSV of form<TAB>base lemma overrides (for 'build'/'build-lemmas')")
+    p.add_argument("--by", choices=["term", "lemma"], default="term", help="Rank terms or lemmas (for 'top')")
     return p
 
 
@@ -568,6 +1704,10 @@ def main() -> None:
         cmd_build(args)
     elif args.command == "build-strongs":
         cmd_build_strongs(args)
+    elif args.command == "build-fts":
+        cmd_build_fts(args)
+    elif args.command == "build-lemmas":
+        cmd_build_lemmas(args)
     elif args.command == "search":
         if not args.word:
             print("Please provide a word to search.")
@@ -3,10 +3,15 @@ import os
 import sys
 import time
 import unicodedata
+from functools import lru_cache
 
 
 ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+# Site manifest helpers live with the site builder (scripts/ is not a package)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from build_site_index import file_hash, update_site_manifest  # noqa: E402
+
 
 def load_json(path):
     with open(path, 'r', encoding='utf-8') as f:
@@ -19,6 +24,43 @@ def save_json(path, obj):
         json.dump(obj, f, ensure_ascii=False, separators=(',', ':'))
 
 
+def _without_timestamp(obj):
+    meta = {k: v for k, v in (obj.get('_meta') or {}).items() if k != 'generated_at'}
+    return {**obj, '_meta': meta}
+
+
+def save_chapter_json(path, obj):
+    """save_json for an interlinear chapter, unless only _meta.generated_at would change.
+
+    Keeping the old file keeps its content hash in the site manifest, so a
+    rebuild does not make browsers download chapters that did not change.
+    """
+    try:
+        if _without_timestamp(load_json(path)) == _without_timestamp(obj):
+            return False
+    except (OSError, ValueError, AttributeError):
+        pass
+    save_json(path, obj)
+    return True
+
+
+def register_chapters(paths):
+    """List chapter files in the site manifest of the site they are under (<site>/data/<book>/<n>.json).
+
+    Paths outside a site's data folder are skipped.
+    """
+    by_site = {}
+    for path in paths:
+        data_dir = os.path.dirname(os.path.dirname(os.path.abspath(path)))
+        if os.path.basename(data_dir) != 'data':
+            continue
+        site_dir = os.path.dirname(data_dir)
+        rel = os.path.relpath(os.path.abspath(path), site_dir).replace(os.sep, '/')
+        by_site.setdefault(site_dir, {})[rel] = file_hash(site_dir, rel)
+    for site_dir, files in by_site.items():
+        update_site_manifest(site_dir, files)
+
+
 def norm_greek(s: str) -> str:
     if not s:
         return s
@@ -101,6 +143,10 @@ def extract_albanian_by_book_chapter(book_sq: str, chapter: int, verses_path: st
             break
     if not bid:
         raise RuntimeError(f'Could not locate book id for {book_sq}')
+    # Prefer the verse shards build_site writes next to verses.json (data/verses/); older site builds only have verses.json
+    shard_dir = os.path.join(os.path.dirname(verses_path), 'verses')
+    if os.path.isfile(os.path.join(shard_dir, 'manifest.json')):
+        return albanian_chapter_from_shards(shard_dir, bid, chapter)
     data = load_json(verses_path)
     out = {}
     for row in data:
@@ -110,6 +156,24 @@ def extract_albanian_by_book_chapter(book_sq: str, chapter: int, verses_path: st
     return out
 
 
+@lru_cache(maxsize=16)
+def _load_cached_json(path):
+    # Builders ask for one chapter at a time; the manifest and a book's shards are read once
+    return load_json(path)
+
+
+def albanian_chapter_from_shards(shard_dir: str, bid: int, chapter: int):
+    out = {}
+    for entry in _load_cached_json(os.path.join(shard_dir, 'manifest.json'))['shards']:
+        first_chap, last_chap = entry['chapters']
+        if entry['book_id'] != bid or not first_chap <= chapter <= last_chap:
+            continue
+        for row in _load_cached_json(os.path.join(shard_dir, entry['file']))['verses']:
+            if row and row[0] == chapter:
+                out[row[1]] = row[2]
+    return out
+
+
 def main():
     # Optional args: --input <path> --output <path>
     args = sys.argv[1:]
@@ -216,8 +280,11 @@ def main():
         '_meta': meta
     }
 
-    save_json(out_path, final)
-    print(f'Wrote {out_path}')
+    if save_chapter_json(out_path, final):
+        print(f'Wrote {out_path}')
+    else:
+        print(f'Unchanged {out_path}')
+    register_chapters([out_path])
     return 0
 
 
@@ -1,7 +1,6 @@
 import os
 import sys
 import time
-import json
 import xml.etree.ElementTree as ET
 
 ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -18,18 +17,12 @@ except Exception as e:
     sys.exit(1)
 
 try:
-    from build_interlinear import extract_albanian_by_book_chapter, build_strongs_gloss_hebrew  # type: ignore
+    from build_interlinear import extract_albanian_by_book_chapter, build_strongs_gloss_hebrew, save_chapter_json, register_chapters  # type: ignore
 except Exception as e:
     print('Failed to import build_interlinear helpers:', e, file=sys.stderr)
     sys.exit(1)
 
 
-def save_json(path, obj):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(obj, f, ensure_ascii=False, separators=(',', ':'))
-
-
 def list_chapters_for_osis(osis_code: str) -> int:
     """Return max chapter number for this OSIS code based on the XML."""
     path = os.path.join(OSHB_DIR, f'{osis_code}.xml')
@@ -96,7 +89,8 @@ def main():
     verses_path = os.path.join(ROOT, 'site', 'data', 'verses.json')
     books_path = os.path.join(ROOT, 'site', 'data', 'books.json')
 
-    total = 0
+    total = changed = 0
+    written = []
     for osis in books:
         info = BOOK_MAP_OSHB[osis]
         slug = info['slug']
@@ -151,11 +145,14 @@ def main():
                 }
             }
             out_path = os.path.join(ROOT, 'site', 'data', slug, f'{chap}.json')
-            save_json(out_path, final)
+            changed += save_chapter_json(out_path, final)
+            written.append(out_path)
             total += 1
             if total % 50 == 0:
                 print(f'  ... {total} chapters written so far')
-    print(f'Done. Wrote {total} chapter files.')
+    # One site manifest update for the whole run
+    register_chapters(written)
+    print(f'Done. Wrote {total} chapter files ({changed} changed).')
     return 0
 
 
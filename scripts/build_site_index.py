@@ -1,10 +1,18 @@
 import argparse
+import hashlib
 import json
 import os
 import re
 import sqlite3
+import struct
+import sys
 import unicodedata
 from collections import defaultdict
+from itertools import groupby
+
+# Posting lists use the builder's delta+varint codec (scripts/ is not a package)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from build_concordance import encode_postings  # noqa: E402
 
 
 ENG_TO_ALB = {
@@ -83,16 +91,149 @@ STOPWORDS = {
 }
 
 
+# Interlinear chapter folders (data/<slug>/<chapter>.json) by book id - 1, as BOOK_SLUGS_BY_ID in site/app.js
+BOOK_SLUGS = [
+    "genesis", "exodus", "leviticus", "numbers", "deuteronomy", "joshua", "judges", "ruth",
+    "1samuel", "2samuel", "1kings", "2kings", "1chronicles", "2chronicles", "ezra", "nehemiah", "esther", "job",
+    "psalms", "proverbs", "ecclesiastes", "songofsongs", "isaiah", "jeremiah", "lamentations", "ezekiel", "daniel",
+    "hosea", "joel", "amos", "obadiah", "jonah", "micah", "nahum", "habakkuk", "zephaniah", "haggai", "zechariah", "malachi",
+    "matthew", "mark", "luke", "john", "acts", "romans", "1corinthians", "2corinthians", "galatians", "ephesians",
+    "philippians", "colossians", "1thessalonians", "2thessalonians", "1timothy", "2timothy", "titus", "philemon",
+    "hebrews", "james", "1peter", "2peter", "1john", "2john", "3john", "jude", "revelation",
+]
+
+# OSHB morphology of a leading segment that is a prefix (conjunction, preposition, article, interrogative he)
+HEB_PREFIX_MORPH = ("C", "R", "Td", "Ti")
+
+HEB_MARKS = re.compile(r"[\u0591-\u05C7\u05F3\u05F4\u200E\u200F\u202A-\u202E]")
+GRC_MARKS = re.compile(r"[\u0300-\u036f\u200E\u200F\u202A-\u202E]")
+
+# Binary index shard: "ACX1", then term count, term bytes and posting bytes (u32 little-endian)
+INDEX_MAGIC = b"ACX1"
+
+# Content-hashed shard names (<stem>.<hash><ext>) and the site-wide map of data paths to content hashes
+HASH_CHARS = 10
+SITE_MANIFEST = os.path.join("data", "manifest.json")
+INDEX_SHARD_NAME = re.compile(r"^index_\d{3}(\.[0-9a-f]+)?\.(bin|json)$")
+LETTER_SHARD_NAME = re.compile(r"^index_([a-z]|other)\.(bin|json)$")
+VERSE_SHARD_NAME = re.compile(r"^\d{2}-\d{3}(\.[0-9a-f]+)?\.json$")
+
+
 def normalize_token(token: str) -> str:
     token = token.lower()
     token = token.replace("ë", "e").replace("ç", "c")
     return token
 
 
+def hebrew_key(word: str) -> str:
+    # Consonants only, as hebrewConsonantsOnly() in site/app.js (segment slashes kept)
+    return " ".join(HEB_MARKS.sub("", word).split())
+
+
+def greek_key(word: str) -> str:
+    # Diacritics stripped, lower case, one sigma, as grcKey() in site/app.js
+    word = GRC_MARKS.sub("", unicodedata.normalize("NFD", word))
+    return " ".join(word.lower().replace("\u03c2", "\u03c3").split())
+
+
+def source_token_keys(tok, hebrew: bool):
+    """Index keys of one interlinear token: word form, transliteration, lemma and Strong's code.
+
+    Forms and transliterations are keyed whole (segment slashes removed)
+    and, for Hebrew, also without their prefix segments, so a search for
+    a word finds it after ו/ה/ב/ל/כ/מ as hebrewVariants() expects.
+    Hebrew lemmas are Strong's numbers, which the code key already covers.
+    """
+    word, translit = tok.get("w") or "", (tok.get("t") or "").lower()
+    keys = {translit.replace("/", ""), (tok.get("s") or "").strip().upper()}
+    if hebrew:
+        form = hebrew_key(word)
+        keys.add(form.replace("/", ""))
+        segs, codes = form.split("/"), (tok.get("m") or "")[1:].split("/")
+        lead = 0
+        while lead < len(segs) - 1 and lead < len(codes) and codes[lead].startswith(HEB_PREFIX_MORPH):
+            lead += 1
+        if lead:
+            keys.add("".join(segs[lead:]))
+            tsegs = translit.split("/")
+            if len(tsegs) == len(segs):
+                keys.add("".join(tsegs[lead:]))
+    else:
+        keys.add(greek_key(word).replace("/", ""))
+        keys.add(greek_key(tok.get("l") or "").replace("/", ""))
+    keys.discard("")
+    return keys
+
+
 def ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:HASH_CHARS]
+
+
+def write_hashed(dir_path: str, name: str, data: bytes) -> str:
+    """Write `data` as <stem>.<content hash><ext> in dir_path and return that file name.
+
+    The name changes only when the bytes do, so the page may keep the file
+    in its cache for good; a file already there from an earlier build is
+    left untouched.
+    """
+    stem, ext = os.path.splitext(name)
+    hashed = f"{stem}.{content_hash(data)}{ext}"
+    path = os.path.join(dir_path, hashed)
+    if not os.path.exists(path):
+        with open(path, "wb") as f:
+            f.write(data)
+    return hashed
+
+
+def prune_files(dir_path: str, pattern, keep) -> None:
+    # Remove shard files of earlier builds (names matching `pattern`) that this build did not write
+    for name in os.listdir(dir_path):
+        if pattern.match(name) and name not in keep:
+            os.remove(os.path.join(dir_path, name))
+
+
+def file_hash(site_dir: str, rel_path: str) -> str:
+    with open(os.path.join(site_dir, rel_path), "rb") as f:
+        return content_hash(f.read())
+
+
+def update_site_manifest(site_dir: str, files, owned=()) -> None:
+    """Merge {data path: content hash} entries into <site>/data/manifest.json.
+
+    The page fetches the files with a fixed name (books, Strong's maps,
+    folder manifests, interlinear chapters) as path?v=<hash>, and the
+    shards those manifests list already carry the hash in their names, so
+    everything but this file can be served from cache until it changes.
+    Entries under an `owned` path prefix that are missing from `files` are
+    dropped (the caller rebuilt that folder); others are kept, so the site
+    and interlinear builders can run in either order. The file is
+    rewritten only if an entry changed.
+    """
+    path = os.path.join(site_dir, SITE_MANIFEST)
+    try:
+        with open(path, encoding="utf-8") as f:
+            current = json.load(f)["files"]
+    except (OSError, ValueError, KeyError, TypeError):
+        current = {}
+    merged = {k: v for k, v in current.items() if not k.startswith(tuple(owned))}
+    merged.update(files)
+    data = json.dumps({"version": 1, "files": dict(sorted(merged.items()))}, ensure_ascii=False,
+                      separators=(",", ":")).encode("utf-8")
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return
+    except OSError:
+        pass
+    ensure_dir(os.path.dirname(path))
+    with open(path, "wb") as f:
+        f.write(data)
+
+
 def export_strongs_indexes(conn: sqlite3.Connection, out_dir: str) -> None:
     """Export Strong's -> [verse_id] maps for Hebrew (H####) and Greek (G####).
     Writes two files: strongs_H.json and strongs_G.json under out_dir.
@@ -133,7 +274,241 @@ def export_strongs_indexes(conn: sqlite3.Connection, out_dir: str) -> None:
         json.dump({"letter": "G", "version": 1, "index": data_g}, f, ensure_ascii=False)
 
 
-def build_site(db_path: str, out_dir: str, min_len: int = 3, include_stopwords: bool = False) -> None:
+def encode_binary_index(mapping) -> bytes:
+    """Encode a term -> sorted verse ids map as a binary index shard.
+
+    Layout after the 16-byte header: u32 string offsets (count+1), u32
+    posting offsets (count+1), the UTF-8 terms in byte order, then each
+    term's delta+varint posting list (encode_postings, without skips). The
+    client binary-searches the offsets with a DataView and decodes only
+    the list it needs, so loading a shard parses nothing up front.
+    """
+    terms = sorted(mapping, key=lambda t: t.encode("utf-8"))
+    strings, postings = bytearray(), bytearray()
+    string_offsets, posting_offsets = [0], [0]
+    for term in terms:
+        strings += term.encode("utf-8")
+        string_offsets.append(len(strings))
+        postings += encode_postings(mapping[term])[0]
+        posting_offsets.append(len(postings))
+    return b"".join((
+        struct.pack("<4sIII", INDEX_MAGIC, len(terms), len(strings), len(postings)),
+        struct.pack(f"<{len(string_offsets)}I", *string_offsets),
+        struct.pack(f"<{len(posting_offsets)}I", *posting_offsets),
+        bytes(strings),
+        bytes(postings),
+    ))
+
+
+def write_index_shard(idx_dir: str, name: str, mapping, index_format: str, info, hashed: bool = False):
+    """Write one word index shard as name.bin and/or name.json; returns {"bin"/"json": file name}.
+
+    `info` goes into the JSON header fields. With `hashed` the file names
+    carry a content hash (write_hashed) for the manifest to point at.
+    """
+    blobs = {}
+    if index_format in ("binary", "both"):
+        blobs["bin"] = encode_binary_index(mapping)
+    if index_format in ("json", "both"):
+        blobs["json"] = json.dumps({**info, "version": 1, "tokens": mapping}, ensure_ascii=False).encode("utf-8")
+    files = {}
+    for ext, data in blobs.items():
+        if hashed:
+            files[ext] = write_hashed(idx_dir, f"{name}.{ext}", data)
+        else:
+            files[ext] = f"{name}.{ext}"
+            with open(os.path.join(idx_dir, files[ext]), "wb") as f:
+                f.write(data)
+    return files
+
+
+def index_entry_bytes(term: str, ids, index_format: str) -> int:
+    # Bytes a term adds to its shard in the format the client reads first
+    if index_format == "json":
+        return len(json.dumps({term: ids}, ensure_ascii=False).encode("utf-8"))
+    return len(term.encode("utf-8")) + 8 + len(encode_postings(ids)[0])
+
+
+def plan_index_ranges(sizes, max_bytes: int):
+    """Split a sorted term list into (start, stop) runs of about equal size.
+
+    Starts from the fewest shards that fit under `max_bytes` (less a header
+    allowance) and cuts at the term boundary nearest the average of what
+    is left, never past the budget, so no shard passes it unless one term
+    alone does. If the cuts spill into an extra shard, the plan is redone
+    with one more so the overflow is spread instead of left as a stub. A
+    letter with many terms (p, s, k) ends up in several ranges; a run of
+    rare letters (w, x, y) shares one.
+    """
+    budget = max(1, max_bytes - 64)
+    total = sum(sizes)
+    count = max(1, -(-total // budget))
+    while True:
+        remaining, target = total, total / count
+        ranges, start, used = [], 0, 0
+        for i, size in enumerate(sizes):
+            # Cut before this term if that lands nearer the target than after it (never past the budget)
+            if i > start and (used + size > budget or used + size - target > target - used):
+                ranges.append((start, i))
+                remaining -= used
+                start, used = i, 0
+                target = min(budget, remaining / max(1, count - len(ranges)))
+            used += size
+        if sizes:
+            ranges.append((start, len(sizes)))
+        if len(ranges) <= count:
+            return ranges
+        count += 1  # too little slack at this count: the overflow would be one small shard, so spread it
+
+
+def export_index_shards(idx_dir: str, tokens, index_format: str, max_bytes: int):
+    """Write the word index as term-range shards of at most about `max_bytes`, plus manifest.json.
+
+    Shards are index_NNN.<hash>.bin/.json over consecutive terms in UTF-8
+    byte order; the manifest lists each with its first and last term and
+    file names, and the client binary-searches it for the one shard that
+    can hold a word. With max_bytes 0 the older one-shard-per-first-letter
+    layout is written instead (index_<letter>, index_other), without a
+    manifest. Either way the other layout's files are deleted, as the
+    client would prefer a stale manifest and only falls back to letter
+    shards when there is none. Returns the files the client fetches by
+    name (relative to idx_dir) for the site manifest.
+    """
+    manifest_path = os.path.join(idx_dir, "manifest.json")
+    if max_bytes <= 0:
+        by_letter = defaultdict(dict)
+        for term, ids in tokens.items():
+            by_letter[term[0] if "a" <= term[0] <= "z" else "other"][term] = ids
+        written = []
+        for letter in [chr(c) for c in range(ord("a"), ord("z") + 1)] + (["other"] if "other" in by_letter else []):
+            written += write_index_shard(idx_dir, f"index_{letter}", by_letter[letter], index_format,
+                                         {"letter": letter}).values()
+        if os.path.exists(manifest_path):
+            os.remove(manifest_path)
+        prune_files(idx_dir, INDEX_SHARD_NAME, ())
+        prune_files(idx_dir, LETTER_SHARD_NAME, set(written))
+        return written
+    terms = sorted(tokens, key=lambda t: t.encode("utf-8"))
+    sizes = [index_entry_bytes(t, tokens[t], index_format) for t in terms]
+    shards, keep = [], set()
+    for n, (start, stop) in enumerate(plan_index_ranges(sizes, max_bytes)):
+        name = f"index_{n:03d}"
+        first, last = terms[start], terms[stop - 1]
+        files = write_index_shard(idx_dir, name, {t: tokens[t] for t in terms[start:stop]}, index_format,
+                                  {"first": first, "last": last}, hashed=True)
+        keep.update(files.values())
+        shards.append({"file": name, **files, "first": first, "last": last, "terms": stop - start,
+                       "bytes": sum(sizes[start:stop])})
+    prune_files(idx_dir, INDEX_SHARD_NAME, keep)
+    prune_files(idx_dir, LETTER_SHARD_NAME, ())
+    formats = {"binary": ["bin"], "json": ["json"], "both": ["bin", "json"]}[index_format]
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump({"version": 1, "formats": formats, "shards": shards}, f, ensure_ascii=False, separators=(",", ":"))
+    return ["manifest.json"]
+
+
+def export_source_indexes(conn: sqlite3.Connection, chapters_dir: str, out_dir: str, index_format: str,
+                          max_bytes: int):
+    """Export Hebrew (OT) and Greek (NT) word indexes from the interlinear chapter JSONs.
+
+    Reads chapters_dir/<slug>/<chapter>.json for every chapter in the DB
+    and maps each source token's keys (source_token_keys) to the verse
+    ids of its verse, so an original-language search is one shard lookup
+    instead of a scan of every chapter. Written as range shards with a
+    manifest to data/index_heb/ and data/index_grc/; a testament with no
+    interlinear chapters gets no index (an earlier build's shards and
+    manifest are deleted) and the client scans as before.
+    Returns the content hash of every chapter read, by "<slug>/<n>.json".
+    """
+    vid_of = {(b, c, v): vid for vid, b, c, v in conn.execute("SELECT id, book_id, chapter, verse FROM verses")}
+    chapters = conn.execute("SELECT DISTINCT book_id, chapter FROM verses ORDER BY book_id, chapter").fetchall()
+    hashes = {}
+    for lang, books in (("heb", range(1, 40)), ("grc", range(40, len(BOOK_SLUGS) + 1))):
+        tokens = defaultdict(set)
+        for bid, chap in chapters:
+            if bid not in books:
+                continue
+            rel = f"{BOOK_SLUGS[bid - 1]}/{chap}.json"
+            try:
+                with open(os.path.join(chapters_dir, rel), "rb") as f:
+                    data = f.read()
+                verses = json.loads(data).get("verses") or []
+            except (OSError, ValueError):
+                continue
+            hashes[rel] = content_hash(data)
+            for verse in verses:
+                vid = vid_of.get((bid, chap, verse.get("v")))
+                if not vid:
+                    continue
+                for tok in verse.get("src") or []:
+                    for key in source_token_keys(tok, lang == "heb"):
+                        tokens[key].add(vid)
+        idx_dir = os.path.join(out_dir, "data", f"index_{lang}")
+        if not tokens:
+            if os.path.isdir(idx_dir):
+                prune_files(idx_dir, INDEX_SHARD_NAME, ())
+                prune_files(idx_dir, re.compile(r"^manifest\.json$"), ())
+                if not os.listdir(idx_dir):
+                    os.rmdir(idx_dir)
+            continue
+        ensure_dir(idx_dir)
+        # Always range shards: first-letter shards would put every Hebrew or Greek word in index_other
+        export_index_shards(idx_dir, {k: sorted(ids) for k, ids in tokens.items()}, index_format,
+                            max_bytes if max_bytes > 0 else 32 * 1024)
+    return hashes
+
+
+def export_verse_shards(conn: sqlite3.Connection, out_dir: str, max_bytes: int = 32 * 1024) -> None:
+    """Export the verses as chapter-range shards plus a manifest of their verse-id ranges.
+
+    Consecutive chapters of one book are grouped until a shard would pass
+    `max_bytes` of JSON (a chapter is never split, a shard never spans two
+    books). data/verses/BB-CCC.<hash>.json (book id, first chapter, content
+    hash) holds {"book_id", "first", "verses"}, where verses[i] is
+    [chapter, verse, text] of verse id first+i (null for a gap);
+    data/verses/manifest.json lists every file in id order with its book,
+    first/last verse id and chapter range, so the client fetches only the
+    shards its results fall in instead of the whole Bible.
+    """
+    shard_dir = os.path.join(out_dir, "data", "verses")
+    ensure_dir(shard_dir)
+    shards = []
+
+    def flush(bid, chapters, verses, first):
+        data = json.dumps({"book_id": bid, "first": first, "verses": verses}, ensure_ascii=False, separators=(",", ":"))
+        name = write_hashed(shard_dir, f"{bid:02d}-{chapters[0]:03d}.json", data.encode("utf-8"))
+        shards.append({"file": name, "book_id": bid, "first": first, "last": first + len(verses) - 1,
+                       "chapters": [chapters[0], chapters[-1]]})
+
+    rows = conn.execute("SELECT id, book_id, chapter, verse, text FROM verses ORDER BY id")
+    # Verse ids follow canonical order, so a book's chapters arrive as consecutive runs
+    pending = None  # (book id, [chapters], verses, first id, bytes)
+    for (bid, chap), group in groupby(rows, key=lambda r: (r[1], r[2])):
+        group = list(group)
+        chapter = [[c, v, unicodedata.normalize("NFC", text)] for _, _, c, v, text in group]
+        size = len(json.dumps(chapter, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        if pending and (pending[0] != bid or pending[4] + size > max_bytes):
+            flush(*pending[:4])
+            pending = None
+        if pending is None:
+            pending = (bid, [], [], group[0][0], 0)
+        _, chapters, verses, first, used = pending
+        for (vid, *_), row in zip(group, chapter):
+            while len(verses) < vid - first:
+                verses.append(None)
+            verses.append(row)
+        chapters.append(chap)
+        pending = (bid, chapters, verses, first, used + size)
+    if pending:
+        flush(*pending[:4])
+    prune_files(shard_dir, VERSE_SHARD_NAME, {s["file"] for s in shards})
+    with open(os.path.join(shard_dir, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump({"version": 1, "count": shards[-1]["last"] if shards else 0, "shards": shards}, f, separators=(",", ":"))
+
+
+def build_site(db_path: str, out_dir: str, min_len: int = 3, include_stopwords: bool = False,
+               verse_shard_bytes: int = 32 * 1024, index_format: str = "binary", max_shard_bytes: int = 32 * 1024,
+               chapters_dir: str = None) -> None:
     ensure_dir(os.path.join(out_dir, "data", "index"))
     ensure_dir(os.path.join(out_dir, "data", "strongs"))
 
@@ -145,48 +520,34 @@ def build_site(db_path: str, out_dir: str, min_len: int = 3, include_stopwords:
     with open(os.path.join(out_dir, "data", "books.json"), "w", encoding="utf-8") as f:
         json.dump(books, f, ensure_ascii=False)
 
-    # Export verses as array where index = verse_id-1, item = [book_id, chapter, verse, text]
-    verses = []
-    for vid, bid, chap, ver, text in cur.execute("SELECT id, book_id, chapter, verse, text FROM verses ORDER BY id"):
-        # Ensure the list is contiguous up to vid
-        while len(verses) < vid - 1:
-            verses.append(None)
-        verses.append([bid, chap, ver, unicodedata.normalize("NFC", text)])
-    with open(os.path.join(out_dir, "data", "verses.json"), "w", encoding="utf-8") as f:
-        json.dump(verses, f, ensure_ascii=False)
-
-    # Build token -> unique verse_ids, sharded by first letter
-    shards = {chr(c): {} for c in range(ord('a'), ord('z') + 1)}
-    other = {}
+    # Export verses as chapter-range shards (data/verses/) so a search downloads only the chapters it hits
+    export_verse_shards(conn, out_dir, verse_shard_bytes)
+
+    # Build token -> unique verse_ids
+    tokens = {}
     last_tok = None
     last_list = None
 
-    for norm, vid in cur.execute("SELECT normalized, verse_id FROM tokens ORDER BY normalized, verse_id"):
+    for norm, vid in cur.execute(
+        "SELECT l.normalized, t.verse_id FROM lexicon l JOIN tokens t ON t.term_id = l.term_id ORDER BY l.normalized, t.verse_id"
+    ):
         if len(norm) < min_len:
             continue
         if not include_stopwords and norm in STOPWORDS:
             continue
         if norm != last_tok:
-            # finalize previous (noop here)
             last_tok = norm
-            # pick shard
-            first = norm[0]
-            target = shards.get(first, other)
-            lst = []
-            target[norm] = lst
-            last_list = lst
+            last_list = tokens[norm] = []
         # dedupe consecutive verse_ids
         if not last_list or last_list[-1] != vid:
             last_list.append(vid)
 
-    # Write shards
-    idx_dir = os.path.join(out_dir, "data", "index")
-    for letter, mapping in shards.items():
-        with open(os.path.join(idx_dir, f"index_{letter}.json"), "w", encoding="utf-8") as f:
-            json.dump({"letter": letter, "version": 1, "tokens": mapping}, f, ensure_ascii=False)
-    if other:
-        with open(os.path.join(idx_dir, f"index_other.json"), "w", encoding="utf-8") as f:
-            json.dump({"letter": "other", "version": 1, "tokens": other}, f, ensure_ascii=False)
+    # Write the word index as size-balanced term-range shards (binary and/or JSON) plus their manifest
+    index_files = export_index_shards(os.path.join(out_dir, "data", "index"), tokens, index_format, max_shard_bytes)
+
+    # Hebrew/Greek word indexes from the interlinear chapters (default: the chapters already under out/data)
+    chapters_dir = chapters_dir or os.path.join(out_dir, "data")
+    chapter_hashes = export_source_indexes(conn, chapters_dir, out_dir, index_format, max_shard_bytes)
 
     # Optional: export Strong's -> verse IDs for instant Hebrew/Greek lookup
     try:
@@ -200,19 +561,39 @@ def build_site(db_path: str, out_dir: str, min_len: int = 3, include_stopwords:
             # Do not fail site build if strongs export fails
             pass
 
+    # Site manifest: fixed-name files by content hash (shards are listed, hashed, in their folder's manifest)
+    fixed = ["data/books.json", "data/verses/manifest.json", "data/index_heb/manifest.json",
+             "data/index_grc/manifest.json", "data/strongs/strongs_H.json", "data/strongs/strongs_G.json"]
+    fixed += [f"data/index/{name}" for name in index_files]
+    files = {rel: file_hash(out_dir, rel) for rel in fixed if os.path.exists(os.path.join(out_dir, rel))}
+    owned = ["data/books.json", "data/verses/", "data/index/", "data/index_heb/", "data/index_grc/", "data/strongs/"]
+    if os.path.isdir(chapters_dir) and os.path.samefile(chapters_dir, os.path.join(out_dir, "data")):
+        # The interlinear chapters are part of this site: list them too (their builders update single entries)
+        files.update({f"data/{rel}": h for rel, h in chapter_hashes.items()})
+        owned += [f"data/{slug}/" for slug in BOOK_SLUGS]
+    update_site_manifest(out_dir, files, owned)
+
 
 def main():
-    ap = argparse.ArgumentParser(description="Build static site JSON (indexes + verses) for GitHub Pages")
+    ap = argparse.ArgumentParser(description="Build static site data (word index, chapter-range verse shards, Strong's maps) for GitHub Pages")
     ap.add_argument("--db", default="alb_concordance.sqlite", help="Path to SQLite DB")
     ap.add_argument("--out", default="site", help="Output site directory (default: site)")
     ap.add_argument("--min-len", type=int, default=3, help="Minimum word length to include in index")
     ap.add_argument("--include-stopwords", action="store_true", help="Include stopwords in index")
+    ap.add_argument("--index-format", choices=("binary", "json", "both"), default="binary",
+                    help="Word index shards as binary posting lists (default), the older JSON, or both")
+    ap.add_argument("--max-shard-bytes", type=int, default=32 * 1024,
+                    help="Largest word index shard in bytes; terms are split into sorted ranges of about equal size (0: one shard per first letter; default 32768)")
+    ap.add_argument("--chapters", help="Interlinear chapter JSONs to index for Hebrew/Greek search (default: <out>/data)")
+    ap.add_argument("--verse-shard-bytes", type=int, default=32 * 1024, help="Target size of a verse shard in bytes of JSON (default 32768)")
     args = ap.parse_args()
 
     if not os.path.exists(args.db):
         raise SystemExit(f"Database not found: {args.db}. Build it first with: python scripts/build_concordance.py build")
 
-    build_site(args.db, args.out, min_len=args.min_len, include_stopwords=args.include_stopwords)
+    build_site(args.db, args.out, min_len=args.min_len, include_stopwords=args.include_stopwords,
+               verse_shard_bytes=args.verse_shard_bytes, index_format=args.index_format,
+               max_shard_bytes=args.max_shard_bytes, chapters_dir=args.chapters)
     print("Static site data built in:", args.out)
 
 
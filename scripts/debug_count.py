@@ -8,11 +8,11 @@ def inspect(db_path: str, norm: str = "perendia"):
     conn = sqlite3.connect(db_path)
     cur = conn.cursor()
     try:
-        total_tokens = cur.execute("select count(*) from tokens where normalized=?", (norm,)).fetchone()[0]
-        total_verses = cur.execute("select count(distinct verse_id) from tokens where normalized=?", (norm,)).fetchone()[0]
+        total_tokens = cur.execute("select coalesce(sum(freq), 0) from lexicon where normalized=?", (norm,)).fetchone()[0]
+        total_verses = cur.execute("select count(distinct t.verse_id) from tokens t join lexicon l on l.term_id = t.term_id where l.normalized=?", (norm,)).fetchone()[0]
         variants = {}
         for f in ["perendi","perendine","perendise","perendin","perendinë","perëndia","perëndi","perëndisë","perëndinë"]:
-            variants[f] = cur.execute("select count(distinct verse_id) from tokens where normalized=?", (f.lower().replace("ë","e").replace("ç","c"),)).fetchone()[0]
+            variants[f] = cur.execute("select count(distinct t.verse_id) from tokens t join lexicon l on l.term_id = t.term_id where l.normalized=?", (f.lower().replace("ë","e").replace("ç","c"),)).fetchone()[0]
         print({
             "db": db_path,
             "norm": norm,
@@ -24,9 +24,10 @@ def inspect(db_path: str, norm: str = "perendia"):
             """
             select b.name, v.chapter, v.verse, v.text
             from tokens t
+            join lexicon l on l.term_id = t.term_id
             join verses v on v.id = t.verse_id
             join books b on b.id = v.book_id
-            where t.normalized = ?
+            where l.normalized = ?
             group by v.id
             order by v.book_id, v.chapter, v.verse
             limit 5
@@ -37,7 +38,7 @@ def inspect(db_path: str, norm: str = "perendia"):
 
         print("prefix perend% distribution:")
         for tok, cnt in cur.execute(
-            "select normalized, count(distinct verse_id) as c from tokens where normalized like 'perend%' group by normalized order by c desc, normalized"
+            "select l.normalized, count(distinct t.verse_id) as c from lexicon l join tokens t on t.term_id = l.term_id where l.normalized like 'perend%' group by l.term_id order by c desc, l.normalized"
         ):
             print("  ", tok, cnt)
     finally:
@@ -9,25 +9,25 @@ def main():
     args = ap.parse_args()
     conn = sqlite3.connect(args.db)
     cur = conn.cursor()
-    cur.execute('SELECT COUNT(DISTINCT normalized) FROM tokens')
+    cur.execute('SELECT COUNT(*) FROM lexicon')
     unique_words = cur.fetchone()[0]
-    cur.execute('SELECT SUM(vcnt) FROM (SELECT normalized, COUNT(DISTINCT verse_id) AS vcnt FROM tokens GROUP BY normalized)')
+    cur.execute('SELECT SUM(vcnt) FROM (SELECT term_id, COUNT(DISTINCT verse_id) AS vcnt FROM tokens GROUP BY term_id)')
     sum_verse_hits = cur.fetchone()[0]
     cur.execute('SELECT AVG(LENGTH(text)) FROM verses')
     avg_len = cur.fetchone()[0]
     cur.execute('SELECT COUNT(*) FROM verses')
     verses = cur.fetchone()[0]
-    cur.execute('SELECT normalized, COUNT(*) as cnt FROM tokens GROUP BY normalized ORDER BY cnt DESC LIMIT 5')
+    cur.execute('SELECT normalized, freq FROM lexicon ORDER BY freq DESC LIMIT 5')
     top = cur.fetchall()
     # Words length >=3
-    cur.execute('SELECT COUNT(*) FROM (SELECT normalized FROM tokens WHERE LENGTH(normalized) >= 3 GROUP BY normalized)')
+    cur.execute('SELECT COUNT(*) FROM lexicon WHERE LENGTH(normalized) >= 3')
     unique_ge3 = cur.fetchone()[0]
-    cur.execute('SELECT SUM(vcnt) FROM (SELECT normalized, COUNT(DISTINCT verse_id) AS vcnt FROM tokens WHERE LENGTH(normalized) >= 3 GROUP BY normalized)')
+    cur.execute('SELECT SUM(vcnt) FROM (SELECT t.term_id, COUNT(DISTINCT t.verse_id) AS vcnt FROM tokens t JOIN lexicon l ON l.term_id = t.term_id WHERE LENGTH(l.normalized) >= 3 GROUP BY t.term_id)')
     sum_hits_ge3 = cur.fetchone()[0]
     # Words length >=4
-    cur.execute('SELECT COUNT(*) FROM (SELECT normalized FROM tokens WHERE LENGTH(normalized) >= 4 GROUP BY normalized)')
+    cur.execute('SELECT COUNT(*) FROM lexicon WHERE LENGTH(normalized) >= 4')
     unique_ge4 = cur.fetchone()[0]
-    cur.execute('SELECT SUM(vcnt) FROM (SELECT normalized, COUNT(DISTINCT verse_id) AS vcnt FROM tokens WHERE LENGTH(normalized) >= 4 GROUP BY normalized)')
+    cur.execute('SELECT SUM(vcnt) FROM (SELECT t.term_id, COUNT(DISTINCT t.verse_id) AS vcnt FROM tokens t JOIN lexicon l ON l.term_id = t.term_id WHERE LENGTH(l.normalized) >= 4 GROUP BY t.term_id)')
     sum_hits_ge4 = cur.fetchone()[0]
     print(json.dumps({
         'unique_words': unique_words,
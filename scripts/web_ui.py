@@ -1,11 +1,58 @@
 import argparse
+import asyncio
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, contextmanager
+from email.utils import formatdate, parsedate_to_datetime
+import hashlib
+import io
+from itertools import islice
+import json
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from urllib.parse import urlparse, parse_qs, urlencode
+from urllib.request import pathname2url
 import os
+import queue
 import re
 import sqlite3
+import sys
+import threading
+import time
+import traceback
 import unicodedata
-import base64
+import gzip
+import zlib
+
+try:  # optional: pip install brotli
+    import brotli
+except ImportError:  # pragma: no cover - stdlib-only installs
+    brotli = None
+
+# Share the index codecs with the builder (scripts/ is not a package)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from build_concordance import (  # noqa: E402
+    FtsSyntaxError,
+    TermDictionary,
+    count_fts,
+    decode_postings,
+    fts_query_error,
+    has_fts,
+    has_lemmas,
+    has_strongs,
+    is_fts_query,
+    is_wildcard_query,
+    iter_rows_by_ids,
+    iter_search_ids,
+    iter_verses_by_id,
+    search_by_lemma,
+    search_fts,
+    search_ids_before,
+    search_kind,
+    search_total,
+    wildcard_ids,
+)
 
 _RE_STRONGS = re.compile(r"^[HG]\d{4}$", re.IGNORECASE)
 
@@ -101,8 +148,8 @@ def tokenize(clean_text: str):
     return re.findall(r"[A-Za-zËÇëç]+", clean_text)
 
 
-def highlight_text(text: str, query: str) -> str:
-    norm_q = normalize_token(fix_encoding_artifacts(query))
+def highlight_text(text: str, query: str, terms=None) -> str:
+    wanted = set(terms) if terms is not None else {normalize_token(fix_encoding_artifacts(query))}
     s = unicodedata.normalize("NFC", text)
     out = []
     last = 0
@@ -111,7 +158,7 @@ def highlight_text(text: str, query: str) -> str:
         tok = m.group(0)
         norm_tok = normalize_token(tok)
         out.append(s[last:start])
-        if norm_tok == norm_q:
+        if norm_tok in wanted:
             out.append(f"<mark>{tok}</mark>")
         else:
             out.append(tok)
@@ -150,107 +197,1028 @@ footer { margin-top:2rem; color:#777; font-size:.9rem; }
 """
 
 
+class ConnectionPool:
+    """Fixed set of read-only SQLite connections shared by the request threads.
+
+    ThreadingHTTPServer starts a fresh thread per request, so connections are
+    lent out from a queue rather than pinned to threads; a request only waits
+    when all `size` connections are busy. Each connection opens the file with
+    mode=ro (optionally immutable=1, which also skips file locking) and is
+    tuned with mmap_size, cache_size and query_only. `trace`, if given, is
+    installed as every connection's SQLite trace callback.
+    """
+
+    def __init__(self, db_path: str, size: int = 8, mmap_size: int = 256 * 1024 * 1024, cache_size: int = -16384,
+                 query_only: bool = True, immutable: bool = False, trace=None):
+        self.uri = f"file:{pathname2url(os.path.abspath(db_path))}?mode=ro" + ("&immutable=1" if immutable else "")
+        self.mmap_size = int(mmap_size)
+        self.cache_size = int(cache_size)
+        self.query_only = query_only
+        self.trace = trace
+        self.size = max(1, int(size))
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        for _ in range(self.size):
+            self._idle.put(self.open())
+
+    def open(self) -> sqlite3.Connection:
+        # A new connection with the pool's settings (exports get their own; see App.stream)
+        # check_same_thread is off because a connection moves between request threads (one at a time)
+        conn = sqlite3.connect(self.uri, uri=True, check_same_thread=False)
+        conn.execute(f"PRAGMA mmap_size={self.mmap_size}")
+        conn.execute(f"PRAGMA cache_size={self.cache_size}")
+        if self.query_only:
+            conn.execute("PRAGMA query_only=ON")
+        if self.trace:
+            conn.set_trace_callback(self.trace)
+        return conn
+
+    def idle(self) -> int:
+        # Connections not lent out right now
+        return self._idle.qsize()
+
+    @contextmanager
+    def connection(self):
+        conn = self._idle.get()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def close(self) -> None:
+        for _ in range(self.size):
+            self._idle.get().close()
+
+
+def file_stamp(path: str):
+    # (inode, mtime, size) of a file, or None if it is missing; a rebuild changes at least one
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+class ResultCache:
+    """Thread-safe LRU of search results, bounded by entry count and approximate bytes.
+
+    The database is read-only once built, so results stay valid until
+    App.refresh() reopens a rebuilt file and calls clear(). Every clear()
+    starts a new generation; a value computed from the old file and stored
+    after the clear (put() with the generation read before computing it)
+    is dropped.
+    """
+
+    def __init__(self, max_entries: int = 512, max_bytes: int = 32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = self.misses = self.bytes = 0
+        self.generation = 0
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()  # key -> (value, size)
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+            self.generation += 1
+
+    def get(self, key):
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return hit[0]
+
+    def put(self, key, value, size: int, generation=None) -> None:
+        if self.max_entries <= 0 or size > self.max_bytes:
+            return
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self._entries[key] = (value, size)
+            self.bytes += size
+            while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+                _, (_, freed) = self._entries.popitem(last=False)
+                self.bytes -= freed
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries), "bytes": self.bytes}
+
+
+def _result_size(value) -> int:
+    # Rough footprint of a cached (total, rows, ...) tuple: text lengths plus a per-field overhead
+    size = 64
+    for part in value if isinstance(value, tuple) else (value,):
+        if isinstance(part, array):
+            size += part.itemsize * len(part)
+        elif isinstance(part, list):
+            for item in part:
+                if isinstance(item, tuple):
+                    size += sum(len(x) if isinstance(x, str) else 8 for x in item) + 16 * len(item)
+                else:
+                    size += len(item) + 16 if isinstance(item, str) else 16
+    return size
+
+
+class PageCache(ResultCache):
+    """Rendered /books and /chapter pages, each with its compressed copies.
+
+    An entry maps a content coding to bytes (None is the plain HTML). A
+    copy in a given coding is made once, at the best level, the first time
+    a client asks for it, so a repeat request is a dictionary lookup. LRU
+    and invalidation are ResultCache's; the byte bound counts every copy.
+    """
+
+    def page(self, key, render, coding=None):
+        # (body, coding actually used) for a page, rendering/compressing it on a miss
+        generation = self.generation
+        variants = self.get(key)
+        changed = variants is None
+        if changed:
+            variants = {None: render()}
+        if len(variants[None]) < COMPRESS_MIN_BYTES:
+            coding = None
+        if coding not in variants:
+            # Entries are never mutated in place: another thread may be sending the old dict
+            variants = {**variants, coding: compress(variants[None], coding, best=self.max_bytes > 0)}
+            changed = True
+        if changed:
+            self.put(key, variants, sum(len(v) for v in variants.values()), generation)
+        return variants[coding], coding
+
+
+# Histogram bounds for /metrics: request phases in seconds, responses in bytes
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+SIZE_BUCKETS = (512, 2048, 8192, 32768, 131072, 524288, 2097152, 8388608)
+PHASES = ("parse", "sql", "render", "write")
+# Longest statement text printed per slow query (a page of verse ids inlines hundreds of parameters)
+SLOW_SQL_CHARS = 400
+
+
+class Histogram:
+    """Bucketed observations in the Prometheus sense; Metrics does the locking."""
+
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # the last bucket is +Inf
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    def samples(self, name: str, labels: str):
+        # Cumulative _bucket lines, then _sum and _count
+        total = 0
+        for bound, n in zip(self.bounds + ("+Inf",), self.counts):
+            total += n
+            yield f'{name}_bucket{{{labels},le="{bound}"}} {total}'
+        yield f"{name}_sum{{{labels}}} {round(self.sum, 6)}"
+        yield f"{name}_count{{{labels}}} {total}"
+
+
+class Metrics:
+    """Request counters, per-route latency and size histograms, and the slow-query log.
+
+    A request is split into four phases: parse (request headers and
+    query string), sql (time holding a pooled connection, including the
+    wait for one), write (socket writes) and render (the rest of the
+    handler). SQL time is gathered per thread, which is also the thread
+    that runs the request in both server modes. A connection checkout
+    slower than `slow_seconds` is printed to stderr with its statements,
+    as SQLite expands them (parameters inlined); 0 turns the log off.
+    """
+
+    def __init__(self, slow_seconds: float = 0.0):
+        self.slow_seconds = slow_seconds
+        self.started = time.time()
+        self.requests = {}  # (route, status) -> count
+        self.durations = {}  # route -> Histogram of whole requests
+        self.phases = {}  # (route, phase) -> Histogram
+        self.sizes = {}  # route -> Histogram of bytes written
+        self.slow_queries = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def begin(self, target: str) -> None:
+        # Start a request on this thread; `target` is the request path shown in the slow-query log
+        self._local.sql = 0.0
+        self._local.target = target
+
+    def trace(self, statement: str) -> None:
+        # SQLite trace callback: keep the statements of a checkout while the slow log wants them
+        statements = getattr(self._local, "statements", None)
+        if statements is not None:
+            statements.append(statement)
+
+    @contextmanager
+    def query(self):
+        # Time one connection checkout and add it to the current request's SQL time
+        local = self._local
+        statements = local.statements = [] if self.slow_seconds > 0 else None
+        t = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - t
+            local.statements = None
+            local.sql = getattr(local, "sql", 0.0) + elapsed
+            if statements is not None and elapsed >= self.slow_seconds:
+                with self._lock:
+                    self.slow_queries += 1
+                self.log_slow(elapsed, getattr(local, "target", "(no request)"), statements)
+
+    def add_sql(self, seconds: float) -> None:
+        # SQL time spent outside a pooled checkout (export rows, read on their own connection)
+        self._local.sql = getattr(self._local, "sql", 0.0) + seconds
+
+    @staticmethod
+    def log_slow(elapsed: float, target: str, statements) -> None:
+        sql = " ; ".join(
+            text if len(text) <= SLOW_SQL_CHARS else text[:SLOW_SQL_CHARS] + "..."
+            for text in (" ".join(s.split()) for s in statements)
+        )
+        print(f"slow query {elapsed * 1000:.1f} ms {target}: {sql or '(no statements)'}", file=sys.stderr, flush=True)
+
+    def observe(self, route: str, status: int, parse: float, handler: float, write: float, size: int) -> None:
+        # Record a finished request; `handler` is the wall time of do_GET, which holds the sql and write time
+        sql = getattr(self._local, "sql", 0.0)
+        phases = (("parse", parse), ("sql", sql), ("render", max(0.0, handler - sql - write)), ("write", write))
+        with self._lock:
+            key = (route, status)
+            self.requests[key] = self.requests.get(key, 0) + 1
+            if route not in self.durations:
+                self.durations[route] = Histogram(LATENCY_BUCKETS)
+                self.sizes[route] = Histogram(SIZE_BUCKETS)
+                for phase in PHASES:
+                    self.phases[(route, phase)] = Histogram(LATENCY_BUCKETS)
+            self.durations[route].observe(parse + handler)
+            self.sizes[route].observe(size)
+            for phase, seconds in phases:
+                self.phases[(route, phase)].observe(seconds)
+
+    def render(self, gauges=()) -> bytes:
+        """Prometheus text exposition (format 0.0.4) of everything recorded.
+
+        `gauges` adds (name, type, help, [(labels, value)]) families, such
+        as the cache and pool figures App reads at scrape time.
+        """
+        out = []
+
+        def family(name, kind, help_text, lines):
+            out.append(f"# HELP {name} {help_text}")
+            out.append(f"# TYPE {name} {kind}")
+            out.extend(lines)
+
+        with self._lock:
+            family("concordance_http_requests_total", "counter", "Requests answered, by route and status code.",
+                   [f'concordance_http_requests_total{{route="{r}",code="{c}"}} {n}' for (r, c), n in sorted(self.requests.items())])
+            family("concordance_http_request_duration_seconds", "histogram", "Time from request headers to the last byte written.",
+                   [line for r, h in sorted(self.durations.items())
+                    for line in h.samples("concordance_http_request_duration_seconds", f'route="{r}"')])
+            family("concordance_http_phase_seconds", "histogram", "Request time by phase: parse, sql, render, write.",
+                   [line for (r, p), h in sorted(self.phases.items())
+                    for line in h.samples("concordance_http_phase_seconds", f'route="{r}",phase="{p}"')])
+            family("concordance_http_response_bytes", "histogram", "Bytes written per response, headers included.",
+                   [line for r, h in sorted(self.sizes.items())
+                    for line in h.samples("concordance_http_response_bytes", f'route="{r}"')])
+            family("concordance_slow_queries_total", "counter", "Connection checkouts logged as slow queries.",
+                   [f"concordance_slow_queries_total {self.slow_queries}"])
+        family("concordance_start_time_seconds", "gauge", "Unix time the server started.",
+               [f"concordance_start_time_seconds {self.started:.0f}"])
+        for name, kind, help_text, samples in gauges:
+            family(name, kind, help_text, [f"{name}{{{labels}}} {value}" if labels else f"{name} {value}" for labels, value in samples])
+        return ("\n".join(out) + "\n").encode("utf-8")
+
+
+# Route label of a path in /metrics; anything else counts as "other" so bad URLs cannot grow the label set
+METRIC_ROUTES = ("/", "/index", "/books", "/chapter", "/search", "/export", "/logo", "/metrics",
+                 "/api/search", "/api/chapter", "/api/verses")
+
+
+def metric_route(path: str) -> str:
+    if path in METRIC_ROUTES:
+        return path
+    return "/api/strongs/" if path.startswith("/api/strongs/") else "other"
+
+
+# Keyset cursor meaning "before the end": the last page of a result list
+LAST_PAGE = 1 << 62
+# Seconds between checks of the DB file for a rebuild (App.refresh)
+RELOAD_CHECK_SECONDS = 1.0
+
+
 class App:
-    def __init__(self, db_path: str):
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+    def __init__(self, db_path: str, pool_size: int = 8, cache_entries: int = 512, cache_bytes: int = 32 * 1024 * 1024,
+                 page_bytes: int = 64 * 1024 * 1024, slow_query_seconds: float = 0.0, **pool_options):
+        self.db_path = db_path
+        self.metrics = Metrics(slow_query_seconds)
+        self.pool_options = dict(pool_options, size=pool_size,
+                                 trace=self.metrics.trace if slow_query_seconds > 0 else None)
+        self.stamp = file_stamp(db_path)
+        self.pool = ConnectionPool(db_path, **self.pool_options)
+        self.cache = ResultCache(max_entries=cache_entries, max_bytes=cache_bytes)
+        self.pages = PageCache(max_entries=1 << 16, max_bytes=page_bytes)
+        self._reload_lock = threading.Lock()
+        self._next_check = time.monotonic() + RELOAD_CHECK_SECONDS
+        with self.db() as conn:
+            self.__dict__.update(self._load_state(conn))
+
+    def _load_state(self, conn: sqlite3.Connection):
+        # Attributes read from the DB once per open: build info, optional indexes, term dictionary, chapter counts
+        build_id, built_at = self._build_info(conn, self.db_path)
+        return {
+            "build_id": build_id,
+            "built_at": built_at,
+            "fts": has_fts(conn),
+            "lemmas": has_lemmas(conn),
+            "strongs": has_strongs(conn),
+            # Sorted term arrays for perend* / *ise / per?ndi expansion
+            "terms": TermDictionary.load(conn),
+            # book_id -> chapter count, for chapter navigation and to keep unknown chapters out of the page cache
+            "chapters": dict(conn.execute("SELECT book_id, MAX(chapter) FROM verses GROUP BY book_id").fetchall()),
+        }
+
+    def refresh(self) -> bool:
+        """Reopen the database if the file was rebuilt since it was opened.
+
+        build_concordance.py deletes the file and writes a new one, and open
+        connections would go on reading the deleted copy. So at most every
+        RELOAD_CHECK_SECONDS the file's inode, mtime and size are compared
+        with those seen at open. On a change a new pool is opened, the state
+        of _load_state() is read from it and both caches are emptied. The old
+        pool is dropped, and its connections close once the requests still
+        using them finish. A file that cannot be read yet (the builder holds
+        it locked while writing) is retried at the next check, and the old
+        copy is served meanwhile. Returns whether the database was reopened.
+        """
+        now = time.monotonic()
+        if now < self._next_check:
+            return False
+        with self._reload_lock:
+            if now < self._next_check:
+                return False
+            self._next_check = now + RELOAD_CHECK_SECONDS
+            stamp = file_stamp(self.db_path)
+            if stamp is None or stamp == self.stamp:
+                return False
+            try:
+                # Fail at once, not after the busy timeout, while the builder still holds its lock
+                probe = sqlite3.connect(self.pool.uri, uri=True, timeout=0)
+                try:
+                    probe.execute("SELECT count(*) FROM sqlite_master").fetchone()
+                finally:
+                    probe.close()
+                pool = ConnectionPool(self.db_path, **self.pool_options)
+                with pool.connection() as conn:
+                    state = self._load_state(conn)
+            except sqlite3.Error:
+                return False
+            self.__dict__.update(state)
+            self.pool, self.stamp = pool, stamp
+            self.cache.clear()
+            self.pages.clear()
+            return True
+
+    @contextmanager
+    def db(self):
+        # A pooled connection; the time it is held counts as the request's SQL time in /metrics
+        with self.metrics.query(), self.pool.connection() as conn:
+            yield conn
+
+    def metrics_text(self) -> bytes:
+        # /metrics: request figures plus the caches and the connection pool as they are now
+        result, pages = self.cache.stats(), self.pages.stats()
+        caches = (("result", result), ("page", pages))
+        idle = self.pool.idle()
+        return self.metrics.render([
+            ("concordance_cache_hits_total", "counter", "Cache lookups answered from memory.",
+             [(f'cache="{name}"', st["hits"]) for name, st in caches]),
+            ("concordance_cache_misses_total", "counter", "Cache lookups that had to query or render.",
+             [(f'cache="{name}"', st["misses"]) for name, st in caches]),
+            ("concordance_cache_entries", "gauge", "Entries held by each cache.",
+             [(f'cache="{name}"', st["entries"]) for name, st in caches]),
+            ("concordance_cache_bytes", "gauge", "Approximate bytes held by each cache.",
+             [(f'cache="{name}"', st["bytes"]) for name, st in caches]),
+            ("concordance_db_connections", "gauge", "Pooled read-only connections by state.",
+             [('state="idle"', idle), ('state="busy"', self.pool.size - idle)]),
+        ])
+
+    @staticmethod
+    def _build_info(conn: sqlite3.Connection, db_path: str):
+        # (build id, unix build time) written by the builder; older DBs fall back to the file's identity
+        try:
+            meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+        except sqlite3.OperationalError:
+            meta = {}
+        st = os.stat(db_path)
+        build_id = meta.get("build_id") or f"{st.st_ino:x}-{st.st_mtime_ns:x}-{st.st_size:x}"
+        return build_id, int(meta.get("built_at") or st.st_mtime)
 
     def books(self):
-        rows = self.conn.execute("SELECT id, name FROM books ORDER BY id").fetchall()
+        with self.db() as conn:
+            rows = conn.execute("SELECT id, name FROM books ORDER BY id").fetchall()
         return [(bid, map_book(name)) for (bid, name) in rows]
 
     def max_chapter(self, book_id: int) -> int:
-        r = self.conn.execute("SELECT MAX(chapter) FROM verses WHERE book_id=?", (book_id,)).fetchone()
-        return int(r[0] or 0)
+        return int(self.chapters.get(book_id) or 0)
 
     def verses_in_chapter(self, book_id: int, chap: int):
-        return self.conn.execute(
-            "SELECT v.text, v.verse, b.name FROM verses v JOIN books b ON b.id=v.book_id WHERE v.book_id=? AND v.chapter=? ORDER BY v.verse",
-            (book_id, chap),
-        ).fetchall()
+        with self.db() as conn:
+            return conn.execute(
+                "SELECT v.text, v.verse, b.name FROM verses v JOIN books b ON b.id=v.book_id WHERE v.book_id=? AND v.chapter=? ORDER BY v.verse",
+                (book_id, chap),
+            ).fetchall()
 
-    def search(self, q: str, limit: int = 100):
+    def chapter_verses(self, book_id: int, chap: int):
+        # (id, book, book_id, chapter, verse, text) rows of a chapter, for the JSON API
+        with self.db() as conn:
+            return conn.execute(
+                "SELECT v.id, b.name, v.book_id, v.chapter, v.verse, v.text FROM verses v JOIN books b ON b.id=v.book_id "
+                "WHERE v.book_id=? AND v.chapter=? ORDER BY v.verse",
+                (book_id, chap),
+            ).fetchall()
+
+    def verses_by_id(self, ids):
+        with self.db() as conn:
+            return list(iter_verses_by_id(conn, ids, with_id=True))
+
+    def search_after(self, q: str, after: int = 0, limit: int = 50, lemma: bool = False):
+        """One keyset page: (kind, total, terms, rows with ids, next cursor or None).
+
+        `after` is the last verse id of the previous page (0 for the first);
+        the page costs the same however deep it is. Totals and pages are
+        memoized in the result cache. A Strong's code on a DB built without
+        Strong's data has no matches, as on the HTML Strong's page.
+        """
+        if self.kind(q, lemma) == "strongs" and not self.strongs:
+            return "strongs", 0, None, [], None
+
+        def compute_page():
+            if self._is_wildcard(q, lemma=lemma):
+                ids = self.page_ids(self.wildcard_ids(q)[0], limit + 1, after=after)
+                with self.db() as conn:
+                    return "wildcard", list(iter_verses_by_id(conn, ids[:limit], with_id=True)), ids[limit - 1] if len(ids) > limit else None
+            with self.db() as conn:
+                ids = list(islice(iter_search_ids(conn, q, lemma, self.terms, after), limit + 1))
+                rows = list(iter_verses_by_id(conn, ids[:limit], with_id=True))
+                return search_kind(conn, q, lemma), rows, ids[limit - 1] if len(ids) > limit else None
+        key = q.strip().upper() if _RE_STRONGS.match(q.strip()) else q
+        total, terms = self.total(key, lemma=lemma)
+        kind, rows, cursor = self.cached("after-lemma" if lemma else "after", key, limit, after, compute_page)
+        return kind, total, terms, rows, cursor
+
+    def total(self, q: str, kind=None, lemma: bool = False):
+        # Cached (total verses, highlight terms) of a query; `kind` forces the index as the HTML modes do
+        if kind == "wildcard" or (kind is None and self._is_wildcard(q, lemma=lemma)):
+            ids, terms = self.wildcard_ids(q)
+            return len(ids), terms
+
+        def compute():
+            with self.db() as conn:
+                try:
+                    return search_total(conn, q, lemma, self.terms, kind)
+                except sqlite3.OperationalError:  # malformed FTS query
+                    return 0, None
+        return self.cached("total-" + (kind or ("lemma" if lemma else "auto")), q, 0, 0, compute)
+
+    def verse_id_at(self, book_id: int, chap: int, verse: int) -> int:
+        # Id of the last verse at or before (book_id, chapter, verse); ids follow that order (0 if none)
+        with self.db() as conn:
+            r = conn.execute(
+                "SELECT id FROM verses WHERE (book_id, chapter, verse) <= (?, ?, ?) "
+                "ORDER BY book_id DESC, chapter DESC, verse DESC LIMIT 1",
+                (book_id, chap, verse),
+            ).fetchone()
+        return int(r[0]) if r else 0
+
+    def search_keyset(self, q: str, kind: str, limit: int = 100, after: int = 0, before: int = 0):
+        """(total, rows, terms) for the page after / before a verse id cursor.
+
+        `kind` is the HTML search mode (strongs, lemma, wildcard, fts or
+        word). Pages are read by seeking to the cursor, so page 50 costs
+        what page 1 does; totals come from the cached count. The last page
+        (before=LAST_PAGE) holds the remainder, as with offsets, so Prev
+        links from it land on the same page boundaries.
+        """
+        q = " ".join(q.split())
+        if kind == "strongs":
+            q = q.upper()
+            total, terms = self.count_strongs(q), None
+        elif (kind == "lemma" and not self.lemmas) or (kind == "fts" and not self.fts):
+            return 0, [], None
+        elif kind == "wildcard":
+            matched, terms = self.wildcard_ids(q)
+            total = len(matched)
+        else:
+            total, terms = self.total(q, kind)
+        if before == LAST_PAGE and total:
+            limit = total - (total - 1) // limit * limit
+        if kind == "strongs":
+            return total, self.search_strongs_with_count(q, limit, after=after, before=before), None
+        key = q if kind == "fts" else normalize_token(fix_encoding_artifacts(q))
+
+        def compute():
+            with self.db() as conn:
+                try:
+                    if kind == "fts":
+                        return search_fts(conn, q, limit=limit, highlight=True, after=after, before=before)
+                    if kind == "wildcard":
+                        return list(iter_verses_by_id(conn, self.page_ids(matched, limit, after=after, before=before)))
+                    if before:
+                        ids = search_ids_before(conn, q, before, limit, tdict=self.terms, kind=kind)
+                    else:
+                        ids = list(islice(iter_search_ids(conn, q, tdict=self.terms, after=after, kind=kind), limit))
+                    return list(iter_verses_by_id(conn, ids))
+                except sqlite3.OperationalError:
+                    return []
+        return total, self.cached(f"{kind}-{'before' if before else 'after'}", key, limit, before or after, compute), terms
+
+    def page_sources(self):
+        # (page cache key, render) for /books and every chapter, in canonical order
+        yield ("books",), lambda: render_books(self.books())
+        for bid, maxc in sorted(self.chapters.items()):
+            for chap in range(1, maxc + 1):
+                yield ("chapter", bid, chap), self.chapter_renderer(bid, chap)
+
+    def chapter_renderer(self, bid: int, chap: int):
+        return lambda: render_chapter(bid, chap, self.max_chapter(bid), self.verses_in_chapter(bid, chap))
+
+    def warm_pages(self) -> int:
+        """Pre-render /books and the chapters, with their compressed copies, into the page cache.
+
+        Stops when the next page would not fit in the cache's byte bound;
+        pages left out are rendered on first request. Returns pages stored
+        (none when the page cache is off).
+        """
+        if self.pages.max_bytes <= 0:
+            return 0
+        codings = (None, "gzip") + (("br",) if brotli is not None else ())
+        stored = 0
+        for key, render in self.page_sources():
+            if stored and self.pages.bytes + self.pages.bytes / stored > self.pages.max_bytes:
+                break
+            for coding in codings:
+                self.pages.page(key, render, coding)
+            stored += 1
+        return stored
+
+    def cached(self, kind: str, q: str, limit: int, offset: int, compute):
+        # Memoize one results page under (mode, normalized query, offset, limit)
+        key = (kind, q, offset, limit)
+        generation = self.cache.generation
+        value = self.cache.get(key)
+        if value is None:
+            value = compute()
+            self.cache.put(key, value, _result_size(value), generation)
+        return value
+
+    def postings(self, conn: sqlite3.Connection, q: str):
+        # (df, blob, skips) for the query word's precomputed posting list, or None if the word never occurs
         norm = normalize_token(fix_encoding_artifacts(q))
-        return self.conn.execute(
-            """
-            SELECT b.name, v.book_id, v.chapter, v.verse, v.text
-            FROM tokens t
-            JOIN verses v ON v.id = t.verse_id
-            JOIN books b ON b.id = v.book_id
-            WHERE t.normalized = ?
-            GROUP BY v.id
-            ORDER BY v.book_id, v.chapter, v.verse
-            LIMIT ?
-            """,
-            (norm, limit),
-        ).fetchall()
-
-    def search_strongs_with_count(self, code: str, limit: int = 100, offset: int = 0):
+        r = conn.execute("SELECT term_id FROM lexicon WHERE normalized = ?", (norm,)).fetchone()
+        if not r:
+            return None
+        return conn.execute("SELECT df, verses, skips FROM postings WHERE term_id = ?", (int(r[0]),)).fetchone()
+
+    def search_page(self, q: str, limit: int = 100, offset: int = 0):
+        norm = normalize_token(fix_encoding_artifacts(q))
+        return self.cached("word", norm, limit, offset, lambda: self._search_page(norm, limit, offset))
+
+    def _search_page(self, q: str, limit: int, offset: int):
+        # (total, rows): total is the stored document frequency, rows a slice of the posting list
+        with self.db() as conn:
+            p = self.postings(conn, q)
+            if not p:
+                return 0, []
+            df, blob, skips = p
+            ids = decode_postings(blob, skips, offset, offset + limit)
+            return int(df), list(iter_verses_by_id(conn, ids))
+
+    def search_fts_page(self, q: str, limit: int = 100, offset: int = 0, rank: bool = False):
+        q = " ".join(q.split())
+        return self.cached("fts-rank" if rank else "fts", q, limit, offset, lambda: self._search_fts_page(q, limit, offset, rank))
+
+    def _search_fts_page(self, q: str, limit: int, offset: int, rank: bool):
+        # (total, rows) for phrase/NEAR/prefix/boolean queries; rows carry <mark> highlights
+        if not self.fts:
+            return 0, []
+        with self.db() as conn:
+            try:
+                total = count_fts(conn, q)
+                rows = search_fts(conn, q, limit=limit, offset=offset, rank=rank, highlight=True) if total else []
+            except sqlite3.OperationalError:
+                return 0, []
+        return total, rows
+
+    def kind(self, q: str, lemma: bool = False) -> str:
+        # search_kind() from the indexes found at open, without a connection
+        if _RE_STRONGS.match(q.strip().upper()):
+            return "strongs"
+        if lemma and self.lemmas:
+            return "lemma"
+        if is_wildcard_query(q):
+            return "wildcard"
+        if is_fts_query(q) and self.fts:
+            return "fts"
+        return "word"
+
+    def _is_wildcard(self, q: str, lemma: bool = False) -> bool:
+        # Whether search_kind() would answer `q` from the expanded wildcard terms
+        return self.kind(q, lemma) == "wildcard"
+
+    def wildcard_ids(self, q: str):
+        """(sorted verse ids, matched terms) of a * / ? pattern, memoized per pattern.
+
+        Merging the expanded posting lists is the expensive part (a few
+        hundred ms for *e*), so it is done once and every page, total,
+        cursor and export of the pattern slices the cached list.
+        """
+        def compute():
+            with self.db() as conn:
+                ids, terms = wildcard_ids(conn, q, self.terms)
+            return array("I", ids), terms
+        return self.cached("wildcard-ids", normalize_token(fix_encoding_artifacts(q)), 0, 0, compute)
+
+    @staticmethod
+    def page_ids(ids, limit: int, offset: int = 0, after: int = 0, before: int = 0):
+        # Up to `limit` of the sorted ids from an offset, after a verse id, or before one (the page preceding it)
+        if before:
+            stop = bisect_left(ids, before)
+            return list(ids[max(0, stop - limit):stop])
+        start = bisect_left(ids, after + 1) if after else offset
+        return list(ids[start:start + limit])
+
+    def search_wildcard_page(self, q: str, limit: int = 100, offset: int = 0):
+        # (total, rows, matched terms) for a single-word * / ? pattern
+        def compute():
+            ids, terms = self.wildcard_ids(q)
+            with self.db() as conn:
+                return len(ids), list(iter_verses_by_id(conn, self.page_ids(ids, limit, offset))), terms
+        return self.cached("wildcard", normalize_token(fix_encoding_artifacts(q)), limit, offset, compute)
+
+    def search_lemma_page(self, q: str, limit: int = 100, offset: int = 0):
+        # (total, rows, forms) across every inflection of the query word
+        if not self.lemmas:
+            return 0, [], []
+
+        def compute():
+            with self.db() as conn:
+                return search_by_lemma(conn, q, limit=limit, offset=offset)
+        return self.cached("lemma", normalize_token(fix_encoding_artifacts(q)), limit, offset, compute)
+
+    def search(self, q: str, limit: int = 100):
+        if is_wildcard_query(q):
+            return self.search_wildcard_page(q, limit=limit)[1]
+        if is_fts_query(q) and self.fts:
+            with self.db() as conn:
+                try:
+                    return search_fts(conn, q, limit=limit)
+                except sqlite3.OperationalError:
+                    return []
+        return self.search_page(q, limit=limit)[1]
+
+    def stream(self, q: str, limit: int = 1000, lemma: bool = False):
+        """(total, highlight terms, row iterator) for an export of `q`.
+
+        The total comes from the cached count (a wildcard's from its memoized
+        id list, which the rows then walk instead of merging again). Rows
+        are read lazily on a connection of their own, so a slow download
+        never holds one of the pooled connections; that connection is only
+        opened once the first row is asked for and is closed when the
+        iterator is exhausted or closed.
+        """
+        with self.metrics.query():
+            total, terms = self.total(q, lemma=lemma)
+        if limit is not None and limit >= 0:
+            total = min(total, limit)
+
+        def rows_then_close():
+            # Rows are read while the response is written; only the reads count as the request's SQL time
+            if not total:  # no match, or a malformed FTS query
+                return
+            spent, clock = 0.0, time.perf_counter
+            conn = self.pool.open()
+            try:
+                if self._is_wildcard(q, lemma=lemma):
+                    ids = iter(self.wildcard_ids(q)[0])
+                else:
+                    ids = iter_search_ids(conn, q, lemma, self.terms)
+                rows = iter_rows_by_ids(conn, islice(ids, total))
+                while True:
+                    t = clock()
+                    row = next(rows, None)
+                    spent += clock() - t
+                    if row is None:
+                        return
+                    yield row
+            finally:
+                self.metrics.add_sql(spent)
+                conn.close()
+        return total, terms, rows_then_close()
+
+    def search_strongs_with_count(self, code: str, limit: int = 100, offset: int = 0, after: int = 0, before: int = 0):
+        # Rows (book, book_id, chapter, verse, text, occurrences); `after` / `before` are keyset cursors (verse ids)
         code = (code or '').strip().upper()
         if not _RE_STRONGS.match(code):
             return []
+        kind = "strongs-before" if before else "strongs-after" if after else "strongs"
+        return self.cached(kind, code, limit, before or after or offset,
+                           lambda: self._search_strongs_with_count(code, limit, offset, after, before))
+
+    def _search_strongs_with_count(self, code: str, limit: int, offset: int, after: int = 0, before: int = 0):
+        # Verse ids are in canonical order, so grouping and ordering by s.verse_id walks (code, verse_id) without sorting
         try:
-            return self.conn.execute(
-                """
-                SELECT b.name, v.book_id, v.chapter, v.verse, v.text, COUNT(*) as cnt
-                FROM strongs s
-                JOIN verses v ON v.id = s.verse_id
-                JOIN books b ON b.id = v.book_id
-                WHERE s.code = ?
-                GROUP BY v.id
-                ORDER BY v.book_id, v.chapter, v.verse
-                LIMIT ? OFFSET ?
-                """,
-                (code, limit, offset),
-            ).fetchall()
+            with self.db() as conn:
+                rows = conn.execute(
+                    f"""
+                    SELECT b.name, v.book_id, v.chapter, v.verse, v.text, COUNT(*) as cnt
+                    FROM strongs s
+                    JOIN verses v ON v.id = s.verse_id
+                    JOIN books b ON b.id = v.book_id
+                    WHERE s.code = ? AND s.verse_id > ? AND s.verse_id < ?
+                    GROUP BY s.verse_id
+                    ORDER BY s.verse_id{" DESC" if before else ""}
+                    LIMIT ? OFFSET ?
+                    """,
+                    (code, after, before or 1 << 62, limit, offset),
+                ).fetchall()
         except Exception:
             return []
+        return rows[::-1] if before else rows
 
     def count_strongs(self, code: str) -> int:
         code = (code or '').strip().upper()
         if not _RE_STRONGS.match(code):
             return 0
-        try:
-            r = self.conn.execute("SELECT COUNT(DISTINCT verse_id) FROM strongs WHERE code=?", (code,)).fetchone()
-            return int(r[0] or 0)
-        except Exception:
-            return 0
+
+        def compute():
+            try:
+                with self.db() as conn:
+                    r = conn.execute("SELECT COUNT(DISTINCT verse_id) FROM strongs WHERE code=?", (code,)).fetchone()
+                return int(r[0] or 0)
+            except Exception:
+                return 0
+        return self.cached("strongs-count", code, 0, 0, compute)
 
     def search_strongs(self, code: str, limit: int = 100, offset: int = 0):
         code = (code or '').strip().upper()
         if not _RE_STRONGS.match(code):
             return []
         try:
-            return self.conn.execute(
-                """
-                SELECT b.name, v.book_id, v.chapter, v.verse, v.text
-                FROM strongs s
-                JOIN verses v ON v.id = s.verse_id
-                JOIN books b ON b.id = v.book_id
-                WHERE s.code = ?
-                GROUP BY v.id
-                ORDER BY v.book_id, v.chapter, v.verse
-                LIMIT ? OFFSET ?
-                """,
-                (code, limit, offset),
-            ).fetchall()
+            with self.db() as conn:
+                return conn.execute(
+                    """
+                    SELECT b.name, v.book_id, v.chapter, v.verse, v.text
+                    FROM strongs s
+                    JOIN verses v ON v.id = s.verse_id
+                    JOIN books b ON b.id = v.book_id
+                    WHERE s.code = ?
+                    GROUP BY v.id
+                    ORDER BY v.book_id, v.chapter, v.verse
+                    LIMIT ? OFFSET ?
+                    """,
+                    (code, limit, offset),
+                ).fetchall()
         except Exception:
             return []
 
 
+class Server(ThreadingHTTPServer):
+    # The default listen backlog of 5 makes bursts of clients wait on SYN retries (1s, 3s, ...)
+    request_queue_size = 128
+
+
+def html_head(title: str) -> str:
+    return f"<!doctype html><meta charset='utf-8'><title>{title}</title>{BASE_STYLE}"
+
+
 def html_page(title: str, body: str) -> bytes:
-    doc = f"<!doctype html><meta charset='utf-8'><title>{title}</title>{BASE_STYLE}{body}"
-    return doc.encode("utf-8")
+    return (html_head(title) + body).encode("utf-8")
+
+
+def render_books(books) -> bytes:
+    items = []
+    for bid, name in books:
+        items.append(f"<a href='/chapter?book_id={bid}&chap=1'>{name}</a>")
+    brand = "<div class='brand'><a href='/'><strong>Albanian Concordance</strong></a></div>"
+    body = [
+        f"<header>{brand}<span class='muted'>Books</span></header>",
+        f"<div class='books'>{''.join(items)}</div>",
+    ]
+    return html_page("Books", "\n".join(body))
+
+
+def render_chapter(bid: int, chap: int, maxc: int, verses) -> bytes:
+    nav = []
+    for c in range(1, maxc + 1):
+        if c == chap:
+            nav.append(f"<strong>{c}</strong>")
+        else:
+            nav.append(f"<a href='/chapter?book_id={bid}&chap={c}'>{c}</a>")
+    lines = []
+    for text, vno, bname in verses:
+        t = unicodedata.normalize("NFC", text)
+        lines.append(f"<div class='res'><strong>{map_book(bname)} {chap}:{vno}</strong> — {t}</div>")
+    brand = "<div class='brand'><a href='/'><strong>Albanian Concordance</strong></a></div>"
+    body = [
+        f"<header>{brand}<a href='/books'>Books</a></header>",
+        f"<nav class='chapters'>{' '.join(nav)}</nav>",
+        "\n".join(lines) or "<p class='muted'>No verses.</p>",
+    ]
+    return html_page("Chapter", "\n".join(body))
+
+
+# Responses smaller than this are sent uncompressed (headers would eat the gain)
+COMPRESS_MIN_BYTES = 1024
+# Routes whose body depends only on the build; their compressed bytes are kept after the first request
+# (/books and /chapter live in App.pages)
+PRECOMPRESSED_ROUTES = ("/", "/index")
+
+
+def parse_accept_encoding(header: str):
+    # {coding: q} from an Accept-Encoding header
+    prefs = {}
+    for part in (header or "").split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        prefs[name] = q
+    return prefs
+
+
+def is_fts_syntax_error(e: sqlite3.Error) -> bool:
+    # A MATCH expression SQLite rejected (fts5 syntax, unknown column filter), as opposed to a database fault
+    return isinstance(e, FtsSyntaxError) or str(e).startswith(("fts5:", "no such column:", "unknown special query:", "unterminated string"))
+
+
+# Content codings send_cache_headers() may append to an ETag ("<tag>-gzip")
+ETAG_CODINGS = ("gzip", "br")
+
+
+def choose_encoding(header: str):
+    # Best coding we can produce: brotli when installed, else gzip; None for identity
+    prefs = parse_accept_encoding(header)
+    for coding in (("br", "gzip") if brotli is not None else ("gzip",)):
+        q = prefs.get(coding, prefs.get("*", 0.0))
+        if q > 0:
+            return coding
+    return None
+
+
+def is_textual(content_type: str) -> bool:
+    # Bodies worth compressing (HTML, CSV, plain text, JSON)
+    return content_type.startswith("text/") or content_type.startswith("application/json")
+
+
+def compress(data: bytes, coding: str, best: bool = False) -> bytes:
+    # `best` trades CPU for size; used once per precompressed static body
+    if coding == "br":
+        return brotli.compress(data, quality=11 if best else 5)
+    return gzip.compress(data, compresslevel=9 if best else 6, mtime=0)
+
+
+# Streamed bodies are written in frames of about this size (one chunk each)
+STREAM_CHUNK_BYTES = 16 * 1024
+
+
+class _BrotliStream:
+    # brotli.Compressor behind zlib's compress()/flush() interface
+    def __init__(self):
+        self._c = brotli.Compressor(quality=5)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._c.process(data)
+
+    def flush(self) -> bytes:
+        return self._c.finish()
+
+
+def stream_compressor(coding: str):
+    # Incremental encoder for a streamed body; wbits=31 makes zlib write a gzip container
+    if coding == "br":
+        return _BrotliStream()
+    return zlib.compressobj(6, zlib.DEFLATED, 31)
+
+
+# Cache-Control per route; every response of these routes also carries an ETag and Last-Modified
+CACHE_POLICIES = {
+    "/": "public, max-age=3600",
+    "/index": "public, max-age=3600",
+    "/books": "public, max-age=86400",  # static for a given build
+    "/chapter": "public, max-age=86400",
+    "/search": "public, max-age=300",
+    "/export": "no-cache",  # downloads: always revalidate, but 304 when unchanged
+    "/logo": "public, max-age=31536000, immutable",  # URL carries the image hash
+    "/api/search": "public, max-age=300",
+    "/api/chapter": "public, max-age=86400",
+    "/api/strongs/": "public, max-age=86400",  # any /api/strongs/<code>
+    "/api/verses": "public, max-age=86400",
+}
+
+
+def cache_policy(path: str):
+    # Exact route, else its parent with a trailing slash (/api/strongs/H0430 -> /api/strongs/)
+    return CACHE_POLICIES.get(path) or CACHE_POLICIES.get(path.rsplit("/", 1)[0] + "/")
+
+
+# JSON API: fields of a verse, in the order used by compact (array) responses
+API_FIELDS = ("id", "book", "book_id", "chapter", "verse", "text")
+API_MAX_LIMIT = 500
+
+
+def api_verses(rows, compact: bool = False):
+    # (id, book, book_id, chapter, verse, text) rows as objects, or as bare arrays when compact
+    out = [(vid, map_book(book), bid, chap, ver, unicodedata.normalize("NFC", text)) for vid, book, bid, chap, ver, text in rows]
+    return [list(r) for r in out] if compact else [dict(zip(API_FIELDS, r)) for r in out]
+
+
+def json_bytes(obj) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class _MeteredWriter:
+    """wfile wrapper adding up the bytes and seconds a request spends writing to the client."""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.bytes = 0
+        self.seconds = 0.0
+
+    def write(self, data) -> int:
+        t = time.perf_counter()
+        try:
+            return self.raw.write(data)
+        finally:
+            self.seconds += time.perf_counter() - t
+            self.bytes += len(data)
+
+    def __getattr__(self, name):
+        return getattr(self.raw, name)
 
 
 class Handler(BaseHTTPRequestHandler):
+    # HTTP/1.1 for chunked exports (and keep-alive); every other response carries a Content-Length
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; without TCP_NODELAY a kept-alive reply waits on the delayed ACK (~40 ms)
+    disable_nagle_algorithm = True
     app: App = None  # set at server start
-    logo_data_uri: str = None  # set at server start
+    logo: tuple = None  # (bytes, mime, version), set at server start
+    precompressed: dict = {}  # (path, coding) -> compressed body of a PRECOMPRESSED_ROUTES page
+    precompressed_lock = threading.Lock()
+
+    def parse_request(self):
+        # A request line has been read: start its clock and meter the writes that answer it
+        self.started = time.perf_counter()
+        self.status = None
+        self.wfile = _MeteredWriter(getattr(self.wfile, "raw", self.wfile))
+        return super().parse_request()
+
+    def send_response(self, code, message=None):
+        self.status = code
+        super().send_response(code, message)
 
     def do_GET(self):
         parsed = urlparse(self.path)
         qs = parse_qs(parsed.query)
         path = parsed.path
+        self.app.refresh()
+        metrics = self.app.metrics
+        metrics.begin(self.path)
+        start = time.perf_counter()
+        try:
+            self.route(path, qs)
+        except Exception:
+            if self.status is not None:
+                raise  # part of a response is out; the server drops the connection
+            self.log_error("error serving %s:\n%s", self.path, traceback.format_exc())
+            self.send_error(500, "Internal Server Error")
+        finally:
+            wfile = self.wfile
+            metrics.observe(metric_route(path), self.status or 500, start - self.started, time.perf_counter() - start,
+                            wfile.seconds, wfile.bytes)
 
+    def route(self, path: str, qs):
+        self.cache_headers = self.validators(path, qs)
+        if self.cache_headers and self.not_modified():
+            return
         if path in ("/", "/index"):
             self.respond_index()
         elif path == "/books":
@@ -261,17 +1229,173 @@ class Handler(BaseHTTPRequestHandler):
             self.respond_search_paged(qs)
         elif path == "/export":
             self.respond_export(qs)
+        elif path == "/logo" and self.logo:
+            self.send_body(self.logo[0], self.logo[1])
+        elif path.startswith("/api/"):
+            self.respond_api(path, qs)
+        elif path == "/metrics":
+            self.send_body(self.app.metrics_text(), "text/plain; version=0.0.4; charset=utf-8")
         else:
             self.send_error(404, "Not Found")
 
+    def validators(self, path: str, qs):
+        # ETag / Last-Modified / Cache-Control for a cacheable route; the ETag covers the build and the sorted parameters
+        policy = cache_policy(path)
+        if policy is None:
+            return []
+        params = urlencode(sorted((k, v) for k, vs in qs.items() for v in vs))
+        # The index page links the logo by its hash, so a new logo must change the page's ETag too
+        logo = self.logo[2] if self.logo and path in ("/", "/index") else ""
+        digest = hashlib.sha1(f"{self.app.build_id}|{path}|{params}|{logo}".encode("utf-8")).hexdigest()[:20]
+        return [
+            ("ETag", f'"{digest}"'),
+            ("Last-Modified", formatdate(self.app.built_at, usegmt=True)),
+            ("Cache-Control", policy),
+        ]
+
+    def not_modified(self) -> bool:
+        # Answer 304 when the client's validators still match (If-None-Match wins over If-Modified-Since)
+        etag = self.cache_headers[0][1]
+        inm = self.headers.get("If-None-Match")
+        if inm is not None:
+            # Compare ignoring the -gzip/-br suffix: every encoding of the same body is equally fresh
+            variants = {etag} | {f'{etag[:-1]}-{coding}"' for coding in ETAG_CODINGS}
+            tags = [t.strip().removeprefix("W/") for t in inm.split(",")]
+            matched = [t for t in tags if t in variants]
+            fresh = inm.strip() == "*" or bool(matched)
+            if matched:
+                etag = matched[0]
+        else:
+            ims = self.headers.get("If-Modified-Since")
+            try:
+                fresh = ims is not None and parsedate_to_datetime(ims).timestamp() >= self.app.built_at
+            except (TypeError, ValueError):
+                fresh = False
+        if fresh:
+            self.send_response(304)
+            self.send_cache_headers(etag=etag)
+            self.end_headers()
+        return fresh
+
+    def send_cache_headers(self, coding=None, etag=None):
+        for name, value in self.cache_headers:
+            if name == "ETag":
+                # A strong ETag names one representation, so each encoding gets its own
+                value = etag or (f'{value[:-1]}-{coding}"' if coding else value)
+            self.send_header(name, value)
+
+    def send_body(self, data: bytes, content_type: str, headers=()):
+        """Send a 200 with validators, compressing text bodies the client accepts.
+
+        Bodies under COMPRESS_MIN_BYTES and images go out as-is; pages of
+        PRECOMPRESSED_ROUTES are compressed once at the best level and reused.
+        """
+        coding = None
+        textual = is_textual(content_type)
+        if textual and len(data) >= COMPRESS_MIN_BYTES:
+            coding = choose_encoding(self.headers.get("Accept-Encoding", ""))
+        if coding:
+            path = urlparse(self.path).path
+            if path in PRECOMPRESSED_ROUTES:
+                key = (path, coding)
+                with self.precompressed_lock:
+                    packed = self.precompressed.get(key)
+                if packed is None:
+                    packed = compress(data, coding, best=True)
+                    with self.precompressed_lock:
+                        self.precompressed[key] = packed
+                data = packed
+            else:
+                data = compress(data, coding)
+        self.send_encoded(data, content_type, coding, headers)
+
+    def send_page(self, key, render, content_type: str = "text/html; charset=utf-8"):
+        # A rendered page out of App.pages (/books, /chapter, /api/chapter), in the best coding the client accepts
+        coding = choose_encoding(self.headers.get("Accept-Encoding", ""))
+        data, coding = self.app.pages.page(key, render, coding)
+        self.send_encoded(data, content_type, coding)
+
+    def send_encoded(self, data: bytes, content_type: str, coding=None, headers=()):
+        textual = is_textual(content_type)
+        self.send_response(200)
+        self.send_cache_headers(coding)
+        self.send_header("Content-Type", content_type)
+        if textual:
+            self.send_header("Vary", "Accept-Encoding")
+        if coding:
+            self.send_header("Content-Encoding", coding)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def send_stream(self, chunks, content_type: str, headers=()):
+        """Send a 200 whose body is produced piece by piece by `chunks` (str).
+
+        HTTP/1.1 clients get Transfer-Encoding: chunked, HTTP/1.0 clients a
+        body ended by closing the connection. Pieces are gathered into
+        STREAM_CHUNK_BYTES frames and compressed on the fly, so memory does
+        not depend on the length of the body.
+        """
+        coding = choose_encoding(self.headers.get("Accept-Encoding", ""))
+        packer = stream_compressor(coding) if coding else None
+        chunked = self.request_version != "HTTP/1.0"
+        self.send_response(200)
+        self.send_cache_headers(coding)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Vary", "Accept-Encoding")
+        if coding:
+            self.send_header("Content-Encoding", coding)
+        for name, value in headers:
+            self.send_header(name, value)
+        if chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+        else:
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+
+        def emit(data: bytes):
+            if not data:
+                return
+            self.wfile.write(b"%X\r\n%s\r\n" % (len(data), data) if chunked else data)
+
+        buf, size = [], 0
+        try:
+            for piece in chunks:
+                data = piece.encode("utf-8")
+                buf.append(data)
+                size += len(data)
+                if size >= STREAM_CHUNK_BYTES:
+                    data, buf, size = b"".join(buf), [], 0
+                    emit(packer.compress(data) if packer else data)
+            data = b"".join(buf)
+            emit(packer.compress(data) + packer.flush() if packer else data)
+            if chunked:
+                self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True  # client went away mid-download
+        except Exception as e:
+            # The 200 and part of the body are already out, so no error page can follow;
+            # drop the connection so the client sees a truncated download, not a complete one
+            self.close_connection = True
+            self.log_error("stream for %s failed after headers: %r", self.path, e)
+        finally:
+            close = getattr(chunks, "close", None)
+            if close:
+                close()
+
     def respond_index(self):
-        logo = self.logo_data_uri
+        logo = f"/logo?v={self.logo[2]}" if self.logo else None
         brand = "<div class='brand'><a href='/'><strong>Albanian Concordance</strong></a></div>"
         left = f"<div class='intro-left'><img class='hero-image' src='{logo}' alt='Albanian Concordance'/></div>" if logo else ""
         right = (
             "<div class='intro-right'>"
-            + "<nav class='muted'>Search a word (accent-insensitive, e.g., 'dashuri')</nav>"
-            + "<form method='get' action='/search'><input type='text' name='q' placeholder='Kerko fjalen...' autofocus><input type='submit' value='Search'></form>"
+            + "<nav class='muted'>Search a word (accent-insensitive, e.g., 'dashuri'), a phrase (\"biri i njeriut\"), wildcards (perend*, *ise, per?ndi), proximity (jezu NEAR/3 krisht) or AND/OR/NOT; tick 'all forms' to match every inflection (perendia → perendise, perendine...)</nav>"
+            + "<form method='get' action='/search'><input type='text' name='q' placeholder='Kerko fjalen...' autofocus><input type='submit' value='Search'>"
+            + " <label class='muted'><input type='checkbox' name='mode' value='lemma'> all forms</label>"
+            + " <label class='muted'><input type='checkbox' name='sort' value='rank'> sort by relevance</label></form>"
             + "</div>"
         )
         row = f"<div class='intro-row'>{left}{right}</div>"
@@ -283,16 +1407,7 @@ class Handler(BaseHTTPRequestHandler):
         self.respond_html("Concordance", "\n".join(body))
 
     def respond_books(self):
-        books = self.app.books()
-        items = []
-        for bid, name in books:
-            items.append(f"<a href='/chapter?book_id={bid}&chap=1'>{name}</a>")
-        brand = "<div class='brand'><a href='/'><strong>Albanian Concordance</strong></a></div>"
-        body = [
-            f"<header>{brand}<span class='muted'>Books</span></header>",
-            f"<div class='books'>{''.join(items)}</div>",
-        ]
-        self.respond_html("Books", "\n".join(body))
+        self.send_page(("books",), lambda: render_books(self.app.books()))
 
     def respond_chapter(self, qs):
         try:
@@ -301,25 +1416,23 @@ class Handler(BaseHTTPRequestHandler):
         except Exception:
             self.send_error(400, "Invalid book_id/chap")
             return
-        verses = self.app.verses_in_chapter(bid, chap)
-        maxc = self.app.max_chapter(bid)
-        nav = []
-        for c in range(1, maxc + 1):
-            if c == chap:
-                nav.append(f"<strong>{c}</strong>")
-            else:
-                nav.append(f"<a href='/chapter?book_id={bid}&chap={c}'>{c}</a>")
-        lines = []
-        for text, vno, bname in verses:
-            t = unicodedata.normalize("NFC", text)
-            lines.append(f"<div class='res'><strong>{map_book(bname)} {chap}:{vno}</strong> — {t}</div>")
-        brand = "<div class='brand'><a href='/'><strong>Albanian Concordance</strong></a></div>"
-        body = [
-            f"<header>{brand}<a href='/books'>Books</a></header>",
-            f"<nav class='chapters'>{' '.join(nav)}</nav>",
-            "\n".join(lines) or "<p class='muted'>No verses.</p>",
-        ]
-        self.respond_html("Chapter", "\n".join(body))
+        render = self.app.chapter_renderer(bid, chap)
+        if 1 <= chap <= self.app.max_chapter(bid):
+            self.send_page(("chapter", bid, chap), render)
+        else:
+            self.send_body(render(), "text/html; charset=utf-8")
+
+    def search_cursor(self, qs):
+        # ("after" | "before", verse id) from a book_id.chapter.verse cursor ("before=end" is the last page), or None
+        for direction in ("after", "before"):
+            raw = (qs.get(direction, [""])[0] or "").strip()
+            if direction == "before" and raw == "end":
+                return direction, LAST_PAGE
+            parts = raw.split(".")
+            if len(parts) == 3 and all(p.isdigit() for p in parts):
+                vid = self.app.verse_id_at(*map(int, parts))
+                return (direction, vid) if vid else None
+        return None
 
     def respond_search_paged(self, qs):
         q = (qs.get("q", [""])[0] or "").strip()
@@ -340,52 +1453,65 @@ class Handler(BaseHTTPRequestHandler):
         if page < 1:
             page = 1
 
-        # total results (Strong's vs Albanian word)
+        # total results (Strong's, full-text query, or Albanian word)
         is_strongs = _RE_STRONGS.match(q.upper()) is not None
-        if is_strongs:
-            total = self.app.count_strongs(q)
+        mode = (qs.get("mode", [""])[0] or "").lower()
+        rank = (qs.get("sort", [""])[0] or "").lower() == "rank"
+        is_lemma = not is_strongs and mode == "lemma"
+        is_fts = not is_strongs and not is_lemma and (mode == "fts" or rank or (mode != "word" and is_fts_query(q)))
+        is_wild = not is_strongs and not is_lemma and not is_fts and is_wildcard_query(q)
+        terms = None
+        # Keyset paging: Next/Prev/Last links carry a book_id.chapter.verse cursor (after= / before=) instead of
+        # an offset; bm25 order (sort=rank) and bare ?page=N links still use OFFSET
+        cursor = None if rank else self.search_cursor(qs)
+        if cursor:
+            kind = "strongs" if is_strongs else "lemma" if is_lemma else "fts" if is_fts else "wildcard" if is_wild else "word"
+            direction, vid = cursor
+            total, rows, terms = self.app.search_keyset(q, kind, limit, **{direction: vid})
+            total_pages = max(1, (total + limit - 1) // limit)
+            if vid == LAST_PAGE:
+                page = total_pages
+            elif not rows and total:  # stale cursor past either end: show the last page
+                page = total_pages
+                total, rows, terms = self.app.search_keyset(q, kind, limit, before=LAST_PAGE)
+            page = min(page, total_pages)
         else:
-            conn = self.app.conn
-            cur = conn.cursor()
-            norm = normalize_token(fix_encoding_artifacts(q))
-            total = cur.execute(
-                """
-                SELECT COUNT(*) FROM (
-                  SELECT v.id
-                  FROM tokens t
-                  JOIN verses v ON v.id = t.verse_id
-                  WHERE t.normalized = ?
-                  GROUP BY v.id
-                )
-                """,
-                (norm,),
-            ).fetchone()[0]
-
-        total_pages = max(1, (total + limit - 1) // limit)
-        if page > total_pages:
-            page = total_pages
-        offset = (page - 1) * limit
-
-        # fetch page
-        if is_strongs:
-            rows = self.app.search_strongs_with_count(q, limit=limit, offset=offset)
-        else:
-            conn = self.app.conn
-            cur = conn.cursor()
-            norm = normalize_token(fix_encoding_artifacts(q))
-            rows = cur.execute(
-                """
-                SELECT b.name, v.book_id, v.chapter, v.verse, v.text
-                FROM tokens t
-                JOIN verses v ON v.id = t.verse_id
-                JOIN books b ON b.id = v.book_id
-                WHERE t.normalized = ?
-                GROUP BY v.id
-                ORDER BY v.book_id, v.chapter, v.verse
-                LIMIT ? OFFSET ?
-                """,
-                (norm, limit, offset),
-            ).fetchall()
+            if is_strongs:
+                total = self.app.count_strongs(q)
+            elif is_lemma:
+                total, rows, terms = self.app.search_lemma_page(q, limit=limit, offset=(page - 1) * limit)
+                if total and page > (total + limit - 1) // limit:
+                    page = (total + limit - 1) // limit
+                    total, rows, terms = self.app.search_lemma_page(q, limit=limit, offset=(page - 1) * limit)
+            elif is_wild:
+                total, rows, terms = self.app.search_wildcard_page(q, limit=limit, offset=(page - 1) * limit)
+                if total and page > (total + limit - 1) // limit:
+                    page = (total + limit - 1) // limit
+                    total, rows, terms = self.app.search_wildcard_page(q, limit=limit, offset=(page - 1) * limit)
+            elif is_fts:
+                total = None  # counted together with the page below
+            else:
+                total, rows = self.app.search_page(q, limit=limit, offset=(page - 1) * limit)
+                if total and page > (total + limit - 1) // limit:
+                    page = (total + limit - 1) // limit
+                    total, rows = self.app.search_page(q, limit=limit, offset=(page - 1) * limit)
+
+            if total is None:
+                # page bounds need the count first; clamp afterwards
+                total, rows = self.app.search_fts_page(q, limit=limit, offset=(page - 1) * limit, rank=rank)
+                total_pages = max(1, (total + limit - 1) // limit)
+                if page > total_pages:
+                    page = total_pages
+                    total, rows = self.app.search_fts_page(q, limit=limit, offset=(page - 1) * limit, rank=rank)
+            else:
+                total_pages = max(1, (total + limit - 1) // limit)
+                if page > total_pages:
+                    page = total_pages
+            offset = (page - 1) * limit
+
+            # fetch page (the other modes fetched theirs with the count)
+            if is_strongs:
+                rows = self.app.search_strongs_with_count(q, limit=limit, offset=offset)
 
         items = []
         if is_strongs:
@@ -396,28 +1522,42 @@ class Handler(BaseHTTPRequestHandler):
                 safe = unicodedata.normalize('NFC', text)
                 chip = f"<span class='tag strongs'>Strong's <mark>{Q}</mark> x {int(cnt or 1)}</span>"
                 items.append(f"<div class='res'><strong>{book} {chap}:{ver}</strong> {chip} - {safe}</div>")
+        elif is_fts:
+            # FTS5 highlight() already marked the matches
+            for book, bid, chap, ver, text in rows:
+                items.append(f"<div class='res'><strong>{book} {chap}:{ver}</strong> - {unicodedata.normalize('NFC', text)}</div>")
         else:
             for book, bid, chap, ver, text in rows:
-                h = highlight_text(text, q)
+                h = highlight_text(text, q, terms)
                 items.append(f"<div class='res'><strong>{book} {chap}:{ver}</strong> - {h}</div>")
+        if terms:
+            shown = ", ".join(terms[:30]) + (" ..." if len(terms) > 30 else "")
+            label = "forms" if is_lemma else "matching words"
+            items.insert(0, f"<p class='muted'>{len(terms)} {label}: {shown}</p>")
 
         # header + pagination controls (no logo in header)
         brand = "<div class='brand'><a href='/'><strong>Albanian Concordance</strong></a></div>"
 
         base = {'q': q, 'limit': str(limit)}
-        try:
-            # Python 3.11 supports dict unpack in f-strings context as below using explicit dict()
-            first_url = f"/search?{urlencode(dict(list(base.items()) + [('page','1')]))}"
-            prev_url = f"/search?{urlencode(dict(list(base.items()) + [('page', str(page-1))]))}" if page > 1 else None
-            next_url = f"/search?{urlencode(dict(list(base.items()) + [('page', str(page+1))]))}" if page < total_pages else None
-            last_url = f"/search?{urlencode(dict(list(base.items()) + [('page', str(total_pages))]))}"
-        except Exception:
-            # fallback
-            from urllib.parse import urlencode as _ue
-            first_url = f"/search?{_ue({'q': q, 'limit': str(limit), 'page': '1'})}"
-            prev_url = f"/search?{_ue({'q': q, 'limit': str(limit), 'page': str(page-1)})}" if page > 1 else None
-            next_url = f"/search?{_ue({'q': q, 'limit': str(limit), 'page': str(page+1)})}" if page < total_pages else None
-            last_url = f"/search?{_ue({'q': q, 'limit': str(limit), 'page': str(total_pages)})}"
+        if mode:
+            base['mode'] = mode
+        if rank:
+            base['sort'] = 'rank'
+
+        def page_url(n: int, **cursor) -> str:
+            return f"/search?{urlencode({**base, **cursor, 'page': str(n)})}"
+
+        def at(row) -> str:
+            return f"{row[1]}.{row[2]}.{row[3]}"  # book_id.chapter.verse of a result row
+        first_url = page_url(1)
+        if rank:
+            prev_url = page_url(page - 1) if page > 1 else None
+            next_url = page_url(page + 1) if page < total_pages else None
+            last_url = page_url(total_pages)
+        else:
+            prev_url = (page_url(page - 1, before=at(rows[0])) if page > 2 and rows else first_url) if page > 1 else None
+            next_url = page_url(page + 1, after=at(rows[-1])) if page < total_pages and rows else None
+            last_url = page_url(total_pages, before="end")
 
         nav = []
         nav.append(f"<a href='{first_url}'>First</a>")
@@ -428,11 +1568,24 @@ class Handler(BaseHTTPRequestHandler):
             nav.append(f"<a href='{next_url}'>Next</a>")
         nav.append(f"<a href='{last_url}'>Last</a>")
 
-        export_link = f"/export?{urlencode({'q': q, 'format':'html', 'limit': str(total)})}"
+        export_qs = {'q': q, 'format': 'html', 'limit': str(total)}
+        if is_lemma:
+            export_qs['mode'] = 'lemma'
+        export_link = f"/export?{urlencode(export_qs)}"
+        if items:
+            results = "\n".join(items)
+        elif is_fts and not self.app.fts:
+            results = "<p class='muted'>Phrase search needs the full-text index: python scripts/build_concordance.py build-fts</p>"
+        elif is_lemma and not self.app.lemmas:
+            results = "<p class='muted'>All-forms search needs the lemma index: python scripts/build_concordance.py build-lemmas</p>"
+        elif is_fts and fts_query_error(q):
+            results = f"<p class='muted'>Invalid search: {fts_query_error(q)}.</p>"
+        else:
+            results = "<p class='muted'>No results.</p>"
         body = [
             f"<header>{brand}<a href='/books'>Books</a></header>",
             f"<nav class='controls'>{' | '.join(nav)} | <a href='{export_link}'>Export all (HTML)</a></nav>",
-            ("\n".join(items) if items else "<p class='muted'>No results.</p>"),
+            results,
         ]
         self.respond_html(f"Search: {q}", "\n".join(body))
 
@@ -469,65 +1622,246 @@ class Handler(BaseHTTPRequestHandler):
             limit = int(qs.get("limit", ["1000"])[0])
         except Exception:
             limit = 1000
-        rows = self.app.search(q, limit=limit)
+        lemma = (qs.get("mode", [""])[0] or "").lower() == "lemma"
+        total, terms, rows = self.app.stream(q, limit=limit, lemma=lemma)
         if fmt == "txt":
-            content = [f"Results for '{q}' ({len(rows)} verses)"]
-            for book, _, chap, ver, text in rows:
-                content.append(f"- {book} {chap}:{ver} - {unicodedata.normalize('NFC', text)}")
-            data = ("\n".join(content) + "\n").encode("utf-8")
-            self.send_response(200)
-            self.send_header("Content-Type", "text/plain; charset=utf-8")
-            self.send_header("Content-Disposition", f"attachment; filename=search_{sanitize_name(q)}.txt")
-            self.send_header("Content-Length", str(len(data)))
-            self.end_headers()
-            self.wfile.write(data)
+            def lines():
+                yield f"Results for '{q}' ({total} verses)\n"
+                with closing(rows):
+                    for book, _, chap, ver, text in rows:
+                        yield f"- {book} {chap}:{ver} - {unicodedata.normalize('NFC', text)}\n"
+            self.send_stream(lines(), "text/plain; charset=utf-8",
+                             [("Content-Disposition", f"attachment; filename=search_{sanitize_name(q)}.txt")])
             return
         if fmt == "csv":
             # Simple CSV; escape commas by quoting with double quotes
-            lines = ["book,chapter,verse,text"]
-            for book, _, chap, ver, text in rows:
-                t = unicodedata.normalize('NFC', text).replace('"', '""')
-                lines.append(f'"{book}",{chap},{ver},"{t}"')
-            data = ("\n".join(lines) + "\n").encode("utf-8")
-            self.send_response(200)
-            self.send_header("Content-Type", "text/csv; charset=utf-8")
-            self.send_header("Content-Disposition", f"attachment; filename=search_{sanitize_name(q)}.csv")
-            self.send_header("Content-Length", str(len(data)))
-            self.end_headers()
-            self.wfile.write(data)
+            def lines():
+                yield "book,chapter,verse,text\n"
+                with closing(rows):
+                    for book, _, chap, ver, text in rows:
+                        t = unicodedata.normalize('NFC', text).replace('"', '""')
+                        yield f'"{book}",{chap},{ver},"{t}"\n'
+            self.send_stream(lines(), "text/csv; charset=utf-8",
+                             [("Content-Disposition", f"attachment; filename=search_{sanitize_name(q)}.csv")])
             return
         # HTML
-        items = []
-        for book, _, chap, ver, text in rows:
-            h = highlight_text(text, q)
-            items.append(f"<div class='res'><strong>{book} {chap}:{ver}</strong> — {h}</div>")
-        body = [
-            f"<h1>Results for “{q}”</h1>",
-            f"<div class='muted'>{len(rows)} verses</div>",
-            "\n".join(items)
-        ]
-        data = html_page(f"Export {q}", "\n".join(body))
-        self.send_response(200)
-        self.send_header("Content-Type", "text/html; charset=utf-8")
-        self.send_header("Content-Disposition", f"attachment; filename=search_{sanitize_name(q)}.html")
-        self.send_header("Content-Length", str(len(data)))
-        self.end_headers()
-        self.wfile.write(data)
+        def lines():
+            yield html_head(f"Export {q}")
+            yield f"<h1>Results for “{q}”</h1>\n<div class='muted'>{total} verses</div>\n"
+            sep = ""
+            with closing(rows):
+                for book, _, chap, ver, text in rows:
+                    yield f"{sep}<div class='res'><strong>{book} {chap}:{ver}</strong> — {highlight_text(text, q, terms)}</div>"
+                    sep = "\n"
+        self.send_stream(lines(), "text/html; charset=utf-8",
+                         [("Content-Disposition", f"attachment; filename=search_{sanitize_name(q)}.html")])
+
+    def respond_api(self, path: str, qs):
+        """JSON API for apps: /api/search, /api/strongs/<code>, /api/chapter and /api/verses.
+
+        Verses are objects with API_FIELDS, or arrays in that order with
+        compact=1 (the field names are then sent once as "fields"). Search
+        pages are keyset-paged: pass the returned "next" verse id as
+        `after` to get the following page.
+        """
+        compact = (qs.get("compact", [""])[0] or "") in ("1", "true")
+        try:
+            after = max(0, int(qs.get("after", ["0"])[0] or 0))
+            limit = min(API_MAX_LIMIT, max(1, int(qs.get("limit", ["50"])[0] or 50)))
+        except ValueError:
+            self.send_error(400, "after and limit must be integers")
+            return
+        if path == "/api/chapter":
+            self.respond_api_chapter(qs, compact)
+            return
+        if path == "/api/verses":
+            try:
+                ids = [int(x) for x in ",".join(qs.get("ids", [])).split(",") if x.strip()]
+            except ValueError:
+                self.send_error(400, "ids must be comma-separated verse ids")
+                return
+            if not ids or len(ids) > API_MAX_LIMIT:
+                self.send_error(400, f"Pass 1 to {API_MAX_LIMIT} ids")
+                return
+            doc = {"verses": api_verses(self.app.verses_by_id(ids), compact)}
+        elif path == "/api/search" or path.startswith("/api/strongs/"):
+            if path == "/api/search":
+                q = (qs.get("q", [""])[0] or "").strip()
+            else:
+                q = path[len("/api/strongs/"):].strip().upper()
+                if not _RE_STRONGS.match(q):
+                    self.send_error(400, "Strong's code must look like H0430 or G3056")
+                    return
+            if not q:
+                self.send_error(400, "Missing q")
+                return
+            lemma = (qs.get("mode", [""])[0] or "").lower() == "lemma"
+            try:
+                kind, total, terms, rows, cursor = self.app.search_after(q, after, limit, lemma)
+            except sqlite3.OperationalError as e:
+                # Only a malformed full-text query is the client's fault; anything else is a 500
+                if not is_fts_syntax_error(e) or self.app.kind(q, lemma) != "fts":
+                    raise
+                self.send_error(400, f"Invalid full-text query: {fts_query_error(q) or 'syntax error'}")
+                return
+            doc = {"query": q, "mode": kind, "total": total}
+            if terms:
+                doc["terms"] = terms
+            doc["verses"] = api_verses(rows, compact)
+            doc["next"] = cursor
+        else:
+            self.send_error(404, "Not Found")
+            return
+        if compact:
+            doc = {"fields": list(API_FIELDS), **doc}
+        self.send_body(json_bytes(doc), "application/json; charset=utf-8")
+
+    def respond_api_chapter(self, qs, compact: bool):
+        try:
+            bid = int(qs.get("book_id", [""])[0])
+            chap = int(qs.get("chap", [""])[0])
+        except ValueError:
+            self.send_error(400, "Invalid book_id/chap")
+            return
+        maxc = self.app.max_chapter(bid)
+        if not 1 <= chap <= maxc:
+            self.send_error(404, "No such chapter")
+            return
+
+        def render():
+            rows = self.app.chapter_verses(bid, chap)
+            doc = {"book_id": bid, "book": map_book(rows[0][1]) if rows else "", "chapter": chap, "chapters": maxc,
+                   "verses": api_verses(rows, compact)}
+            return json_bytes({"fields": list(API_FIELDS), **doc} if compact else doc)
+        self.send_page(("api-chapter", bid, chap, compact), render, "application/json; charset=utf-8")
 
     def respond_html(self, title: str, body: str):
-        data = html_page(title, body)
-        self.send_response(200)
-        self.send_header("Content-Type", "text/html; charset=utf-8")
-        self.send_header("Content-Length", str(len(data)))
-        self.end_headers()
-        self.wfile.write(data)
+        self.send_body(html_page(title, body), "text/html; charset=utf-8")
 
     def redirect(self, to: str):
         self.send_response(302)
         self.send_header("Location", to)
+        self.send_header("Content-Length", "0")
         self.end_headers()
 
 
+class _LoopWriter(io.RawIOBase):
+    """wfile for a Handler running on a worker thread of AsyncServer.
+
+    Writes are handed to the event loop in order; once `high_water` bytes
+    are queued the worker waits for the transport to drain, so a slow
+    client slows its producer down instead of growing the buffer.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, writer: asyncio.StreamWriter, high_water: int = 64 * 1024):
+        self.loop = loop
+        self.writer = writer
+        self.high_water = high_water
+        self.queued = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        if self.writer.is_closing():
+            raise ConnectionResetError("client closed the connection")
+        self.loop.call_soon_threadsafe(self.writer.write, data)
+        self.queued += len(data)
+        if self.queued >= self.high_water:
+            self.queued = 0
+            asyncio.run_coroutine_threadsafe(self.writer.drain(), self.loop).result()
+        return len(data)
+
+
+class AsyncServer:
+    """asyncio front end for Handler (--async).
+
+    The event loop owns the sockets: it reads requests, keeps idle
+    connections open and answers pipelined requests in order, without a
+    thread per connection. Each request is run by the unchanged Handler
+    code on a pool of `workers` threads (so at most that many SQLite calls
+    run at once), and at most `max_pending` requests wait for a worker;
+    beyond that connections stop being read until the backlog clears.
+    """
+
+    def __init__(self, handler_class, host: str, port: int, workers: int = 8, max_pending: int = 256,
+                 keepalive_timeout: float = 15.0, max_header_bytes: int = 64 * 1024):
+        self.handler_class = handler_class
+        self.host = host
+        self.port = port
+        self.workers = max(1, int(workers))
+        self.max_pending = max(self.workers, int(max_pending))
+        self.keepalive_timeout = keepalive_timeout
+        self.max_header_bytes = max_header_bytes
+
+    def serve_forever(self) -> None:
+        asyncio.run(self._serve())
+
+    async def _serve(self) -> None:
+        self.loop = asyncio.get_running_loop()
+        self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="sqlite")
+        self.slots = asyncio.Semaphore(self.max_pending)
+        server = await asyncio.start_server(self._client, self.host, self.port, limit=self.max_header_bytes,
+                                            backlog=Server.request_queue_size)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.executor.shutdown(wait=True)
+
+    async def _client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        peer = writer.get_extra_info("peername") or ("", 0)
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self.keepalive_timeout)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                body = self._content_length(head)
+                if body:
+                    await reader.readexactly(body)  # only GET is routed; drop any request body
+                async with self.slots:
+                    handler = await self.loop.run_in_executor(self.executor, self._handle, head, peer, writer)
+                await writer.drain()  # backpressure: the next pipelined request waits for this response to leave
+                if handler.close_connection:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+    @staticmethod
+    def _content_length(head: bytes) -> int:
+        for line in head.split(b"\r\n")[1:]:
+            name, _, value = line.partition(b":")
+            if name.strip().lower() == b"content-length":
+                try:
+                    return max(0, int(value.strip()))
+                except ValueError:
+                    return 0
+        return 0
+
+    def _handle(self, head: bytes, peer, writer: asyncio.StreamWriter):
+        # Runs on a worker thread: drive BaseHTTPRequestHandler's own parsing and routing over the buffered request
+        handler = self.handler_class.__new__(self.handler_class)
+        handler.client_address = peer[:2]
+        handler.server = self
+        handler.request = None
+        handler.rfile = io.BytesIO(head)
+        handler.wfile = _LoopWriter(self.loop, writer)
+        handler.close_connection = True
+        try:
+            handler.handle_one_request()
+        except (BrokenPipeError, ConnectionResetError):
+            handler.close_connection = True
+        return handler
+
+
 def sanitize_name(s: str) -> str:
     return re.sub(r"[^A-Za-z0-9_\-]+", "_", s).strip("._") or "export"
 
@@ -538,14 +1872,28 @@ def main():
     ap.add_argument("--host", default="127.0.0.1", help="Listen host (default 127.0.0.1)")
     ap.add_argument("--port", type=int, default=8000, help="Listen port (default 8000)")
     ap.add_argument("--logo", help="Path to a logo image (jpg/png) to show in header")
+    ap.add_argument("--pool-size", type=int, default=8, help="Read-only SQLite connections shared by request threads (default 8)")
+    ap.add_argument("--mmap-size", type=int, default=256 * 1024 * 1024, help="PRAGMA mmap_size per connection, in bytes (default 256 MiB)")
+    ap.add_argument("--cache-size", type=int, default=-16384, help="PRAGMA cache_size per connection; negative = KiB (default -16384, i.e. 16 MiB)")
+    ap.add_argument("--immutable", action="store_true", help="Open the DB with immutable=1 (no locking; only if it is never rebuilt while serving)")
+    ap.add_argument("--cache-entries", type=int, default=512, help="Search result pages kept in the LRU cache (0 disables; default 512)")
+    ap.add_argument("--cache-mb", type=float, default=32, help="Approximate memory bound of the result cache in MB (default 32)")
+    ap.add_argument("--page-cache-mb", type=float, default=64, help="Memory bound for pre-rendered /books and /chapter pages incl. compressed copies (0 disables; default 64)")
+    ap.add_argument("--warm-pages", action="store_true", help="Pre-render and compress /books and all chapters in the background at startup")
+    ap.add_argument("--slow-query-ms", type=float, default=250, help="Print connection checkouts slower than this to stderr with their SQL (0 disables; default 250)")
+    ap.add_argument("--no-query-only", action="store_true", help="Do not set PRAGMA query_only on the pooled connections")
+    ap.add_argument("--async", dest="use_async", action="store_true", help="Serve with the asyncio front end (keep-alive and pipelining without a thread per connection)")
+    ap.add_argument("--workers", type=int, default=0, help="With --async: threads running handlers/SQLite (default: --pool-size)")
+    ap.add_argument("--max-pending", type=int, default=256, help="With --async: requests queued for a worker before reads pause (default 256)")
+    ap.add_argument("--keepalive-timeout", type=float, default=15.0, help="Seconds an idle keep-alive connection is kept open, in both server modes (default 15)")
     args = ap.parse_args()
 
     if not os.path.exists(args.db):
         raise SystemExit(f"Database not found: {args.db}. Build it first with: python scripts/build_concordance.py build")
 
-    # Optional logo as data URI so no static route is needed
+    # Optional logo served from /logo?v=<hash> so browsers can cache it for good
     # If --logo not provided, try the static site copy relative to this file
-    logo_data_uri = None
+    logo = None
     try:
         if args.logo:
             candidate = args.logo
@@ -554,10 +1902,10 @@ def main():
             candidate = os.path.abspath(os.path.join(here, "..", "site", "images", "albanian-concordance-image.jpg"))
         if candidate and os.path.exists(candidate):
             with open(candidate, "rb") as f:
-                b64 = base64.b64encode(f.read()).decode("ascii")
+                raw = f.read()
             ext = os.path.splitext(candidate)[1].lower()
             mime = "image/jpeg" if ext in (".jpg", ".jpeg") else ("image/png" if ext == ".png" else "application/octet-stream")
-            logo_data_uri = f"data:{mime};base64,{b64}"
+            logo = (raw, mime, hashlib.sha1(raw).hexdigest()[:12])
             try:
                 print(f"Loaded hero image: {candidate}")
             except Exception:
@@ -567,18 +1915,51 @@ def main():
             print(f"Hero image load error: {e}")
         except Exception:
             pass
-        logo_data_uri = None
+        logo = None
 
-    Handler.app = App(args.db)
-    Handler.logo_data_uri = logo_data_uri
-    httpd = ThreadingHTTPServer((args.host, args.port), Handler)
-    print(f"Serving on http://{args.host}:{args.port} (Ctrl+C to stop)")
+    Handler.app = App(
+        args.db,
+        pool_size=args.pool_size,
+        mmap_size=args.mmap_size,
+        cache_size=args.cache_size,
+        query_only=not args.no_query_only,
+        immutable=args.immutable,
+        cache_entries=args.cache_entries,
+        cache_bytes=int(args.cache_mb * 1024 * 1024),
+        page_bytes=int(args.page_cache_mb * 1024 * 1024),
+        slow_query_seconds=args.slow_query_ms / 1000,
+    )
+    if args.warm_pages and Handler.app.pages.max_bytes <= 0:
+        print("--warm-pages ignored: the page cache is off (--page-cache-mb 0)")
+    elif args.warm_pages:
+        def warm():
+            t = time.perf_counter()
+            n = Handler.app.warm_pages()
+            print(f"Page cache warmed: {n} pages, ~{Handler.app.pages.bytes // 1024} KiB in {time.perf_counter() - t:.1f}s")
+        threading.Thread(target=warm, name="warm-pages", daemon=True).start()
+    Handler.logo = logo
+    # Threaded mode: a socket timeout closes an idle keep-alive connection and frees its thread
+    Handler.timeout = args.keepalive_timeout if args.keepalive_timeout > 0 else None
+    if args.use_async:
+        httpd = AsyncServer(Handler, args.host, args.port, workers=args.workers or args.pool_size,
+                            max_pending=args.max_pending, keepalive_timeout=args.keepalive_timeout)
+        mode = f"asyncio, {httpd.workers} workers"
+    else:
+        httpd = Server((args.host, args.port), Handler)
+        mode = "threaded"
+    print(f"Serving on http://{args.host}:{args.port} ({mode}) with {args.pool_size} read-only connections (Ctrl+C to stop)")
     try:
         httpd.serve_forever()
     except KeyboardInterrupt:
         pass
     finally:
-        httpd.server_close()
+        if not args.use_async:
+            httpd.server_close()
+        Handler.app.pool.close()
+        stats = Handler.app.cache.stats()
+        pages = Handler.app.pages.stats()
+        print(f"Page cache: {pages['hits']} hits, {pages['misses']} misses, {pages['entries']} pages (~{pages['bytes'] // 1024} KiB)")
+        print(f"Result cache: {stats['hits']} hits, {stats['misses']} misses, {stats['entries']} entries (~{stats['bytes'] // 1024} KiB)")
 
 
 if __name__ == "__main__":
@@ -12,7 +12,7 @@ function sanitizeVerseText(s){
     return cleanText(s);
   }
 }
-const state = { books: null, verses: null, cache: {}, chaptersByBook: null, searchInterlinearOn: false, lastRefs: null, lastQuery: '', lastMode: 'sq', vidMap: null, maxChByBook: null, strongs: { H:null, G:null } };
+const state = { books: null, verses: null, versesLoaded: false, verseManifest: null, manifestPromise: null, verseShards: {}, indexManifests: {}, siteManifestPromise: null, renderSeq: 0, cache: {}, chaptersByBook: null, searchInterlinearOn: false, lastRefs: null, lastQuery: '', lastMode: 'sq', maxChByBook: null, strongs: { H:null, G:null } };
 
 function normalizeToken(s) {
   return (s || '')
@@ -21,27 +21,254 @@ function normalizeToken(s) {
     .replace(/[��]/g, 'c');
 }
 
+// --- Data URLs: data/manifest.json (build_site_index.py) gives the content hash of every fixed-name data file ---
+// Those are fetched as path?v=hash and shards carry the hash in their name, so neither can change under its URL and
+// the browser may answer from its cache without asking; other paths (builds without the manifest) are revalidated
+const HASHED_FILE = /\.[0-9a-f]{10}\.(json|bin)$/;
+function loadSiteManifest() {
+  if (!state.siteManifestPromise) {
+    state.siteManifestPromise = fetch('data/manifest.json', { cache: 'no-cache' })
+      .then(res => res.ok ? res.json() : null)
+      .catch(() => null)
+      .then(m => (m && m.files) || {});
+  }
+  return state.siteManifestPromise;
+}
+
+async function fetchData(path) {
+  const files = await loadSiteManifest();
+  if (files[path]) return fetch(`${path}?v=${files[path]}`, { cache: 'force-cache' });
+  return fetch(path, { cache: HASHED_FILE.test(path) ? 'force-cache' : 'no-cache' });
+}
+
 async function loadBooks() {
   if (state.books) return state.books;
-  const res = await fetch('data/books.json');
+  const res = await fetchData('data/books.json');
   state.books = await res.json();
   return state.books;
 }
 
+// Legacy: the whole Bible in one file (site builds without data/verses/)
 async function loadVerses() {
-  if (state.verses) return state.verses;
-  const res = await fetch('data/verses.json');
+  if (state.versesLoaded) return state.verses;
+  const res = await fetchData('data/verses.json');
   state.verses = await res.json(); try { state.verses = (state.verses||[]).map(r => Array.isArray(r) && r.length>3 ? [r[0], r[1], r[2], sanitizeVerseText(r[3])] : r); } catch(e){}
+  state.versesLoaded = true;
+  return state.verses;
+}
+
+// --- Verse shards: data/verses/manifest.json maps verse-id ranges to chapter-range files ---
+// state.verses keeps its shape (index = verse_id-1, row = [book_id, chapter, verse, text]) but is filled per shard
+function loadVerseManifest() {
+  if (!state.manifestPromise) {
+    state.manifestPromise = fetchData('data/verses/manifest.json')
+      .then(res => res.ok ? res.json() : null)
+      .catch(() => null)
+      .then(m => {
+        state.verseManifest = m && Array.isArray(m.shards) ? m : null;
+        if (state.verseManifest && !state.verses) state.verses = new Array(state.verseManifest.count|0);
+        return state.verseManifest;
+      });
+  }
+  return state.manifestPromise;
+}
+
+// What browsing needs up front: the manifest, or the whole verses.json for older builds
+async function loadVerseIndex() {
+  const m = await loadVerseManifest();
+  if (!m) await loadVerses();
+  return m;
+}
+
+// Manifest entry holding a verse id (binary search on the sorted id ranges), or null
+function shardForVid(vid) {
+  const shards = state.verseManifest ? state.verseManifest.shards : [];
+  let lo = 0, hi = shards.length - 1;
+  while (lo < hi) {
+    const mid = (lo + hi + 1) >> 1;
+    if (shards[mid].first <= vid) lo = mid; else hi = mid - 1;
+  }
+  const e = shards[lo];
+  return e && e.first <= vid && vid <= e.last ? e : null;
+}
+
+function loadVerseShard(entry) {
+  if (!state.verseShards[entry.file]) {
+    state.verseShards[entry.file] = fetchData(`data/verses/${entry.file}`)
+      .then(res => { if (!res.ok) throw new Error('HTTP ' + res.status); return res.json(); })
+      .then(sh => {
+        const rows = sh.verses || [];
+        for (let i = 0; i < rows.length; i++) {
+          const r = rows[i];
+          if (r) state.verses[sh.first + i - 1] = [sh.book_id, r[0], r[1], sanitizeVerseText(r[2])];
+        }
+        return true;
+      })
+      .catch(() => { delete state.verseShards[entry.file]; return false; });  // retried on next use
+  }
+  return state.verseShards[entry.file];
+}
+
+// Make the rows of these verse ids available, fetching only the shards they fall in
+async function ensureVerses(vids) {
+  const m = await loadVerseManifest();
+  if (!m) return loadVerses();
+  const need = new Map();
+  for (const vid of vids) {
+    const e = shardForVid(vid);
+    if (e) need.set(e.file, e);
+  }
+  await Promise.all(Array.from(need.values(), loadVerseShard));
+  return state.verses;
+}
+
+function chapterShards(bid, chap) {
+  const shards = state.verseManifest ? state.verseManifest.shards : [];
+  return shards.filter(e => e.book_id === bid && e.chapters[0] <= chap && chap <= e.chapters[1]);
+}
+
+async function ensureChapterVerses(bid, chap) {
+  const m = await loadVerseManifest();
+  if (!m) return loadVerses();
+  await Promise.all(chapterShards(bid, chap).map(loadVerseShard));
   return state.verses;
 }
 
-async function loadIndexShard(letter) {
-  if (state.cache[letter]) return state.cache[letter];
-  const res = await fetch(`data/index/index_${letter}.json`);
-  if (!res.ok) return null;
-  const data = await res.json();
-  state.cache[letter] = data.tokens || {};
-  return state.cache[letter];
+// Verse ids [first, last] that can hold a chapter: its shards, or every verse without a manifest
+function chapterIdSpan(bid, chap) {
+  if (!state.verseManifest) return [1, (state.verses || []).length];
+  let first = Infinity, last = 0;
+  for (const e of chapterShards(bid, chap)) { first = Math.min(first, e.first); last = Math.max(last, e.last); }
+  return last ? [first, last] : [1, 0];
+}
+
+// Binary index shard (build_site_index.py encode_binary_index): "ACX1", u32 term count, term bytes, posting bytes,
+// u32 string offsets and posting offsets (count+1 each), UTF-8 terms in byte order, delta+varint posting lists.
+// Nothing is parsed up front: get() binary-searches the terms through a DataView and decodes one list.
+function binaryIndexShard(buf) {
+  const dv = new DataView(buf);
+  const bytes = new Uint8Array(buf);
+  if (buf.byteLength < 16 || String.fromCharCode(bytes[0], bytes[1], bytes[2], bytes[3]) !== 'ACX1') return null;
+  const n = dv.getUint32(4, true), termBytes = dv.getUint32(8, true);
+  const strOffs = 16, postOffs = strOffs + 4 * (n + 1);
+  const strBase = postOffs + 4 * (n + 1), postBase = strBase + termBytes;
+  const encoder = new TextEncoder();
+  // Byte order of term i against key (<0, 0, >0), as the builder sorted them
+  function compare(i, key) {
+    const a = strBase + dv.getUint32(strOffs + 4 * i, true), len = strBase + dv.getUint32(strOffs + 4 * i + 4, true) - a;
+    for (let k = 0; k < len && k < key.length; k++) {
+      const d = bytes[a + k] - key[k];
+      if (d) return d;
+    }
+    return len - key.length;
+  }
+  return {
+    // Every term of the shard, in order (for partial matching; get() is the fast path)
+    terms() {
+      const decoder = new TextDecoder(), out = [];
+      for (let i = 0; i < n; i++) {
+        const a = strBase + dv.getUint32(strOffs + 4 * i, true), b = strBase + dv.getUint32(strOffs + 4 * i + 4, true);
+        out.push(decoder.decode(bytes.subarray(a, b)));
+      }
+      return out;
+    },
+    get(term) {
+      const key = encoder.encode(term);
+      let lo = 0, hi = n - 1;
+      while (lo <= hi) {
+        const mid = (lo + hi) >> 1, c = compare(mid, key);
+        if (c < 0) lo = mid + 1;
+        else if (c > 0) hi = mid - 1;
+        else {
+          const out = [];
+          let p = postBase + dv.getUint32(postOffs + 4 * mid, true);
+          const end = postBase + dv.getUint32(postOffs + 4 * mid + 4, true);
+          let prev = 0;
+          while (p < end) {
+            let delta = 0, shift = 0, b;
+            do { b = bytes[p++]; delta |= (b & 0x7f) << shift; shift += 7; } while (b & 0x80);
+            prev += delta;
+            out.push(prev);
+          }
+          return out;
+        }
+      }
+      return undefined;
+    },
+  };
+}
+
+// One index file of a manifest entry (its hashed "bin"/"json" names, else data/<dir>/<file>.bin or .json),
+// trying the formats in order
+async function loadIndexFile(dir, entry, formats) {
+  const path = `data/${dir}/${entry.file}`;
+  const url = (ext) => entry[ext] ? `data/${dir}/${entry[ext]}` : `${path}.${ext}`;
+  if (state.cache[path]) return state.cache[path];
+  let shard = null;
+  if (formats.includes('bin')) {
+    const bin = await fetchData(url('bin')).catch(() => null);
+    if (bin && bin.ok) shard = binaryIndexShard(await bin.arrayBuffer());
+  }
+  if (!shard && formats.includes('json')) {
+    const res = await fetchData(url('json')).catch(() => null);
+    if (!res || !res.ok) return null;
+    const tokens = (await res.json()).tokens || {};
+    shard = {
+      terms: () => Object.keys(tokens),
+      get: (term) => Object.prototype.hasOwnProperty.call(tokens, term) ? tokens[term] : undefined,
+    };
+  }
+  if (shard) state.cache[path] = shard;
+  return shard;
+}
+
+// data/<dir>/manifest.json: shards over sorted term ranges of about equal size (null for first-letter builds)
+function loadIndexManifest(dir) {
+  if (!state.indexManifests[dir]) {
+    state.indexManifests[dir] = fetchData(`data/${dir}/manifest.json`)
+      .then(res => res.ok ? res.json() : null)
+      .catch(() => null)
+      .then(m => m && Array.isArray(m.shards) && m.shards.length ? m : null);
+  }
+  return state.indexManifests[dir];
+}
+
+// The shard that can hold a normalized word: binary search for the last range starting at or before it
+async function loadIndexShard(norm, dir = 'index') {
+  const m = await loadIndexManifest(dir);
+  if (!m) return dir === 'index' ? loadIndexFile(dir, { file: `index_${norm[0] || 'a'}` }, ['bin', 'json']) : null;
+  const shards = m.shards;
+  let lo = 0, hi = shards.length - 1;
+  while (lo < hi) {
+    const mid = (lo + hi + 1) >> 1;
+    if (shards[mid].first <= norm) lo = mid; else hi = mid - 1;
+  }
+  return loadIndexFile(dir, shards[lo], m.formats || ['bin']);
+}
+
+// Verse ids of any of the keys in an original-language index (index_heb / index_grc), or null if the build has none
+async function lookupSourceIndex(dir, keys) {
+  if (!await loadIndexManifest(dir)) return null;
+  const ids = new Set();
+  for (const key of keys) {
+    const shard = key ? await loadIndexShard(key, dir) : null;
+    for (const vid of (shard && shard.get(key)) || []) ids.add(vid);
+  }
+  return Array.from(ids).sort((a, b) => a - b);
+}
+
+// Verse ids of every term of an index matching a predicate: fetches all its shards, still far less than every chapter
+async function scanSourceIndex(dir, predicate, onProgress) {
+  const m = await loadIndexManifest(dir);
+  if (!m) return null;
+  const ids = new Set();
+  let done = 0;
+  await Promise.all(m.shards.map(async (e) => {
+    const shard = await loadIndexFile(dir, e, m.formats || ['bin']);
+    if (shard) for (const term of shard.terms()) if (predicate(term)) for (const vid of shard.get(term) || []) ids.add(vid);
+    if (onProgress) try { onProgress({ scanned: ++done, total: m.shards.length, found: ids.size }); } catch(e) {}
+  }));
+  return Array.from(ids).sort((a, b) => a - b);
 }
 
 function highlightText(text, query) {
@@ -103,26 +330,30 @@ function greekRemoveDiacritics(s){
   return s.replace(/\s+/g,' ').trim();
 }
 
+// Key of a Greek word in data/index_grc (build_site_index.py greek_key): no diacritics, lower case, one sigma
+function grcKey(s){ return greekRemoveDiacritics(s).toLowerCase().replace(/\u03C2/g, '\u03C3'); }
+
 function isHebrewString(s){ return /[\u0590-\u05FF]/.test(String(s||'')); }
 function isGreekString(s){ return /[\u0370-\u03FF]/.test(String(s||'')); }
 
-// Build verse-id map and max chapter per book lazily (Interface Segregation: small APIs)
-function ensureVidMap(){
-  if (state.vidMap && state.maxChByBook) return;
-  const verses = state.verses||[];
-  const vm = new Map();
+// Max chapter per book, from the shard manifest (or the loaded verses) (Interface Segregation: small APIs)
+function ensureChapterCounts(){
+  if (state.maxChByBook) return;
+  const chapters = buildChaptersByBook();
   const maxBy = {};
-  for (let i=0; i<verses.length; i++){
-    const row = verses[i]; if (!row) continue; // holes possible
-    const bid = row[0]|0, chap=row[1]|0, ver=row[2]|0;
-    const key = `${bid}|${chap}|${ver}`;
-    vm.set(key, i+1);
-    if (!maxBy[bid] || chap>maxBy[bid]) maxBy[bid] = chap;
-  }
-  state.vidMap = vm;
+  for (const bid of Object.keys(chapters)){
+    const list = chapters[bid];
+    if (list.length) maxBy[bid] = list[list.length-1];
+  }
   state.maxChByBook = maxBy;
 }
 
+// Verse id of book/chapter/verse, loading that chapter's shard if needed
+async function verseIdOf(bid, chap, ver){
+  await ensureChapterVerses(bid, chap);
+  return findVerseId(bid, chap, ver);
+}
+
 // List chapter JSONs for Hebrew (OT) or Greek (NT) books (Dependency Inversion: depend on global BOOK_SLUGS_BY_ID)
 function listChapterPaths(lang){
   const paths = [];
@@ -140,7 +371,7 @@ function listChapterPaths(lang){
 }
 
 async function fetchJSON(path){
-  const res = await fetch(path, { cache:'no-store' });
+  const res = await fetchData(path);
   if (!res.ok) throw new Error('HTTP '+res.status);
   return res.json();
 }
@@ -172,12 +403,11 @@ async function scanChapters(paths, predicate, limit, onProgress){
         const verses = ch && ch.verses || [];
         for (const v of verses){
           const vnum = v.v|0;
-          const key = `${my.bid}|${my.chap}|${vnum}`;
           let match = false;
           const src = v.src || [];
           for (let t of src){ if (predicate(t)){ match = true; break; } }
           if (match){
-            const vid = state.vidMap.get(key);
+            const vid = await verseIdOf(my.bid, my.chap, vnum);
             if (vid && !seen.has(vid)){
               seen.add(vid); results.push(vid);
               if (results.length >= max) break;
@@ -221,7 +451,7 @@ function ensureResultsInterlinearToggle(){
   }
 }
 
-function renderResults(q, refs) {
+function renderResults(q, refs, shown) {
   // make sure toggle exists even if added late
   try { ensureResultsInterlinearToggle(); } catch(e){}
   const el = document.getElementById('results');
@@ -233,7 +463,8 @@ function renderResults(q, refs) {
   const books = state.books || [];
   const verses = state.verses || [];
   const parts = [`<div class="muted">${refs.length} vargje</div>`];
-  for (const vid of refs) {
+  const visible = shown === undefined ? refs : refs.slice(0, shown);
+  for (const vid of visible) {
     const row = verses[vid - 1];
     if (!row) continue;
     const [bid, chap, ver, text] = row;
@@ -248,33 +479,48 @@ function renderResults(q, refs) {
   state.lastRefs = refs.slice(0);
   state.lastQuery = q;
   if (state.searchInterlinearOn) {
-    mountInterlinearForResults(refs);
+    mountInterlinearForResults(visible);
   }
 }
 
+// Show hits as their verse shards arrive: the first RESULTS_FIRST_BATCH after a few small fetches, then the rest
+const RESULTS_FIRST_BATCH = 50;
+async function showResults(q, refs) {
+  const ticket = ++state.renderSeq;
+  const loadedPrefix = () => { let n = 0; while (n < refs.length && state.verses && state.verses[refs[n] - 1]) n++; return n; };
+  await ensureVerses(refs.slice(0, RESULTS_FIRST_BATCH));
+  if (ticket !== state.renderSeq) return;  // a newer search took over
+  const first = loadedPrefix();
+  showStatus(first < refs.length ? 'Po ngarkon vargjet...' : '');
+  renderResults(q, refs, first);
+  if (first >= refs.length) return;
+  await ensureVerses(refs.slice(first));
+  if (ticket !== state.renderSeq) return;
+  showStatus('');
+  renderResults(q, refs);
+}
+
 async function runSearch(q) {
   q = (q || '').trim();
   if (!q) return;
   showStatus('Po ngarkon indeksin...');
   const norm = normalizeToken(q);
-  const letter = norm[0] || 'a';
-  const shard = await loadIndexShard(letter);
+  const shard = await loadIndexShard(norm, 'index');
   if (!shard) {
     showStatus('Indeksi nuk u gjet.');
     return;
   }
-  const refs = shard[norm] || [];
+  const refs = shard.get(norm) || [];
   showStatus('Po ngarkon vargjet...');
-  await Promise.all([loadBooks(), loadVerses()]);
-  showStatus('');
-  renderResults(q, refs);
+  await loadBooks();
+  await showResults(q, refs);
 }
 
 // --- Hebrew/Greek search orchestrators (Open/Closed: new modes without changing core render) ---
 async function runSearchHeb(q){
   const s = String(q||'').trim(); if (!s) return;
   showStatus('Po p&euml;rpunon (Hebraisht)...');
-  await Promise.all([loadBooks(), loadVerses()]); ensureVidMap();
+  await Promise.all([loadBooks(), loadVerseIndex()]); ensureChapterCounts();
   const codeM = s.match(/^(?:H)?(\d{4})$/i);
   const isHeb = isHebrewString(s);
   const needle = isHeb ? hebrewConsonantsOnly(s) : s.toLowerCase();
@@ -284,12 +530,24 @@ async function runSearchHeb(q){
     try {
       const idx = await loadStrongs('H');
       const refs = (idx && idx[code]) ? idx[code] : [];
-      showStatus(''); state.lastMode='heb';
-      return renderResults(q, refs);
+      state.lastMode='heb';
+      return showResults(q, refs);
     } catch(e){}
   }
-  const paths = listChapterPaths('heb');
   const variants = isHeb ? hebrewVariants(needle) : [needle];
+  // Prebuilt index first (forms with and without prefixes, transliterations, codes); chapter scans only for builds without it
+  const keys = codeM ? ['H' + codeM[1]] : (isHeb ? hebrewVariants(needle.replace(/\//g, '')) : [needle.replace(/\//g, '')]);
+  let indexed = await lookupSourceIndex('index_heb', keys);
+  if (indexed && !indexed.length && isHeb && needle.length >= 2){
+    const parts = hebrewVariants(needle.replace(/\//g, ''));
+    indexed = await scanSourceIndex('index_heb', (term)=>parts.some(v => term.includes(v)),
+      (p)=>showStatus(`Heb. (pjesore): ${p.found} rezultate – indeksi ${p.scanned}/${p.total}`));
+  }
+  if (indexed){
+    state.lastMode = 'heb';
+    return showResults(q, indexed);
+  }
+  const paths = listChapterPaths('heb');
   const exactPred = (tok)=>{
     if (!tok) return false;
     if (codeM) return String(tok.s||'').toUpperCase() === ('H'+codeM[1]);
@@ -311,14 +569,14 @@ async function runSearchHeb(q){
     };
     refs = await scanChapters(paths, containsPred, 300, (p)=>showStatus(`Heb. (pjesore): ${p.found} rezultate – kapituj ${p.scanned}/${p.total}`));
   }
-  showStatus(''); state.lastMode = 'heb';
-  renderResults(q, refs||[]);
+  state.lastMode = 'heb';
+  await showResults(q, refs||[]);
 }
 
 async function runSearchGrc(q){
   const s = String(q||'').trim(); if (!s) return;
   showStatus('Po p&euml;rpunon (Greqisht)...');
-  await Promise.all([loadBooks(), loadVerses()]); ensureVidMap();
+  await Promise.all([loadBooks(), loadVerseIndex()]); ensureChapterCounts();
   const codeM = s.match(/^(?:G)?(\d{4})$/i);
   const isGr = isGreekString(s);
   const needle = isGr ? greekRemoveDiacritics(s).toLowerCase() : s.toLowerCase();
@@ -328,10 +586,16 @@ async function runSearchGrc(q){
     try {
       const idx = await loadStrongs('G');
       const refs = (idx && idx[code]) ? idx[code] : [];
-      showStatus(''); state.lastMode='grc';
-      return renderResults(q, refs);
+      state.lastMode='grc';
+      return showResults(q, refs);
     } catch(e){}
   }
+  const key = codeM ? 'G' + codeM[1] : (isGr ? grcKey(s) : needle).replace(/\//g, '');
+  const indexed = await lookupSourceIndex('index_grc', [key]);
+  if (indexed){
+    state.lastMode = 'grc';
+    return showResults(q, indexed);
+  }
   const pred = (tok)=>{
     const sc = String(tok.s||'').toUpperCase();
     if (codeM) return sc === ('G'+codeM[1]);
@@ -340,8 +604,8 @@ async function runSearchGrc(q){
   };
   const paths = listChapterPaths('grc');
   const refs = await scanChapters(paths, pred, 300, (p)=>showStatus(`Greq.: ${p.found} rezultate – kapituj ${p.scanned}/${p.total}`));
-  showStatus(''); state.lastMode = 'grc';
-  renderResults(q, refs);
+  state.lastMode = 'grc';
+  await showResults(q, refs);
 }
 
 function currentResultsHTML() {
@@ -507,13 +771,19 @@ window.addEventListener('DOMContentLoaded', setupUI);
 // ----- Browse: Books -> Chapters -> Verses -----
 function buildChaptersByBook() {
   if (state.chaptersByBook) return state.chaptersByBook;
-  const verses = state.verses || [];
   const map = {};
-  for (const row of verses) {
-    if (!row) continue;
-    const bid = row[0], chap = row[1];
-    if (!map[bid]) map[bid] = new Set();
-    map[bid].add(chap);
+  if (state.verseManifest) {
+    for (const e of state.verseManifest.shards) {
+      if (!map[e.book_id]) map[e.book_id] = new Set();
+      for (let c = e.chapters[0]; c <= e.chapters[1]; c++) map[e.book_id].add(c);
+    }
+  } else {
+    for (const row of state.verses || []) {
+      if (!row) continue;
+      const bid = row[0], chap = row[1];
+      if (!map[bid]) map[bid] = new Set();
+      map[bid].add(chap);
+    }
   }
   const out = {};
   for (const k of Object.keys(map)) out[k] = Array.from(map[k]).sort((a, b) => a - b);
@@ -522,7 +792,7 @@ function buildChaptersByBook() {
 }
 
 async function showBooks() {
-  await Promise.all([loadBooks(), loadVerses()]);
+  await Promise.all([loadBooks(), loadVerseIndex()]);
   const chaptersMap = buildChaptersByBook();
   const books = state.books || [];
   const container = document.getElementById('browse-books');
@@ -576,12 +846,14 @@ function showChapters(bid) {
   });
 }
 
-function showChapterVerses(bid, chap) {
+async function showChapterVerses(bid, chap) {
+  await ensureChapterVerses(bid, chap);
   const books = state.books || [];
   const verses = state.verses || [];
   const versesEl = document.getElementById('browse-verses');
   const items = [];
-  for (let i = 0; i < verses.length; i++) {
+  const [lo, hi] = chapterIdSpan(bid, chap);
+  for (let i = lo - 1; i < hi; i++) {
     const row = verses[i];
     if (!row) continue;
     const [b, c, v, text] = row;
@@ -604,7 +876,7 @@ function showChapterVerses(bid, chap) {
           const slug = BOOK_SLUGS_BY_ID[bidVal] || '';
           if (!slug || !chapVal || !vVal) return;
           const path = `data/${slug}/${chapVal}.json`;
-          const res = await fetch(path, { cache: 'no-store' });
+          const res = await fetchData(path);
           if (!res.ok) return;
           const data = await res.json();
           const isHeb = !!(data && data._meta && String(data._meta.lang_src||'').toLowerCase().startsWith('heb'));
@@ -719,9 +991,11 @@ function parseRef(s){
   return { book: m[1], chap: Number(m[2]), verse: m[3] ? Number(m[3]) : null };
 }
 
+// Id of a verse whose chapter is loaded (see ensureChapterVerses)
 function findVerseId(bid, chap, verse){
   const verses = state.verses || [];
-  for (let i=0;i<verses.length;i++){
+  const [lo, hi] = chapterIdSpan(bid, chap);
+  for (let i=lo-1;i<hi;i++){
     const r = verses[i];
     if (r && r[0]===bid && r[1]===chap && r[2]===verse){ return i+1; } // id is index+1
   }
@@ -729,7 +1003,7 @@ function findVerseId(bid, chap, verse){
 }
 
 async function findAndRenderReference(input){
-  await Promise.all([loadBooks(), loadVerses()]);
+  await Promise.all([loadBooks(), loadVerseIndex()]);
   const parsed = parseRef(input);
   if (!parsed){ showStatus('Formati: Libri Kapitulli:Vargu (p.sh., Isaia 6:1)'); return; }
   const idx = buildBookIndex();
@@ -741,7 +1015,7 @@ async function findAndRenderReference(input){
     showChapterVerses(bid, parsed.chap);
     return;
   }
-  const vid = findVerseId(bid, parsed.chap, parsed.verse);
+  const vid = await verseIdOf(bid, parsed.chap, parsed.verse);
   if (!vid){ showStatus('Vargu nuk u gjet.'); return; }
   showStatus('');
   renderResults('', [vid]);
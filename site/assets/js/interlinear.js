@@ -16,8 +16,9 @@
 
   const __ilChapterCache = new Map();
 
+  // Through the site manifest (app.js fetchData) when the page has it, so chapters come from cache between rebuilds
   async function fetchJSON(path){
-    const res = await fetch(path, {cache:'no-store'});
+    const res = await (typeof window.fetchData === 'function' ? window.fetchData(path) : fetch(path, {cache:'no-cache'}));
     if (!res.ok) throw new Error('Failed to load ' + path);
     return res.json();
   }